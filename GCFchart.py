@@ -13,21 +13,32 @@ Streamlit 기반 AI 진단 엔진 + KPI 대시보드 + AI 컨설턴트
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import numpy as np
 from datetime import datetime
 
+from gfc_core import (
+    CORPORATE_QUESTIONS as CORP,
+    KEYMAN_QUESTIONS as KEYMAN,
+    LEGACY_AWARENESS_QUESTIONS as AWARENESS,
+    LEGACY_POOLED_SCHEMA,
+    RESPONSE_OPTIONS as RESP_OPTIONS,
+    SCENARIO_QUESTIONS as SCENARIOS,
+    calculate_all_scores,
+    font_face_css,
+    generate_consultation_script,
+    get_priority_items,
+    get_recommended_solutions,
+    get_risk_level as risk_level,
+)
+
 # ═══════════════════════════════════════════════════════════
 # DARK THEME CSS (통합 버전)
 # ═══════════════════════════════════════════════════════════
 DARK_CSS = """
 <style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700;800&display=swap');
-
 .stApp { 
     background: #0f1623 !important; 
     color: #cbd5e1 !important; 
-    font-family: 'Noto Sans KR', sans-serif !important; 
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif !important; 
 }
 
 .main .block-container { 
@@ -417,91 +428,9 @@ button[data-testid="tab-btn"][aria-selected="true"] {
 </style>
 """
 
-# ═══════════════════════════════════════════════════════════
-# DATA DEFINITIONS
-# ═══════════════════════════════════════════════════════════
-# Ⅱ. Key-Man Risk
-KEYMAN = [
-    ("대표자 유고 시 의사결정 공백이 발생할 수 있다", 4),
-    ("회사 주요 거래·의사결정이 대표자 개인에게 집중되어 있다", 5),
-    ("대표자가 개인 보증을 서고 있다", 4),
-    ("대표자 개인 재무와 법인 재무가 명확히 분리되어 있지 않다", 3),
-    ("가업 승계 또는 지분 이전 계획이 명확하지 않다", 5),
-    ("대표자 건강·사고 리스크에 대한 대비가 충분하지 않다", 5),
-]
-
-# Ⅲ. Corporate Risk
-CORP = [
-    ("매출이 특정 거래처에 과도하게 집중되어 있다", 4),
-    ("핵심 인력 이탈 시 업무 공백이 크다", 4),
-    ("설비·투자 회수 구조가 장기적이거나 불확실하다", 3),
-    ("현금흐름 변동성이 크다", 4),
-    ("외부 환경 변화(환율·정책·시장)에 취약하다", 3),
-    ("예상치 못한 사고 발생 시 즉각 대응 체계가 부족하다", 5),
-]
-
-# 응답 옵션 → 리스크 점수 매핑
-RESP_OPTIONS = ["예", "일부 해당", "아니오"]
-RESP_SCORE = {"예": 1.0, "일부 해당": 0.5, "아니오": 0.0}
-
-# Ⅳ. 리스크 구조 인식
-AWARENESS = [
-    ("대표자 리스크가 곧바로 법인 리스크로 이어질 수 있다", 
-     ["그렇다", "보통", "아니다"], 
-     {"그렇다": 0.0, "보통": 0.5, "아니다": 1.0}, 3),
-    ("단일 사고 발생 시 회사가 버틸 수 있는 기간을 알고 있다", 
-     ["예", "아니오"], 
-     {"예": 0.0, "아니오": 1.0}, 4),
-    ("리스크 발생 시 대응 순서와 책임자가 정리되어 있다", 
-     ["예", "아니오"], 
-     {"예": 0.0, "아니오": 1.0}, 4),
-]
-
-# Ⅴ. 시나리오
-SCENARIOS = [
-    ("대표자가 6개월 이상 경영에서 이탈할 경우",
-     ["큰 영향 없음", "부분적 영향", "경영 전반에 중대한 영향"],
-     {"큰 영향 없음": 0.0, "부분적 영향": 0.5, "경영 전반에 중대한 영향": 1.0}, 5),
-    ("핵심 인력 1~2명이 동시에 이탈할 경우",
-     ["대응 가능", "일부 차질", "심각한 차질"],
-     {"대응 가능": 0.0, "일부 차질": 0.5, "심각한 차질": 1.0}, 4),
-    ("대규모 투자 또는 외부 충격 발생 시",
-     ["내부 대응 가능", "단기 대응 필요", "구조적 대응 필요"],
-     {"내부 대응 가능": 0.0, "단기 대응 필요": 0.5, "구조적 대응 필요": 1.0}, 4),
-]
-
-# 솔루션 매핑
-SOLUTIONS = [
-    {"name": "대표자 리스크 관리", "icon": "👔", "color": "#9333ea",
-     "desc": "CEO Plan · Key-Man 보험 등을 통해 대표자 유고·부적격 시 경영 연속성을 보장합니다.",
-     "trigger": "keyman"},
-    {"name": "종업원 단체보험", "icon": "👨‍👩‍👧‍👦", "color": "#ea580c",
-     "desc": "핵심 인력 이탈·재해 시 기업 운영 안정을 위한 단체보험 설계.",
-     "trigger": "corp"},
-    {"name": "가업승계 컨설팅", "icon": "🏢", "color": "#ca8a04",
-     "desc": "지분 이전·상속·증여를 체계적으로 구조화하여 세금 부담을 최소화합니다.",
-     "trigger": "keyman"},
-    {"name": "법인 절세 컨설팅", "icon": "📋", "color": "#16a34a",
-     "desc": "법인·개인 재무 분리와 절세 구조를 정리하여 불필요한 세금 부담을 줄입니다.",
-     "trigger": "keyman"},
-    {"name": "현금흐름 & 위기대응", "icon": "📊", "color": "#0891b2",
-     "desc": "현금흐름 변동성 대비와 단일 사고 대응 구조를 체계적으로 설계합니다.",
-     "trigger": "corp"},
-    {"name": "종합 재무컨설팅", "icon": "📈", "color": "#2563eb",
-     "desc": "전체 리스크를 종합적으로 평가하여 최적의 구조 설계와 실행 계획을 제안합니다.",
-     "trigger": "all"},
-]
-
 # ═══════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════
-def risk_level(pct):
-    """pct = 리스크율(0~100). 높을수록 위험."""
-    if pct <= 20: return "양호", "#22c55e"
-    if pct <= 45: return "주의", "#ca8a04"
-    if pct <= 70: return "경계", "#ea580c"
-    return "위험", "#dc2626"
-
 def weight_color(w):
     return ["#64748b", "#64748b", "#3b82f6", "#ca8a04", "#ea580c", "#dc2626"][w]
 
@@ -513,60 +442,8 @@ def calc_scores(km_answers, cr_answers, aw_answers, sc_answers):
     Returns dict with all KPIs.
     각 섹션별 가중평균 리스크율(0-100)과 전체 종합 리스크율을 계산.
     """
-    # Keyman
-    km_wt, km_wd = 0, 0.0
-    km_items = []
-    for i, (txt, w) in enumerate(KEYMAN):
-        km_wt += w
-        score = RESP_SCORE.get(km_answers[i], 0.0)
-        km_wd += score * w
-        km_items.append({"text": txt, "w": w, "score": score, "section": "대표자 리스크"})
-    km_pct = (km_wd / km_wt * 100) if km_wt else 0
-
-    # Corporate
-    cr_wt, cr_wd = 0, 0.0
-    cr_items = []
-    for i, (txt, w) in enumerate(CORP):
-        cr_wt += w
-        score = RESP_SCORE.get(cr_answers[i], 0.0)
-        cr_wd += score * w
-        cr_items.append({"text": txt, "w": w, "score": score, "section": "법인 경영 리스크"})
-    cr_pct = (cr_wd / cr_wt * 100) if cr_wt else 0
-
-    # Awareness
-    aw_wt, aw_wd = 0, 0.0
-    aw_items = []
-    for i, (txt, opts, smap, w) in enumerate(AWARENESS):
-        aw_wt += w
-        score = smap.get(aw_answers[i], 0.0)
-        aw_wd += score * w
-        aw_items.append({"text": txt, "w": w, "score": score, "section": "리스크 인식"})
-    aw_pct = (aw_wd / aw_wt * 100) if aw_wt else 0
-
-    # Scenario
-    sc_wt, sc_wd = 0, 0.0
-    sc_items = []
-    for i, (txt, opts, smap, w) in enumerate(SCENARIOS):
-        sc_wt += w
-        score = smap.get(sc_answers[i], 0.0)
-        sc_wd += score * w
-        sc_items.append({"text": txt, "w": w, "score": score, "section": "시나리오"})
-    sc_pct = (sc_wd / sc_wt * 100) if sc_wt else 0
-
-    # 종합 (가중평균)
-    total_wt = km_wt + cr_wt + aw_wt + sc_wt
-    total_wd = km_wd + cr_wd + aw_wd + sc_wd
-    total_pct = (total_wd / total_wt * 100) if total_wt else 0
-
-    all_items = km_items + cr_items + aw_items + sc_items
-
-    return {
-        "km_pct": km_pct, "cr_pct": cr_pct, "aw_pct": aw_pct, "sc_pct": sc_pct,
-        "total_pct": total_pct,
-        "km_wt": km_wt, "cr_wt": cr_wt, "aw_wt": aw_wt, "sc_wt": sc_wt,
-        "total_wt": total_wt,
-        "all_items": all_items,
-    }
+    return calculate_all_scores(km_answers, cr_answers, aw_answers, sc_answers,
+                                schema=LEGACY_POOLED_SCHEMA)
 
 # ═══════════════════════════════════════════════════════════
 # PLOTLY CHARTS (Dark Theme + 개선된 레이더)
@@ -580,6 +457,8 @@ PLOT_LAYOUT = dict(
 
 def fig_gauge(pct):
     """종합 리스크율 게이지"""
+    import plotly.graph_objects as go
+
     lbl, clr = risk_level(pct)
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
@@ -613,6 +492,8 @@ def fig_gauge(pct):
 
 def fig_radar(km, cr, aw, sc):
     """4축 레이더 – 리스크율 (텍스트 잘림 해결)"""
+    import plotly.graph_objects as go
+
     cats = ["대표자<br>리스크", "법인 경영<br>리스크", "리스크<br>인식", "시나리오"]
     vals = [km, cr, aw, sc]
     vals_closed = vals + [vals[0]]
@@ -652,6 +533,8 @@ def fig_radar(km, cr, aw, sc):
 
 def fig_bars(km, cr, aw, sc):
     """카테고리별 수평 바"""
+    import plotly.graph_objects as go
+
     cats = ["시나리오", "리스크 인식", "법인 경영", "대표자"]
     vals = [sc, aw, cr, km]
     colors = [risk_level(v)[1] for v in vals]
@@ -678,88 +561,7 @@ def fig_bars(km, cr, aw, sc):
 # SCRIPT GENERATION
 # ═══════════════════════════════════════════════════════════
 def build_script(info, scores, priority_items, sol_list):
-    total_pct = scores["total_pct"]
-    lbl, _ = risk_level(total_pct)
-    co = info.get("company", "WOORI(주)") or "WOORI(주)"
-    ind = info.get("industry", "") or "업종 미입력"
-    emp = info.get("employees", "") or "?"
-    ceo = info.get("ceo", "대표자") or "대표자"
-    est = info.get("est", "") or "미입력"
-    rev = info.get("revenue", "") or "미입력"
-
-    lines = []
-    lines.append("=" * 52)
-    lines.append("   GFC 상담 스크립트  |  삼성생명 기업재무컨설팅")
-    lines.append("   진단 기반 자동생성")
-    lines.append("=" * 52)
-    lines.append("")
-    lines.append(f"  기업명    : {co}")
-    lines.append(f"  업종      : {ind}")
-    lines.append(f"  종업원 수 : {emp}명")
-    lines.append(f"  대표자    : {ceo}")
-    lines.append(f"  설립 연차 : {est}")
-    lines.append(f"  연 매출   : {rev}")
-    lines.append(f"  진단 충족율: {total_pct:.0f}% ({lbl})")
-    lines.append(f"  생성일    : {datetime.now().strftime('%Y.%m.%d %H:%M')}")
-    lines.append("")
-    lines.append("─" * 52)
-    lines.append(" 1. 도입 인사")
-    lines.append("─" * 52)
-    top_sec = priority_items[0]["section"] if priority_items else "주요 영역"
-    lines.append(f"""
-안녕하세요, {ceo}님. 삼성생명 GFC 기업재무컨설팅 담당 컨설턴트입니다.
-
-오늘 귀사의 법인 리스크 사전 진단을 완료했는데,
-종합 리스크율이 {total_pct:.0f}%({lbl}) 수준으로 나왔습니다.
-
-특히 '{top_sec}' 부분에서 즉각적인 대비가 필요한
-사항들이 도출되었습니다.
-
-오늘 주요 내용을 안내드리고, 귀사에 맞는
-종합 컨설팅 제안까지 함께 검토하겠습니다.
-""")
-    lines.append("─" * 52)
-    lines.append(" 2. 리스크별 상세 상담")
-    lines.append("─" * 52)
-
-    from collections import OrderedDict
-    grouped = OrderedDict()
-    for it in priority_items:
-        s = it["section"]
-        grouped.setdefault(s, []).append(it)
-
-    for sec, items in grouped.items():
-        lines.append(f"\n▸ {sec} ({len(items)}건 해당)")
-        lines.append("-" * 40)
-        for it in items:
-            lines.append(f"  📌 진단 항목 (가중치 {it['w']})")
-            lines.append(f"     질문 : {it['text']}")
-            lines.append(f"     응답 : {'예' if it['score']==1.0 else '일부 해당' if it['score']==0.5 else '아니오'}")
-            lines.append("")
-
-    lines.append("─" * 52)
-    lines.append(" 3. 추천 솔루션 제안")
-    lines.append("─" * 52)
-    for s in sol_list:
-        lines.append(f"\n  {s['icon']} {s['name']}")
-        lines.append(f"     {s['desc']}")
-
-    lines.append("\n─" * 26)
-    lines.append(" 4. 마무리 및 다음 단계")
-    lines.append("─" * 52)
-    lines.append(f"""
-오늘 진단 결과를 기반으로, 귀사에 맞는
-'종합 법인 재무 컨설팅 제안서'를 별도로 작성하여 드리겠습니다.
-
-세무사, 회계사, 법무사 등 전문가와 협업하여
-최적의 구조를 설계드리고, 단계별 실행 계획까지
-제안드리겠습니다.
-
-다음 단계로 상세 제안서 검토 일정을 잡아드리면 되겠습니다.
-언제 가능하신가요?
-""")
-    lines.append("=" * 52)
-    return "\n".join(lines)
+    return generate_consultation_script(info, scores, priority_items, sol_list)
 
 # ═══════════════════════════════════════════════════════════
 # AI CONSULTANT TAB
@@ -843,7 +645,7 @@ def main():
         layout="centered",
         initial_sidebar_state="collapsed",
     )
-    st.markdown(DARK_CSS, unsafe_allow_html=True)
+    st.markdown(f"<style>{font_face_css()}</style>{DARK_CSS}", unsafe_allow_html=True)
 
     # HEADER
     st.markdown("""
@@ -1034,7 +836,7 @@ def main():
         # 우선 대응 항목
         st.markdown('<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">🔥 우선 대응 항목 <span style="color:#64748b;font-size:9px;font-weight:500">(리스크율 > 0 인 항목 중 가중치 높은 5건)</span></p>', unsafe_allow_html=True)
         all_items = scores["all_items"]
-        priority = sorted([it for it in all_items if it["score"] > 0], key=lambda x: (-x["score"], -x["w"]))[:5]
+        priority = get_priority_items(all_items)
         if not priority:
             st.markdown('<div class="gfc-empty">모든 항목 양호 🎉</div>', unsafe_allow_html=True)
         else:
@@ -1055,17 +857,7 @@ def main():
 
         # 추천 솔루션
         st.markdown('<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">💎 추천 솔루션 <span style="color:#64748b;font-size:9px;font-weight:500">(리스크 유형별 대응 제품)</span></p>', unsafe_allow_html=True)
-        has_km = any(it["score"] > 0 and it["section"] == "대표자 리스크" for it in all_items)
-        has_cr = any(it["score"] > 0 and it["section"] == "법인 경영 리스크" for it in all_items)
-        has_any = any(it["score"] > 0 for it in all_items)
-        sol_shown = []
-        for s in SOLUTIONS:
-            if s["trigger"] == "keyman" and has_km:
-                sol_shown.append(s)
-            elif s["trigger"] == "corp" and has_cr:
-                sol_shown.append(s)
-            elif s["trigger"] == "all" and has_any:
-                sol_shown.append(s)
+        sol_shown = get_recommended_solutions(all_items)
         if not sol_shown:
             st.markdown('<div class="gfc-empty">현재 추천 솔루션 없음 — 모든 항목 양호 🎉</div>', unsafe_allow_html=True)
         else:
@@ -1,8 +1,8 @@
 import streamlit as st
-import plotly.graph_objects as go
-import numpy as np
 from datetime import datetime
 
+from gfc_core import weighted_total
+
 # ─────────────────────────────────────
 # 0. 글로벌 스타일 (다크 테마)
 # ─────────────────────────────────────
@@ -132,15 +132,16 @@ SAMPLE_DATA = {
     }
 }
 
+# 샘플 대시보드 전용 고정 비율 (진단 문항이 없는 데모 데이터용)
+SAMPLE_SECTION_WEIGHTS = {"대표자 리스크": 0.35, "법인 경영 리스크": 0.30,
+                          "리스크 인식": 0.20, "시나리오": 0.15}
+
 # ─────────────────────────────────────
 # 2. 유틸리티 함수
 # ─────────────────────────────────────
 def calc_total_risk(scores: dict) -> float:
     """가중평균으로 종합 리스크율 계산"""
-    weights = {"대표자 리스크": 0.35, "법인 경영 리스크": 0.30,
-               "리스크 인식": 0.20, "시나리오": 0.15}
-    total = sum(scores[k] * weights.get(k, 0.25) for k in scores)
-    return round(total, 1)
+    return round(weighted_total(scores, SAMPLE_SECTION_WEIGHTS), 1)
 
 def risk_label(val: float):
     """리스크율 → (텍스트, CSS클래스)"""
@@ -164,6 +165,8 @@ ACCENT    = "#00d4aa"
 
 def draw_gauge(value: float, label_text: str, css_class: str):
     """종합 리스크 게이지 차트"""
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=value,
@@ -197,6 +200,8 @@ def draw_gauge(value: float, label_text: str, css_class: str):
 
 def draw_radar(scores: dict):
     """카테고리별 리스크 레이더 차트"""
+    import plotly.graph_objects as go
+
     cats   = list(scores.keys())
     vals   = list(scores.values())
     # 닫힌 다각형
@@ -230,6 +235,8 @@ def draw_radar(scores: dict):
 
 def draw_hbar(scores: dict):
     """카테고리별 수평 바 차트"""
+    import plotly.graph_objects as go
+
     cats = list(scores.keys())
     vals = list(scores.values())
     colors = []
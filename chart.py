@@ -14,504 +14,34 @@ Streamlit 기반 AI 진단 엔진 + KPI 대시보드 + AI 컨설턴트
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 from datetime import datetime
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List
 from collections import OrderedDict
 
-# ═══════════════════════════════════════════════════════════
-# CONSTANTS & CONFIGURATION
-# ═══════════════════════════════════════════════════════════
-
-@dataclass
-class RiskLevel:
-    """리스크 레벨 정의"""
-    name: str
-    color: str
-    threshold: float
-
-RISK_LEVELS = [
-    RiskLevel("양호", "#22c55e", 20),
-    RiskLevel("주의", "#ca8a04", 45),
-    RiskLevel("경계", "#ea580c", 70),
-    RiskLevel("위험", "#dc2626", 100),
-]
-
-WEIGHT_COLORS = {
-    1: "#64748b",
-    2: "#64748b", 
-    3: "#3b82f6",
-    4: "#ca8a04",
-    5: "#ea580c",
-}
-
-RESPONSE_OPTIONS = ["예", "일부 해당", "아니오"]
-RESPONSE_SCORES = {"예": 1.0, "일부 해당": 0.5, "아니오": 0.0}
-
-# ═══════════════════════════════════════════════════════════
-# DIAGNOSTIC DATA
-# ═══════════════════════════════════════════════════════════
-
-KEYMAN_QUESTIONS = [
-    ("대표자 유고 시 의사결정 공백이 발생할 수 있다", 4),
-    ("회사 주요 거래·의사결정이 대표자 개인에게 집중되어 있다", 5),
-    ("대표자가 개인 보증을 서고 있다", 4),
-    ("대표자 개인 재무와 법인 재무가 명확히 분리되어 있지 않다", 3),
-    ("가업 승계 또는 지분 이전 계획이 명확하지 않다", 5),
-    ("대표자 건강·사고 리스크에 대한 대비가 충분하지 않다", 5),
-]
-
-CORPORATE_QUESTIONS = [
-    ("매출이 특정 거래처에 과도하게 집중되어 있다", 4),
-    ("핵심 인력 이탈 시 업무 공백이 크다", 4),
-    ("설비·투자 회수 구조가 장기적이거나 불확실하다", 3),
-    ("현금흐름 변동성이 크다", 4),
-    ("외부 환경 변화(환율·정책·시장)에 취약하다", 3),
-    ("예상치 못한 사고 발생 시 즉각 대응 체계가 부족하다", 5),
-]
-
-AWARENESS_QUESTIONS = [
-    ("대표자 리스크가 곧바로 법인 리스크로 이어질 수 있다", 
-     ["그렇다", "보통", "아니다"], 
-     {"그렇다": 0.0, "보통": 0.5, "아니다": 1.0}, 3),
-    ("단일 사고 발생 시 회사가 버틸 수 있는 기간을 알고 있다", 
-     ["예", "아니오"], 
-     {"예": 0.0, "아니오": 1.0}, 4),
-    ("리스크 발생 시 대응 순서와 책임자가 정리되어 있다", 
-     ["예", "아니오"], 
-     {"예": 0.0, "아니오": 1.0}, 4),
-]
-
-SCENARIO_QUESTIONS = [
-    ("대표자가 6개월 이상 경영에서 이탈할 경우",
-     ["큰 영향 없음", "부분적 영향", "경영 전반에 중대한 영향"],
-     {"큰 영향 없음": 0.0, "부분적 영향": 0.5, "경영 전반에 중대한 영향": 1.0}, 5),
-    ("핵심 인력 1~2명이 동시에 이탈할 경우",
-     ["대응 가능", "일부 차질", "심각한 차질"],
-     {"대응 가능": 0.0, "일부 차질": 0.5, "심각한 차질": 1.0}, 4),
-    ("대규모 투자 또는 외부 충격 발생 시",
-     ["내부 대응 가능", "단기 대응 필요", "구조적 대응 필요"],
-     {"내부 대응 가능": 0.0, "단기 대응 필요": 0.5, "구조적 대응 필요": 1.0}, 4),
-]
+from gfc_core import (
+    CORPORATE_QUESTIONS,
+    KEYMAN_QUESTIONS,
+    LEGACY_AWARENESS_QUESTIONS as AWARENESS_QUESTIONS,
+    LEGACY_SCHEMA,
+    RESPONSE_OPTIONS,
+    SCENARIO_QUESTIONS,
+    WEIGHT_COLORS,
+    calculate_all_scores,
+    generate_consultation_script,
+    get_priority_items,
+    get_recommended_solutions,
+    get_risk_level,
+    load_dark_theme_css,
+)
 
-SOLUTIONS = [
-    {
-        "name": "대표자 리스크 관리",
-        "icon": "👔",
-        "color": "#9333ea",
-        "desc": "CEO Plan · Key-Man 보험 등을 통해 대표자 유고·부적격 시 경영 연속성을 보장합니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "종업원 단체보험",
-        "icon": "👨‍👩‍👧‍👦",
-        "color": "#ea580c",
-        "desc": "핵심 인력 이탈·재해 시 기업 운영 안정을 위한 단체보험 설계.",
-        "trigger": "corp"
-    },
-    {
-        "name": "가업승계 컨설팅",
-        "icon": "🏢",
-        "color": "#ca8a04",
-        "desc": "지분 이전·상속·증여를 체계적으로 구조화하여 세금 부담을 최소화합니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "법인 절세 컨설팅",
-        "icon": "📋",
-        "color": "#16a34a",
-        "desc": "법인·개인 재무 분리와 절세 구조를 정리하여 불필요한 세금 부담을 줄입니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "현금흐름 & 위기대응",
-        "icon": "📊",
-        "color": "#0891b2",
-        "desc": "현금흐름 변동성 대비와 단일 사고 대응 구조를 체계적으로 설계합니다.",
-        "trigger": "corp"
-    },
-    {
-        "name": "종합 재무컨설팅",
-        "icon": "📈",
-        "color": "#2563eb",
-        "desc": "전체 리스크를 종합적으로 평가하여 최적의 구조 설계와 실행 계획을 제안합니다.",
-        "trigger": "all"
-    },
-]
+# Plotly 는 차트 생성 시점에 import (진단 탭 첫 렌더링을 지연시키지 않도록)
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # ═══════════════════════════════════════════════════════════
 # STYLES & UI COMPONENTS
 # ═══════════════════════════════════════════════════════════
 
-def load_dark_theme_css() -> str:
-    """다크 테마 CSS 반환"""
-    return """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700;800&display=swap');
-    
-    .stApp { 
-        background: #0f1623 !important; 
-        color: #cbd5e1 !important; 
-        font-family: 'Noto Sans KR', sans-serif !important; 
-    }
-    
-    .main .block-container { 
-        padding-top: 8px !important; 
-        padding-left: 18px !important; 
-        padding-right: 18px !important; 
-        max-width: 960px !important; 
-        margin: 0 auto !important; 
-    }
-    
-    .gfc-header { 
-        background: linear-gradient(135deg, #0a1220 0%, #152238 55%, #1a2d4a 100%); 
-        border-bottom: 1px solid #1e3a5f;
-        padding: 24px 22px 20px; 
-        border-radius: 0; 
-        margin: -8px -18px 0; 
-    }
-    
-    .gfc-header h1 { 
-        color: #fff; 
-        font-size: 22px; 
-        font-weight: 800; 
-        margin: 0; 
-        line-height: 1.3; 
-    }
-    
-    .gfc-header h1 span { 
-        color: #60a5fa; 
-    }
-    
-    .gfc-header p { 
-        color: #64748b; 
-        font-size: 11px; 
-        margin: 6px 0 0; 
-        line-height: 1.55; 
-        max-width: 700px; 
-    }
-    
-    .gfc-live { 
-        display: inline-flex; 
-        align-items: center; 
-        gap: 6px; 
-        margin-bottom: 8px; 
-    }
-    
-    .gfc-live-dot { 
-        width: 7px; 
-        height: 7px; 
-        border-radius: 50%; 
-        background: #22c55e; 
-        animation: pulse 2s infinite; 
-    }
-    
-    .gfc-live span { 
-        font-size: 10px; 
-        color: #60a5fa; 
-        font-weight: 700; 
-        letter-spacing: 1.4px; 
-        text-transform: uppercase; 
-    }
-    
-    @keyframes pulse { 
-        0%, 100% { opacity: 1 } 
-        50% { opacity: 0.4 } 
-    }
-    
-    div[data-testid="stTabs"] { 
-        border-bottom: 1px solid #1e3a5f !important; 
-    }
-    
-    button[data-testid="tab-btn"] { 
-        background: none !important; 
-        color: #64748b !important; 
-        font-size: 12px !important; 
-        font-weight: 600 !important; 
-        border: none !important; 
-        padding: 9px 14px !important; 
-        border-bottom: 2px solid transparent !important; 
-    }
-    
-    button[data-testid="tab-btn"][aria-selected="true"] { 
-        color: #60a5fa !important; 
-        border-bottom-color: #60a5fa !important; 
-    }
-    
-    .streamlit-expander { 
-        border: 1px solid #1e3a5f !important; 
-        background: #111d2e !important; 
-        border-radius: 8px !important; 
-        margin-bottom: 5px !important; 
-    }
-    
-    .streamlit-expander .streamlit-expander-header { 
-        color: #fff !important; 
-        font-weight: 700 !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stSelectbox label, .stTextInput label { 
-        color: #64748b !important; 
-        font-size: 10px !important; 
-        text-transform: uppercase; 
-        letter-spacing: 0.7px; 
-        font-weight: 700 !important; 
-    }
-    
-    .stSelectbox > div > div { 
-        background: #0f1a2a !important; 
-        border: 1px solid #1e3a5f !important; 
-        color: #fff !important; 
-        border-radius: 6px !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stTextInput > div > input { 
-        background: #0f1a2a !important; 
-        border: 1px solid #1e3a5f !important; 
-        color: #fff !important; 
-        border-radius: 6px !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stTextInput > div > input:focus { 
-        border-color: #60a5fa !important; 
-        box-shadow: none !important; 
-    }
-    
-    .stTextInput > div > input::placeholder { 
-        color: #475569 !important; 
-    }
-    
-    .stRadio label { 
-        color: #cbd5e1 !important; 
-        font-size: 11.5px !important; 
-    }
-    
-    .stRadio > div > div label { 
-        color: #cbd5e1 !important; 
-        font-size: 11.5px !important; 
-    }
-    
-    .gfc-kpi-row { 
-        display: flex; 
-        gap: 10px; 
-        flex-wrap: wrap; 
-        margin-bottom: 12px; 
-    }
-    
-    .gfc-kpi { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 10px; 
-        padding: 14px 16px; 
-        flex: 1; 
-        min-width: 130px; 
-        text-align: center; 
-    }
-    
-    .gfc-kpi .val { 
-        font-size: 24px; 
-        font-weight: 800; 
-        line-height: 1; 
-        margin-bottom: 3px; 
-    }
-    
-    .gfc-kpi .lbl { 
-        font-size: 9.5px; 
-        color: #64748b; 
-        font-weight: 600; 
-    }
-    
-    .gfc-pri { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 7px; 
-        padding: 8px 10px; 
-        display: flex; 
-        align-items: flex-start; 
-        gap: 8px; 
-        margin-bottom: 4px; 
-    }
-    
-    .gfc-pri .rk { 
-        font-size: 11px; 
-        font-weight: 800; 
-        color: #64748b; 
-        width: 18px; 
-        text-align: center; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-pri .info { 
-        flex: 1; 
-        min-width: 0; 
-    }
-    
-    .gfc-pri .cat { 
-        font-size: 9px; 
-        color: #64748b; 
-        margin-bottom: 1px; 
-    }
-    
-    .gfc-pri .txt { 
-        font-size: 10.5px; 
-        color: #cbd5e1; 
-    }
-    
-    .gfc-pri .wtag { 
-        font-size: 8px; 
-        font-weight: 700; 
-        color: #fff; 
-        border-radius: 3px; 
-        padding: 1px 5px; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-sol { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 8px; 
-        padding: 10px 12px; 
-        display: flex; 
-        align-items: flex-start; 
-        gap: 8px; 
-        margin-bottom: 5px; 
-    }
-    
-    .gfc-sol .ico { 
-        font-size: 18px; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-sol .nm { 
-        font-size: 11px; 
-        font-weight: 700; 
-        color: #fff; 
-        margin-bottom: 2px; 
-    }
-    
-    .gfc-sol .dc { 
-        font-size: 9.5px; 
-        color: #64748b; 
-        line-height: 1.45; 
-    }
-    
-    .gfc-script { 
-        background: #1a2736; 
-        border: 1px solid #2a4a6b; 
-        border-top: 2px solid #ca8a04; 
-        border-radius: 10px; 
-        padding: 22px 24px; 
-        margin-top: 8px; 
-    }
-    
-    .gfc-script .sc-hdr { 
-        text-align: center; 
-        border-bottom: 1px solid #2a4a6b; 
-        padding-bottom: 12px; 
-        margin-bottom: 16px; 
-    }
-    
-    .gfc-script .sc-hdr h2 { 
-        color: #fff; 
-        font-size: 15px; 
-        font-weight: 800; 
-        margin: 0; 
-    }
-    
-    .gfc-script .sc-hdr p { 
-        color: #ca8a04; 
-        font-size: 9.5px; 
-        margin: 3px 0 0; 
-        font-weight: 600; 
-        letter-spacing: 1px; 
-    }
-    
-    .gfc-script .sc-meta { 
-        display: grid; 
-        grid-template-columns: 1fr 1fr; 
-        gap: 3px 14px; 
-        margin-bottom: 14px; 
-        font-size: 10.5px; 
-        color: #64748b; 
-    }
-    
-    .gfc-script .sc-meta strong { 
-        color: #fff; 
-        font-weight: 600; 
-    }
-    
-    .gfc-script .sc-sec { 
-        font-size: 10.5px; 
-        font-weight: 700; 
-        color: #ca8a04; 
-        letter-spacing: 0.3px; 
-        margin: 14px 0 6px; 
-        display: flex; 
-        align-items: center; 
-        gap: 6px; 
-    }
-    
-    .gfc-script .sc-sec::after { 
-        content: ''; 
-        flex: 1; 
-        height: 1px; 
-        background: #2a4a6b; 
-    }
-    
-    .gfc-script .sc-intro { 
-        background: #151f30; 
-        border-left: 3px solid #60a5fa; 
-        border-radius: 6px; 
-        padding: 14px 16px; 
-        font-size: 11.5px; 
-        color: #cbd5e1; 
-        line-height: 1.9; 
-    }
-    
-    .gfc-script .sc-block { 
-        background: #151f30; 
-        border-left: 2px solid; 
-        border-radius: 5px; 
-        padding: 9px 12px; 
-        margin-bottom: 4px; 
-    }
-    
-    .gfc-script .sc-block .bq { 
-        font-size: 9.5px; 
-        color: #94a3b8; 
-        margin-bottom: 2px; 
-    }
-    
-    .gfc-script .sc-block .bt { 
-        font-size: 10.5px; 
-        color: #cbd5e1; 
-        line-height: 1.6; 
-    }
-    
-    .gfc-script .sc-close { 
-        background: #151f30; 
-        border-left: 3px solid #22c55e; 
-        border-radius: 6px; 
-        padding: 14px 16px; 
-        font-size: 11px; 
-        color: #cbd5e1; 
-        line-height: 1.85; 
-        margin-top: 6px; 
-    }
-    
-    .gfc-empty { 
-        color: #22c55e; 
-        font-size: 11px; 
-        text-align: center; 
-        padding: 10px; 
-    }
-    </style>
-    """
-
 def render_header():
     """앱 헤더 렌더링"""
     st.markdown("""
@@ -580,117 +110,6 @@ def render_solution_card(solution: Dict):
     </div>
     """, unsafe_allow_html=True)
 
-# ═══════════════════════════════════════════════════════════
-# BUSINESS LOGIC
-# ═══════════════════════════════════════════════════════════
-
-def get_risk_level(percentage: float) -> Tuple[str, str]:
-    """리스크율에 따른 레벨과 색상 반환"""
-    for level in RISK_LEVELS:
-        if percentage <= level.threshold:
-            return level.name, level.color
-    return RISK_LEVELS[-1].name, RISK_LEVELS[-1].color
-
-def calculate_section_score(questions: List[Tuple], answers: List[str], 
-                            section_name: str, score_map: Dict = None) -> Tuple[float, List[Dict]]:
-    """섹션별 리스크율 및 아이템 계산"""
-    score_map = score_map or RESPONSE_SCORES
-    total_weight = 0
-    weighted_sum = 0
-    items = []
-    
-    for i, (text, weight) in enumerate(questions):
-        total_weight += weight
-        score = score_map.get(answers[i], 0.0)
-        weighted_sum += score * weight
-        
-        items.append({
-            "text": text,
-            "w": weight,
-            "score": score,
-            "section": section_name
-        })
-    
-    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
-    return percentage, items
-
-def calculate_custom_section_score(questions: List[Tuple], answers: List[str], 
-                                   section_name: str) -> Tuple[float, List[Dict]]:
-    """커스텀 스코어맵을 사용하는 섹션 계산 (Awareness, Scenario)"""
-    total_weight = 0
-    weighted_sum = 0
-    items = []
-    
-    for i, (text, options, score_map, weight) in enumerate(questions):
-        total_weight += weight
-        score = score_map.get(answers[i], 0.0)
-        weighted_sum += score * weight
-        
-        items.append({
-            "text": text,
-            "w": weight,
-            "score": score,
-            "section": section_name
-        })
-    
-    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
-    return percentage, items
-
-def calculate_all_scores(km_answers: List[str], cr_answers: List[str], 
-                        aw_answers: List[str], sc_answers: List[str]) -> Dict:
-    """전체 리스크 점수 계산"""
-    # 각 섹션별 계산
-    km_pct, km_items = calculate_section_score(KEYMAN_QUESTIONS, km_answers, "대표자 리스크")
-    cr_pct, cr_items = calculate_section_score(CORPORATE_QUESTIONS, cr_answers, "법인 경영 리스크")
-    aw_pct, aw_items = calculate_custom_section_score(AWARENESS_QUESTIONS, aw_answers, "리스크 인식")
-    sc_pct, sc_items = calculate_custom_section_score(SCENARIO_QUESTIONS, sc_answers, "시나리오")
-    
-    # 가중치 합산
-    km_wt = sum(w for _, w in KEYMAN_QUESTIONS)
-    cr_wt = sum(w for _, w in CORPORATE_QUESTIONS)
-    aw_wt = sum(q[3] for q in AWARENESS_QUESTIONS)
-    sc_wt = sum(q[3] for q in SCENARIO_QUESTIONS)
-    total_wt = km_wt + cr_wt + aw_wt + sc_wt
-    
-    # 종합 리스크율 (가중평균)
-    total_pct = (km_pct * km_wt + cr_pct * cr_wt + aw_pct * aw_wt + sc_pct * sc_wt) / total_wt if total_wt > 0 else 0
-    
-    return {
-        "km_pct": km_pct,
-        "cr_pct": cr_pct,
-        "aw_pct": aw_pct,
-        "sc_pct": sc_pct,
-        "total_pct": total_pct,
-        "km_wt": km_wt,
-        "cr_wt": cr_wt,
-        "aw_wt": aw_wt,
-        "sc_wt": sc_wt,
-        "total_wt": total_wt,
-        "all_items": km_items + cr_items + aw_items + sc_items,
-    }
-
-def get_priority_items(all_items: List[Dict], limit: int = 5) -> List[Dict]:
-    """우선 대응 항목 추출"""
-    risky_items = [item for item in all_items if item["score"] > 0]
-    return sorted(risky_items, key=lambda x: (-x["score"], -x["w"]))[:limit]
-
-def get_recommended_solutions(all_items: List[Dict]) -> List[Dict]:
-    """추천 솔루션 필터링"""
-    has_keyman = any(item["score"] > 0 and item["section"] == "대표자 리스크" for item in all_items)
-    has_corp = any(item["score"] > 0 and item["section"] == "법인 경영 리스크" for item in all_items)
-    has_any = any(item["score"] > 0 for item in all_items)
-    
-    recommended = []
-    for solution in SOLUTIONS:
-        if solution["trigger"] == "keyman" and has_keyman:
-            recommended.append(solution)
-        elif solution["trigger"] == "corp" and has_corp:
-            recommended.append(solution)
-        elif solution["trigger"] == "all" and has_any:
-            recommended.append(solution)
-    
-    return recommended
-
 # ═══════════════════════════════════════════════════════════
 # CHART GENERATION
 # ═══════════════════════════════════════════════════════════
@@ -702,8 +121,10 @@ PLOT_LAYOUT = dict(
     margin=dict(l=10, r=10, t=10, b=10),
 )
 
-def create_gauge_chart(percentage: float) -> go.Figure:
+def create_gauge_chart(percentage: float) -> "go.Figure":
     """종합 리스크율 게이지 차트"""
+    import plotly.graph_objects as go
+
     label, color = get_risk_level(percentage)
     
     fig = go.Figure(go.Indicator(
@@ -740,8 +161,10 @@ def create_gauge_chart(percentage: float) -> go.Figure:
     )
     return fig
 
-def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
+def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> "go.Figure":
     """4축 레이더 차트"""
+    import plotly.graph_objects as go
+
     categories = ["대표자<br>리스크", "법인 경영<br>리스크", "리스크<br>인식", "시나리오"]
     values = [km, cr, aw, sc]
     values_closed = values + [values[0]]
@@ -783,8 +206,10 @@ def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
     fig.update_layout(**layout_config)
     return fig
 
-def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
+def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> "go.Figure":
     """카테고리별 수평 바 차트"""
+    import plotly.graph_objects as go
+
     categories = ["시나리오", "리스크 인식", "법인 경영", "대표자"]
     values = [sc, aw, cr, km]
     colors = [get_risk_level(v)[1] for v in values]
@@ -815,96 +240,6 @@ def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
     )
     return fig
 
-# ═══════════════════════════════════════════════════════════
-# SCRIPT & CONSULTANT GENERATION
-# ═══════════════════════════════════════════════════════════
-
-def generate_consultation_script(info: Dict, scores: Dict, priority_items: List[Dict], 
-                                 solutions: List[Dict]) -> str:
-    """상담 스크립트 생성"""
-    total_pct = scores["total_pct"]
-    label, _ = get_risk_level(total_pct)
-    
-    company = info.get("company", "WOORI(주)") or "WOORI(주)"
-    industry = info.get("industry", "") or "업종 미입력"
-    employees = info.get("employees", "") or "?"
-    ceo = info.get("ceo", "대표자") or "대표자"
-    est = info.get("est", "") or "미입력"
-    revenue = info.get("revenue", "") or "미입력"
-    
-    lines = [
-        "=" * 52,
-        "   GFC 상담 스크립트  |  삼성생명 기업재무컨설팅",
-        "   진단 기반 자동생성",
-        "=" * 52,
-        "",
-        f"  기업명    : {company}",
-        f"  업종      : {industry}",
-        f"  종업원 수 : {employees}명",
-        f"  대표자    : {ceo}",
-        f"  설립 연차 : {est}",
-        f"  연 매출   : {revenue}",
-        f"  진단 충족율: {total_pct:.0f}% ({label})",
-        f"  생성일    : {datetime.now().strftime('%Y.%m.%d %H:%M')}",
-        "",
-        "─" * 52,
-        " 1. 도입 인사",
-        "─" * 52,
-    ]
-    
-    top_section = priority_items[0]["section"] if priority_items else "주요 영역"
-    lines.append(f"""
-안녕하세요, {ceo}님. 삼성생명 GFC 기업재무컨설팅 담당 컨설턴트입니다.
-
-오늘 귀사의 법인 리스크 사전 진단을 완료했는데,
-종합 리스크율이 {total_pct:.0f}%({label}) 수준으로 나왔습니다.
-
-특히 '{top_section}' 부분에서 즉각적인 대비가 필요한
-사항들이 도출되었습니다.
-
-오늘 주요 내용을 안내드리고, 귀사에 맞는
-종합 컨설팅 제안까지 함께 검토하겠습니다.
-""")
-    
-    lines.extend(["─" * 52, " 2. 리스크별 상세 상담", "─" * 52])
-    
-    # 섹션별 그룹화
-    grouped = OrderedDict()
-    for item in priority_items:
-        section = item["section"]
-        grouped.setdefault(section, []).append(item)
-    
-    for section, items in grouped.items():
-        lines.append(f"\n▸ {section} ({len(items)}건 해당)")
-        lines.append("-" * 40)
-        for item in items:
-            response = "예" if item['score'] == 1.0 else "일부 해당" if item['score'] == 0.5 else "아니오"
-            lines.append(f"  📌 진단 항목 (가중치 {item['w']})")
-            lines.append(f"     질문 : {item['text']}")
-            lines.append(f"     응답 : {response}")
-            lines.append("")
-    
-    lines.extend(["─" * 52, " 3. 추천 솔루션 제안", "─" * 52])
-    for solution in solutions:
-        lines.append(f"\n  {solution['icon']} {solution['name']}")
-        lines.append(f"     {solution['desc']}")
-    
-    lines.extend(["\n" + "─" * 52, " 4. 마무리 및 다음 단계", "─" * 52])
-    lines.append("""
-오늘 진단 결과를 기반으로, 귀사에 맞는
-'종합 법인 재무 컨설팅 제안서'를 별도로 작성하여 드리겠습니다.
-
-세무사, 회계사, 법무사 등 전문가와 협업하여
-최적의 구조를 설계드리고, 단계별 실행 계획까지
-제안드리겠습니다.
-
-다음 단계로 상세 제안서 검토 일정을 잡아드리면 되겠습니다.
-언제 가능하신가요?
-""")
-    lines.append("=" * 52)
-    
-    return "\n".join(lines)
-
 # ═══════════════════════════════════════════════════════════
 # TAB RENDERERS
 # ═══════════════════════════════════════════════════════════
@@ -1012,7 +347,8 @@ def render_diagnostic_tab():
         "cr_answers": cr_answers,
         "aw_answers": aw_answers,
         "sc_answers": sc_answers,
-        "scores": calculate_all_scores(km_answers, cr_answers, aw_answers, sc_answers)
+        "scores": calculate_all_scores(km_answers, cr_answers, aw_answers, sc_answers,
+                                       schema=LEGACY_SCHEMA)
     })
     
     # Quick summary
@@ -1051,7 +387,8 @@ def render_dashboard_tab():
         ["아니오"] * len(KEYMAN_QUESTIONS),
         ["아니오"] * len(CORPORATE_QUESTIONS),
         [q[1][-1] for q in AWARENESS_QUESTIONS],
-        [q[1][0] for q in SCENARIO_QUESTIONS]
+        [q[1][0] for q in SCENARIO_QUESTIONS],
+        schema=LEGACY_SCHEMA
     )
     
     scores = st.session_state.get("scores", default_scores)
@@ -0,0 +1,23 @@
+"""
+GFC 진단 앱(ssgfc.py) 을 st.App 으로 실행 — self-hosted 폰트(static/fonts)에 장기 캐시 헤더 적용
+
+실행: streamlit run gfc_app.py
+      st.App 이 없는 Streamlit 버전에서는 ssgfc.py 를 그대로 실행합니다 (폰트는 ETag 재검증으로 제공).
+"""
+
+import os
+
+import streamlit as st
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ssgfc.py")
+
+if hasattr(st, "App"):
+    from starlette.middleware import Middleware
+
+    from gfc_core.fonts import FontCacheMiddleware
+
+    app = st.App(APP_SCRIPT, middleware=[Middleware(FontCacheMiddleware)])
+else:
+    import runpy
+
+    runpy.run_path(APP_SCRIPT, run_name="__main__")
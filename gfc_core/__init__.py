@@ -0,0 +1,133 @@
+"""
+gfc_core — 삼성생명 GFC 법인 리스크 진단 공용 엔진
+
+문항 스키마, 점수 계산, 우선 대응 항목, 솔루션 매칭, 상담 스크립트 · SVG 차트 생성을 제공합니다.
+Streamlit 에 의존하지 않으므로 배치 작업에서도 그대로 사용할 수 있습니다.
+"""
+
+import os
+
+# 앱 루트 디렉터리 (ssgfc.py · static/ · 저장소 파일 위치, 하위 모듈이 참조하므로 import 보다 먼저 정의)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from .questions import (
+    AWARENESS_QUESTIONS,
+    CORPORATE_QUESTIONS,
+    KEYMAN_QUESTIONS,
+    LEGACY_AWARENESS_QUESTIONS,
+    RESPONSE_OPTIONS,
+    RESPONSE_SCORES,
+    RISK_LEVELS,
+    SCENARIO_QUESTIONS,
+    SOLUTIONS,
+    WEIGHT_COLORS,
+    RiskLevel,
+)
+from .schema import (
+    LEGACY_POOLED_SCHEMA,
+    LEGACY_SCHEMA,
+    SCHEMA,
+    TOTAL_POOLED,
+    TOTAL_SECTION_WEIGHTED,
+    QuestionSchema,
+    SectionSchema,
+    SectionTable,
+    build_questionnaire,
+    compile_schema,
+)
+from .scoring import (
+    calculate_all_scores,
+    calculate_custom_section_score,
+    calculate_section_score,
+    encode_answers,
+    finalize_scores,
+    get_risk_level,
+    score_batch,
+    score_codes,
+    weighted_total,
+)
+from .incremental import IncrementalScorer
+from .priority import get_priority_items, top_k_batch
+from .solutions import (
+    TRIGGER_SECTIONS,
+    get_recommended_solutions,
+    recommend_batch,
+    risk_mask,
+    solution_masks,
+    solutions_for_mask,
+    solutions_for_masks,
+)
+from .script import (
+    ConsultationScript,
+    build_script_model,
+    generate_consultation_script,
+)
+from .store import DEFAULT_DB_PATH, DiagnosisStore, build_record
+from .svg import bar_svg, gauge_svg, radar_svg
+from .theme import (
+    HtmlBatch,
+    compact_css,
+    compact_html,
+    dark_theme_rules,
+    font_face_css,
+    load_dark_theme_css,
+)
+
+__all__ = [
+    "APP_DIR",
+    "AWARENESS_QUESTIONS",
+    "CORPORATE_QUESTIONS",
+    "DEFAULT_DB_PATH",
+    "KEYMAN_QUESTIONS",
+    "LEGACY_AWARENESS_QUESTIONS",
+    "LEGACY_POOLED_SCHEMA",
+    "LEGACY_SCHEMA",
+    "RESPONSE_OPTIONS",
+    "RESPONSE_SCORES",
+    "RISK_LEVELS",
+    "SCENARIO_QUESTIONS",
+    "SCHEMA",
+    "SOLUTIONS",
+    "TOTAL_POOLED",
+    "TOTAL_SECTION_WEIGHTED",
+    "TRIGGER_SECTIONS",
+    "WEIGHT_COLORS",
+    "ConsultationScript",
+    "DiagnosisStore",
+    "HtmlBatch",
+    "IncrementalScorer",
+    "QuestionSchema",
+    "RiskLevel",
+    "SectionSchema",
+    "SectionTable",
+    "bar_svg",
+    "build_questionnaire",
+    "build_record",
+    "build_script_model",
+    "calculate_all_scores",
+    "calculate_custom_section_score",
+    "calculate_section_score",
+    "compact_css",
+    "compact_html",
+    "compile_schema",
+    "dark_theme_rules",
+    "encode_answers",
+    "finalize_scores",
+    "font_face_css",
+    "gauge_svg",
+    "generate_consultation_script",
+    "get_priority_items",
+    "get_recommended_solutions",
+    "get_risk_level",
+    "load_dark_theme_css",
+    "radar_svg",
+    "recommend_batch",
+    "risk_mask",
+    "score_batch",
+    "score_codes",
+    "solution_masks",
+    "solutions_for_mask",
+    "solutions_for_masks",
+    "top_k_batch",
+    "weighted_total",
+]
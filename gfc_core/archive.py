@@ -0,0 +1,247 @@
+"""
+진단 이력 컬럼형 아카이브 (Parquet, 월별 파티션)
+
+진단 결과(기본 정보 + calculate_all_scores 결과 + 우선 대응 항목)를 추가 전용 Parquet 파일로
+month=YYYY-MM 하이브 파티션 아래에 기록합니다. 조회는 pyarrow.dataset 필터로 수행하므로
+파티션(월) 가지치기와 row group 통계 기반 조건 푸시다운이 적용되어 필요한 부분만 읽습니다.
+
+내보내기는 아카이브에 이미 있는 최대 id 를 기준점으로 삼아 그 이후 진단만 추가하므로
+반복 실행해도 같은 진단이 중복 기록되지 않습니다.
+
+실행: python -m gfc_core.archive export gfc_diagnoses.db archive/   (SQLite 저장소 → 아카이브)
+      python -m gfc_core.archive check                              (반복 내보내기 중복 여부 검증)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import uuid
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Union
+
+from .store import INFO_FIELDS, SECTION_KEYS
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_ARCHIVE_DIR = "gfc_archive"
+PARTITION_KEY = "month"
+# 조건 푸시다운 효율을 위해 파일 내부를 이 순서로 정렬해 기록
+SORT_KEYS = ("risk_level", "industry", "revenue")
+# query() 에서 등가 / 목록 조건을 받는 컬럼
+FILTER_FIELDS = ("industry", "revenue", "employees", "est", "ceo_age", "ceo_share",
+                 "adviser", "company", "risk_level")
+PCT_COLUMNS = tuple(f"{key}_pct" for key in SECTION_KEYS + ("total",))
+
+def archive_schema() -> "pa.Schema":
+    """아카이브 파일 스키마 (파티션 컬럼 month 제외)"""
+    import pyarrow as pa
+
+    return pa.schema(
+        [("id", pa.int64()), ("created_at", pa.timestamp("s")), ("diagnosis_date", pa.date32())]
+        + [(field, pa.string()) for field in INFO_FIELDS]
+        + [("questionnaire", pa.string()), ("answers", pa.list_(pa.string()))]
+        + [(column, pa.float64()) for column in PCT_COLUMNS]
+        + [("risk_level", pa.string()), ("priority", pa.list_(pa.string()))]
+    )
+
+def _archive_row(record: Dict) -> Dict:
+    """store.build_record() / DiagnosisStore.load() 레코드 → 아카이브 행"""
+    answers = record["answers"]
+    if isinstance(answers, dict):
+        answers = [answer for key in SECTION_KEYS for answer in answers.get(key, [])]
+    created_at = record["created_at"]
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    diagnosis_date = record["diagnosis_date"]
+    if isinstance(diagnosis_date, str):
+        diagnosis_date = date.fromisoformat(diagnosis_date)
+
+    row = {
+        "id": record.get("id"),
+        "created_at": created_at,
+        "diagnosis_date": diagnosis_date,
+        "questionnaire": record.get("questionnaire", ""),
+        "answers": list(answers),
+        "risk_level": record["risk_level"],
+        "priority": list(record["priority"]),
+    }
+    for field in INFO_FIELDS:
+        row[field] = record.get(field) or ""
+    for column in PCT_COLUMNS:
+        row[column] = record[column]
+    return row
+
+def _field_filter(name: str, value: Union[str, Sequence[str]]):
+    import pyarrow.compute as pc
+
+    if isinstance(value, str):
+        return pc.field(name) == value
+    return pc.field(name).isin(list(value))
+
+class DiagnosisArchive:
+    """월별 파티션 Parquet 진단 아카이브 (추가 전용)"""
+
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR):
+        self.root = root
+
+    # ── 쓰기 ────────────────────────────────────────────────
+
+    def append(self, records: Iterable[Dict]) -> int:
+        """레코드를 월별 파일로 추가 기록, 기록 건수 반환 (호출 1회 = 월별 파일 1개)"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        by_month: Dict[str, List[Dict]] = {}
+        for record in records:
+            row = _archive_row(record)
+            by_month.setdefault(row["diagnosis_date"].strftime("%Y-%m"), []).append(row)
+
+        schema = archive_schema()
+        written = 0
+        for month, rows in by_month.items():
+            table = pa.Table.from_pylist(rows, schema=schema)
+            table = table.sort_by([(key, "ascending") for key in SORT_KEYS])
+            directory = os.path.join(self.root, f"{PARTITION_KEY}={month}")
+            os.makedirs(directory, exist_ok=True)
+            name = f"part-{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+            pq.write_table(table, os.path.join(directory, name), row_group_size=64 * 1024,
+                           use_dictionary=list(FILTER_FIELDS), compression="zstd")
+            written += len(rows)
+        return written
+
+    # ── 조회 ────────────────────────────────────────────────
+
+    def dataset(self):
+        """pyarrow.dataset 객체 (month 하이브 파티션)"""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+        return ds.dataset(self.root, format="parquet", partitioning=partitioning,
+                          schema=archive_schema().append(pa.field(PARTITION_KEY, pa.string())))
+
+    def build_filter(self, month_from: str = None, month_to: str = None,
+                     min_total_pct: float = None, max_total_pct: float = None, **fields):
+        """
+        조회 조건식 구성
+
+        fields: FILTER_FIELDS 컬럼 = 값 또는 값 목록 (예: revenue="100~300억", risk_level=["경계", "위험"]).
+        month_from / month_to: "YYYY-MM" (파티션 가지치기).
+        """
+        import pyarrow.compute as pc
+
+        conditions = []
+        for name, value in fields.items():
+            if name not in FILTER_FIELDS:
+                raise ValueError(f"unknown filter field: {name!r} (expected one of {FILTER_FIELDS})")
+            if value is not None:
+                conditions.append(_field_filter(name, value))
+        if month_from:
+            conditions.append(pc.field(PARTITION_KEY) >= month_from)
+        if month_to:
+            conditions.append(pc.field(PARTITION_KEY) <= month_to)
+        if min_total_pct is not None:
+            conditions.append(pc.field("total_pct") >= min_total_pct)
+        if max_total_pct is not None:
+            conditions.append(pc.field("total_pct") <= max_total_pct)
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def query(self, columns: Sequence[str] = None, **conditions) -> "pa.Table":
+        """조건에 맞는 진단 이력 (conditions = build_filter() 인자)"""
+        if not os.path.isdir(self.root):
+            return archive_schema().empty_table()
+        return self.dataset().to_table(columns=list(columns) if columns else None,
+                                       filter=self.build_filter(**conditions))
+
+    def max_id(self) -> int:
+        """
+        아카이브에 기록된 최대 진단 id (비어 있으면 0) — 증분 내보내기 기준점
+
+        파일 footer 의 row group 통계(id 최대값)만 읽으므로 아카이브 크기와 무관하게 파일 수에 비례합니다.
+        통계가 없는 파일만 id 컬럼을 읽습니다.
+        """
+        import pyarrow.compute as pc
+
+        if not os.path.isdir(self.root):
+            return 0
+        max_id = 0
+        for fragment in self.dataset().get_fragments():
+            for row_group in fragment.row_groups:
+                statistics = row_group.statistics.get("id")
+                if statistics is None or statistics.get("max") is None:
+                    max_id = max(max_id, pc.max(fragment.to_table(columns=["id"]).column("id")).as_py() or 0)
+                    break
+                max_id = max(max_id, statistics["max"])
+        return max_id
+
+    def count(self, **conditions) -> int:
+        """조건에 맞는 진단 건수"""
+        if not os.path.isdir(self.root):
+            return 0
+        return self.dataset().count_rows(filter=self.build_filter(**conditions))
+
+def export_store(store, archive: DiagnosisArchive, after_id: int = None, chunk_size: int = 50_000) -> int:
+    """
+    SQLite 저장소에서 id > after_id 인 진단을 아카이브로 내보내기, 내보낸 건수 반환
+
+    after_id 를 생략하면 아카이브의 최대 id 이후만 내보냄 (반복 실행해도 중복 기록 없음).
+    """
+    if after_id is None:
+        after_id = archive.max_id()
+    total = 0
+    for records in store.iter_records(after_id=after_id, chunk_size=chunk_size):
+        total += archive.append(records)
+    return total
+
+def check_export(records: int = 50) -> int:
+    """임시 저장소 → 임시 아카이브로 두 번 내보내기: 두 번째는 0건, 아카이브는 records 건이어야 함"""
+    from .scoring import calculate_all_scores
+    from .store import DiagnosisStore, build_record
+
+    section_answers = (["예"] * 6, ["아니오"] * 6, ["보통", "모름", "아니오"], ["부분적 영향"] * 3)
+    scores = calculate_all_scores(*section_answers)
+    with tempfile.TemporaryDirectory() as directory:
+        store = DiagnosisStore(os.path.join(directory, "check.db"))
+        store.save_many(build_record({"company": f"check-{i}"}, section_answers, scores, [])
+                        for i in range(records))
+        archive = DiagnosisArchive(os.path.join(directory, "archive"))
+        first = export_store(store, archive)
+        second = export_store(store, archive)
+        archived = archive.count()
+    ok = first == records and second == 0 and archived == records
+    print(f"{'archive export':<14} {'OK' if ok else 'FAIL'} "
+          f"(first {first:,}, second {second:,}, archived {archived:,} / {records:,})")
+    return 0 if ok else 1
+
+def main(argv: Sequence[str] = None) -> int:
+    from .store import DiagnosisStore
+
+    parser = argparse.ArgumentParser(description="GFC 진단 이력 아카이브")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="SQLite 저장소 → Parquet 아카이브")
+    export.add_argument("db", help="SQLite 저장소 경로")
+    export.add_argument("archive", nargs="?", default=DEFAULT_ARCHIVE_DIR, help="아카이브 디렉터리")
+    export.add_argument("--after-id", type=int, default=None,
+                        help="이 id 이후 진단만 내보내기 (기본: 아카이브의 최대 id)")
+    check = commands.add_parser("check", help="임시 저장소로 내보내기를 두 번 실행해 중복 기록이 없는지 검증")
+    check.add_argument("--records", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        return check_export(args.records)
+    # DiagnosisStore 는 없는 경로에 빈 저장소를 새로 만드므로 미리 확인
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db}")
+
+    exported = export_store(DiagnosisStore(args.db), DiagnosisArchive(args.archive), args.after_id)
+    print(f"{exported:,} diagnoses → {args.archive}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
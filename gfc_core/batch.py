@@ -0,0 +1,298 @@
+"""
+헤드리스 일괄 진단 실행기
+
+고객 목록(CSV / Parquet)을 청크 단위로 읽어 점수 · 우선 대응 항목 · 추천 솔루션을 계산하고,
+결과를 청크마다 바로 기록하므로 입력 크기와 무관하게 메모리 사용량이 일정합니다.
+--workers N 지정 시 입력을 약 --chunk-size 행 단위 샤드(CSV = 줄 경계에 맞춘 바이트 구간,
+Parquet = record batch — row group 하나짜리 파일도 나뉨)로 나눠 프로세스 풀에서 병렬 계산하고,
+결과는 입력 순서대로 기록합니다. 동시에 처리 · 대기하는 샤드는 워커 수의 SHARD_WINDOW 배로 제한되므로
+기록이 계산보다 느려도 메모리 사용량이 입력 크기에 비례해 늘지 않습니다.
+
+입력 열: company, industry, ceo, est, employees, revenue (선택) + 문항 응답 열
+         km_1..km_6, cr_1..cr_6, aw_1..aw_3, sc_1..sc_3 (진단 탭 선택지 텍스트)
+실행: python -m gfc_core.batch in.csv out.parquet [--chunk-size 50000] [--schema v2] [--workers 32]
+"""
+
+import argparse
+import csv
+import io
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .priority import top_k_batch
+from .schema import LEGACY_POOLED_SCHEMA, LEGACY_SCHEMA, SCHEMA, QuestionSchema
+from .scoring import get_risk_level, score_batch
+from .questions import SOLUTIONS
+from .solutions import solutions_for_masks
+
+DEFAULT_CHUNK_SIZE = 50_000
+# 병렬 모드 CSV 샤드 행 수 추정용 표본 크기 (바이트)
+CSV_SAMPLE_BYTES = 256 * 1024
+# 병렬 모드 동시 처리 · 대기 샤드 수 = 워커 수 × SHARD_WINDOW
+SHARD_WINDOW = 2
+
+SCHEMAS = {
+    "v2": SCHEMA,
+    "legacy": LEGACY_SCHEMA,
+    "legacy-pooled": LEGACY_POOLED_SCHEMA,
+}
+
+INFO_COLUMNS = ("company", "industry", "ceo", "est", "employees", "revenue")
+SCORE_COLUMNS = ("km_pct", "cr_pct", "aw_pct", "sc_pct", "total_pct")
+RESULT_COLUMNS = ("risk_level", "priority", "solutions")
+OUTPUT_COLUMNS = INFO_COLUMNS + SCORE_COLUMNS + RESULT_COLUMNS
+
+# 다중 항목 열 구분자
+LIST_SEPARATOR = " | "
+
+def answer_columns(schema: QuestionSchema = SCHEMA) -> List[str]:
+    """문항 응답 열 이름 (km_1, ..., sc_3)"""
+    return [f"{section.key}_{i + 1}"
+            for section in schema.sections
+            for i in range(section.stop - section.start)]
+
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith(".parquet")
+
+# ═══════════════════════════════════════════════════════════
+# READERS
+# ═══════════════════════════════════════════════════════════
+
+def iter_csv_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """CSV 를 chunk_size 행 단위로 읽기"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        chunk = []
+        for row in csv.DictReader(f):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def iter_parquet_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Parquet 을 chunk_size 행 단위로 읽기"""
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+def iter_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """확장자에 따라 CSV / Parquet 리더 선택"""
+    if _is_parquet(path):
+        return iter_parquet_chunks(path, chunk_size)
+    return iter_csv_chunks(path, chunk_size)
+
+# ═══════════════════════════════════════════════════════════
+# WRITERS
+# ═══════════════════════════════════════════════════════════
+
+class CsvResultWriter:
+    """결과 CSV 증분 기록"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.DictWriter(self._file, fieldnames=OUTPUT_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, rows: List[Dict]):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+class ParquetResultWriter:
+    """결과 Parquet 증분 기록 (청크 = row group)"""
+
+    def __init__(self, path: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [(name, pa.string()) for name in INFO_COLUMNS]
+            + [(name, pa.float64()) for name in SCORE_COLUMNS]
+            + [(name, pa.string()) for name in RESULT_COLUMNS]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows: List[Dict]):
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+def open_writer(path: str):
+    """확장자에 따라 CSV / Parquet 라이터 선택"""
+    if _is_parquet(path):
+        return ParquetResultWriter(path)
+    return CsvResultWriter(path)
+
+# ═══════════════════════════════════════════════════════════
+# SCORING
+# ═══════════════════════════════════════════════════════════
+
+def encode_rows(rows: Sequence[Dict], schema: QuestionSchema = SCHEMA) -> np.ndarray:
+    """입력 행의 응답 텍스트를 (행 수, 문항 수) int8 선택지 인덱스 행렬로 변환"""
+    columns = answer_columns(schema)
+    codes = np.empty((len(rows), len(columns)), dtype=np.int8)
+    for r, row in enumerate(rows):
+        for i, column in enumerate(columns):
+            codes[r, i] = schema.option_index[i].get(row.get(column), -1)
+    return codes
+
+def score_rows(rows: Sequence[Dict], schema: QuestionSchema = SCHEMA) -> List[Dict]:
+    """청크 단위 점수 계산 + 우선 대응 항목 · 추천 솔루션 부착"""
+    scores = score_batch(encode_rows(rows, schema), schema)
+    pct_columns = {name: scores[name].tolist() for name in SCORE_COLUMNS}
+    top_items = top_k_batch(scores["item_scores"], schema).tolist()
+    recommended = solutions_for_masks(scores["risk_mask"], schema).tolist()
+
+    results = []
+    for r, row in enumerate(rows):
+        result = {name: ("" if row.get(name) is None else str(row.get(name))) for name in INFO_COLUMNS}
+        for name in SCORE_COLUMNS:
+            result[name] = pct_columns[name][r]
+        result["risk_level"] = get_risk_level(result["total_pct"])[0]
+        result["priority"] = LIST_SEPARATOR.join(schema.texts[i] for i in top_items[r] if i >= 0)
+        result["solutions"] = LIST_SEPARATOR.join(solution["name"] for solution, hit
+                                                  in zip(SOLUTIONS, recommended[r]) if hit)
+        results.append(result)
+    return results
+
+# ═══════════════════════════════════════════════════════════
+# PARALLEL SHARDS
+# ═══════════════════════════════════════════════════════════
+
+def csv_row_bytes(path: str, sample_bytes: int = CSV_SAMPLE_BYTES) -> float:
+    """CSV 데이터 행의 평균 바이트 수 (파일 앞부분 표본 기준)"""
+    with open(path, "rb") as f:
+        f.readline()
+        lines = f.read(sample_bytes).splitlines(keepends=True)
+    # 표본 끝의 잘린 줄은 제외 (파일 끝이면 그대로 사용)
+    if len(lines) > 1:
+        lines = lines[:-1]
+    return sum(map(len, lines)) / len(lines) if lines else 1.0
+
+def csv_shards(path: str, shard_bytes: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """CSV 헤더와 줄 경계에 맞춘 (시작, 끝) 바이트 구간 목록 (셀 내부 줄바꿈 미지원)"""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        ranges = []
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + shard_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+def parquet_shards(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """Parquet 을 chunk_size 행 record batch 로 차례로 읽기 (row group 크기와 무관, 워커로 전달)"""
+    import pyarrow.parquet as pq
+
+    yield from pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+
+# 워커 프로세스별 스키마 (initializer 에서 1회 설정)
+_worker_schema: QuestionSchema = None
+
+def _init_worker(schema_name: str):
+    global _worker_schema
+    _worker_schema = SCHEMAS[schema_name]
+
+def _score_csv_shard(task: Tuple[str, List[str], int, int]) -> List[Dict]:
+    path, header, start, end = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=header))
+    return score_rows(rows, _worker_schema)
+
+def _score_parquet_shard(batch) -> List[Dict]:
+    return score_rows(batch.to_pylist(), _worker_schema)
+
+def _schema_name(schema: QuestionSchema) -> str:
+    for name, candidate in SCHEMAS.items():
+        if candidate is schema:
+            return name
+    raise ValueError("parallel mode requires one of the named SCHEMAS")
+
+def _bounded_imap(pool, func: Callable, tasks: Iterable, window: int) -> Iterator:
+    """pool.imap 과 같은 순서로 결과 반환, 제출했지만 소비되지 않은 작업은 최대 window 개"""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+def iter_scored_shards(input_path: str, workers: int, schema: QuestionSchema = SCHEMA,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """약 chunk_size 행 샤드를 프로세스 풀에서 병렬 계산, 입력 순서대로 결과 반환"""
+    if _is_parquet(input_path):
+        tasks = parquet_shards(input_path, chunk_size)
+        func = _score_parquet_shard
+    else:
+        shard_bytes = max(1, int(csv_row_bytes(input_path) * chunk_size))
+        header, ranges = csv_shards(input_path, shard_bytes)
+        tasks = ((input_path, header, start, end) for start, end in ranges)
+        func = _score_csv_shard
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(_schema_name(schema),)) as pool:
+        yield from _bounded_imap(pool, func, tasks, workers * SHARD_WINDOW)
+
+def run_batch(input_path: str, output_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              schema: QuestionSchema = SCHEMA, workers: int = 1) -> int:
+    """입력 파일 전체를 진단하여 출력 파일에 기록, 처리 행 수 반환 (workers > 1 = 프로세스 풀)"""
+    if workers > 1:
+        scored = iter_scored_shards(input_path, workers, schema, chunk_size)
+    else:
+        scored = (score_rows(rows, schema) for rows in iter_chunks(input_path, chunk_size))
+
+    writer = open_writer(output_path)
+    total = 0
+    try:
+        for results in scored:
+            writer.write(results)
+            total += len(results)
+    finally:
+        writer.close()
+    return total
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="GFC 법인 리스크 일괄 진단")
+    parser.add_argument("input", help="입력 CSV / Parquet 경로")
+    parser.add_argument("output", help="출력 CSV / Parquet 경로")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="청크 행 수 (--workers > 1 이면 샤드 행 수, CSV 는 평균 행 크기로 추정)")
+    parser.add_argument("--schema", choices=sorted(SCHEMAS), default="v2",
+                        help="문항 구성 (v2 = ssgfc.py)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="병렬 프로세스 수 (0 = CPU 코어 수)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"input not found: {args.input}")
+
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    rows = run_batch(args.input, args.output, args.chunk_size, SCHEMAS[args.schema], workers)
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"{rows:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s) → {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+브라우저 채점 컴포넌트
+
+진단 문항 선택 · 섹션 / 종합 리스크율 계산 · 요약 표시를 iframe 안에서 처리하는 Streamlit 커스텀
+컴포넌트입니다 (frontend/index.html, 빌드 단계 없음). 응답을 클릭할 때마다 웹소켓 왕복 · 스크립트
+재실행이 일어나지 않고, 반영 시점(반영 버튼 또는 입력이 sync_delay ms 동안 멈춘 뒤)에만
+응답 코드와 점수를 서버로 보냅니다. 서버는 받은 응답 코드로 점수를 다시 계산하므로
+(IncrementalScorer, 바뀐 문항만) 브라우저가 보낸 점수는 표시 · 검증용입니다.
+
+브라우저 채점 로직(frontend/scoring.js)은 client_schema() 를 입력으로 score_codes() 와 같은 순서로
+합산하며, tests/test_parity.py 가 node 로 실행해 결과가 일치하는지 확인합니다.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+from .questions import RISK_LEVELS, WEIGHT_COLORS
+from .schema import SCHEMA, QuestionSchema
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+SCORING_JS = os.path.join(FRONTEND_DIR, "scoring.js")
+COMPONENT_NAME = "gfc_diagnosis"
+# 마지막 응답 선택 후 자동 반영까지 대기 시간 (0 = 반영 버튼으로만 전송)
+SYNC_DELAY_MS = 1500
+
+def client_schema(schema: QuestionSchema = SCHEMA) -> Dict:
+    """브라우저 채점용 스키마 (문항 · 선택지 점수 · 섹션 구간 · 리스크 레벨 · 가중치 색상, JSON 직렬화 가능)"""
+    return {
+        "sections": [
+            {"key": section.key, "name": section.name, "start": section.start, "stop": section.stop,
+             "total_weight": section.total_weight}
+            for section in schema.sections
+        ],
+        # option_scores 의 마지막 원소(미정의 응답 0점)는 제외 — 브라우저는 범위 밖 코드를 0점으로 처리
+        "questions": [
+            {"text": text, "weight": weight, "options": list(options), "scores": list(scores[:-1])}
+            for text, weight, options, scores in zip(schema.texts, schema.weights, schema.options,
+                                                     schema.option_scores)
+        ],
+        "total_weight": schema.total_weight,
+        "total_mode": schema.total_mode,
+        "risk_levels": [{"name": level.name, "color": level.color, "threshold": level.threshold}
+                        for level in RISK_LEVELS],
+        "weight_colors": {str(weight): color for weight, color in WEIGHT_COLORS.items()},
+    }
+
+@lru_cache(maxsize=None)
+def client_schema_json(schema: QuestionSchema = SCHEMA) -> str:
+    """client_schema() JSON (스키마당 1회 직렬화 — 매 rerun 같은 문자열이므로 브라우저 메시지 캐시 대상)"""
+    return json.dumps(client_schema(schema), ensure_ascii=False, separators=(",", ":"))
+
+@lru_cache(maxsize=None)
+def _declare_component():
+    import streamlit.components.v1 as components
+
+    return components.declare_component(COMPONENT_NAME, path=FRONTEND_DIR)
+
+def diagnosis_component(sections: Mapping[str, Tuple[str, str, str]], codes: Sequence[int],
+                        numbered: Sequence[str] = (), sync_delay: int = SYNC_DELAY_MS,
+                        schema: QuestionSchema = SCHEMA, key: str = None) -> Optional[Dict]:
+    """
+    브라우저 채점 진단 컴포넌트 출력
+
+    sections: 섹션 키 → (제목, 안내 문구 HTML, 요약 라벨), codes: 현재 응답 (문항 순서 선택지 인덱스, 미응답 = -1),
+    numbered: 문항 번호를 붙일 섹션 키. 반환: 마지막 반영 값 {"id", "codes", "scores"} (반영 전 None).
+    codes 가 바뀌면(불러오기 등) 브라우저 응답도 그 값으로 바뀝니다.
+    """
+    return _declare_component()(
+        schema=client_schema_json(schema),
+        sections={section_key: {"title": title, "note": note, "label": label}
+                  for section_key, (title, note, label) in sections.items()},
+        numbered=list(numbered),
+        codes=list(codes),
+        sync_delay=sync_delay,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,318 @@
+"""
+상담 스크립트 문서 내보내기 (Markdown · DOCX · PDF)
+
+.txt 와 같은 스크립트 모델(ConsultationScript) 을 문서 블록 목록으로 펼친 뒤 형식별로 변환합니다.
+브라우저 없이 서버에서 생성하며 배치 파이프라인에서도 그대로 사용할 수 있습니다.
+
+- Markdown · DOCX: 표준 라이브러리만 사용 (DOCX 는 OOXML 패키지를 직접 구성)
+- PDF: reportlab 필요 (pip install reportlab). 한글 TrueType 폰트는 프로세스당 1회 등록되어
+  이후 모든 문서에서 재사용되며 문서마다 사용 글자만 서브셋으로 내장됩니다.
+  폰트 경로는 GFC_PDF_FONT 환경 변수 또는 PDF_FONT_CANDIDATES 순서로 찾습니다
+  (앱 폰트 디렉터리 static/fonts/NotoSansKR-Regular.ttf → 시스템 한글 폰트). 한글 폰트가 없으면
+  뷰어에 의존하는 비내장 폰트로 대체하지 않고 PdfFontNotFound 를 발생시킵니다.
+
+실행: python -m gfc_core.export 입력.csv 스크립트.zip --format pdf [--schema v2]
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+import zipfile
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from .schema import SCHEMA, QuestionSchema
+from .script import (
+    CLOSING_TEXT,
+    SECTION_TITLES,
+    ConsultationScript,
+    build_script_model,
+    intro_text,
+)
+from .theme import FONT_DIR
+
+EXPORT_FORMATS = ("md", "docx", "pdf")
+MIME_TYPES = {
+    "md": "text/markdown",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+DOCX_FONT = "맑은 고딕"
+PDF_FONT_NAME = "GFCKorean"
+PDF_FONT_CANDIDATES = (
+    os.path.join(FONT_DIR, "NotoSansKR-Regular.ttf"),
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansKR-Regular.ttf",
+    "/Library/Fonts/AppleGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+)
+
+# 문서 블록 종류
+TITLE, META, HEADING, SUBHEADING, ITEM, PARAGRAPH = "title", "meta", "heading", "subheading", "item", "paragraph"
+
+def script_blocks(script: ConsultationScript) -> List[Tuple[str, str]]:
+    """스크립트 모델 → (블록 종류, 텍스트) 목록 (.txt 와 같은 순서 · 문구)"""
+    blocks = [
+        (TITLE, "GFC 상담 스크립트"),
+        (PARAGRAPH, "삼성생명 기업재무컨설팅 · 진단 기반 자동생성"),
+        (META, f"기업명: {script.company}"),
+        (META, f"업종: {script.industry}"),
+        (META, f"종업원 수: {script.employees}명"),
+        (META, f"대표자: {script.ceo}"),
+        (META, f"설립 연차: {script.est}"),
+        (META, f"연 매출: {script.revenue}"),
+        (META, f"진단 충족율: {script.total_pct:.0f}% ({script.risk_label})"),
+        (META, f"생성일: {script.generated_at}"),
+        (HEADING, f"1. {SECTION_TITLES[0]}"),
+    ]
+    blocks.extend((PARAGRAPH, paragraph) for paragraph in _paragraphs(intro_text(script)))
+    blocks.append((HEADING, f"2. {SECTION_TITLES[1]}"))
+    for section, items in script.sections:
+        blocks.append((SUBHEADING, f"▸ {section} ({len(items)}건 해당)"))
+        blocks.extend((ITEM, f"[가중치 {item.weight}] {item.text} — 응답: {item.response}") for item in items)
+    blocks.append((HEADING, f"3. {SECTION_TITLES[2]}"))
+    blocks.extend((ITEM, f"{solution.icon} {solution.name}: {solution.desc}") for solution in script.solutions)
+    blocks.append((HEADING, f"4. {SECTION_TITLES[3]}"))
+    blocks.extend((PARAGRAPH, paragraph) for paragraph in _paragraphs(CLOSING_TEXT))
+    return blocks
+
+def _paragraphs(text: str) -> List[str]:
+    """빈 줄 기준 문단 (문단 내 줄바꿈은 공백으로)"""
+    return [" ".join(chunk.split("\n")) for chunk in text.strip().split("\n\n")]
+
+# ═══════════════════════════════════════════════════════════
+# MARKDOWN
+# ═══════════════════════════════════════════════════════════
+
+_MD_ESCAPE = re.compile(r"([\\`*_\[\]#|<>])")
+_MD_HEADINGS = {TITLE: "#", HEADING: "##", SUBHEADING: "###"}
+
+def script_markdown(script: ConsultationScript) -> str:
+    """Markdown 문서"""
+    lines = []
+    for kind, text in script_blocks(script):
+        text = _MD_ESCAPE.sub(r"\\\1", text)
+        if kind in (TITLE, HEADING, SUBHEADING):
+            if lines and lines[-1]:
+                lines.append("")
+            lines += [f"{_MD_HEADINGS[kind]} {text}", ""]
+        elif kind in (META, ITEM):
+            lines.append(f"- {text}")
+        else:
+            lines += [text, ""]
+    return "\n".join(lines).strip() + "\n"
+
+# ═══════════════════════════════════════════════════════════
+# DOCX (OOXML)
+# ═══════════════════════════════════════════════════════════
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+_DOCX_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/></Relationships>'
+)
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+def _docx_style(style_id: str, name: str, size: int, bold: bool = False, color: str = None,
+                before: int = 0, after: int = 120) -> str:
+    run = (f'<w:rFonts w:ascii="{DOCX_FONT}" w:hAnsi="{DOCX_FONT}" w:eastAsia="{DOCX_FONT}"/>'
+           + ("<w:b/>" if bold else "") + (f'<w:color w:val="{color}"/>' if color else "")
+           + f'<w:sz w:val="{size}"/><w:szCs w:val="{size}"/>')
+    return (f'<w:style w:type="paragraph" w:styleId="{style_id}"><w:name w:val="{name}"/>'
+            f'<w:pPr><w:spacing w:before="{before}" w:after="{after}"/></w:pPr><w:rPr>{run}</w:rPr></w:style>')
+
+_DOCX_STYLES = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {_W_NS}>'
+    + _docx_style("Normal", "Normal", 21)
+    + _docx_style("Title", "Title", 36, bold=True, color="0F1623", after=200)
+    + _docx_style("Heading1", "heading 1", 28, bold=True, color="00A383", before=280)
+    + _docx_style("Heading2", "heading 2", 23, bold=True, color="1E3A5F", before=160)
+    + _docx_style("ListItem", "List Item", 21, after=60)
+    + "</w:styles>"
+)
+_DOCX_STYLE_IDS = {TITLE: "Title", HEADING: "Heading1", SUBHEADING: "Heading2",
+                   META: "ListItem", ITEM: "ListItem", PARAGRAPH: "Normal"}
+
+def _docx_paragraph(kind: str, text: str) -> str:
+    if kind == ITEM:
+        text = f"• {text}"
+    return (f'<w:p><w:pPr><w:pStyle w:val="{_DOCX_STYLE_IDS[kind]}"/></w:pPr>'
+            f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>')
+
+def script_docx(script: ConsultationScript) -> bytes:
+    """DOCX 문서 (Word · 한글 · LibreOffice 호환 최소 OOXML 패키지)"""
+    body = "".join(_docx_paragraph(kind, text) for kind, text in script_blocks(script))
+    document = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {_W_NS}><w:body>'
+                f'{body}<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+                f'<w:pgMar w:top="1440" w:right="1300" w:bottom="1440" w:left="1300"/></w:sectPr>'
+                f'</w:body></w:document>')
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        package.writestr("_rels/.rels", _DOCX_RELS)
+        package.writestr("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS)
+        package.writestr("word/styles.xml", _DOCX_STYLES)
+        package.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+# ═══════════════════════════════════════════════════════════
+# PDF (reportlab)
+# ═══════════════════════════════════════════════════════════
+
+# 한글 폰트에 없는 이모지 · 기호 (PDF 에서는 제거)
+_NON_BMP = re.compile("[\U00010000-\U0010ffff\u2600-\u27bf\ufe0f\u200d]")
+
+class PdfFontNotFound(RuntimeError):
+    """PDF 에 내장할 한글 TrueType 폰트를 찾지 못함"""
+
+def find_pdf_font() -> str:
+    """PDF 용 한글 TrueType 폰트 경로 (없으면 빈 문자열)"""
+    configured = os.environ.get("GFC_PDF_FONT", "")
+    for path in (configured,) + PDF_FONT_CANDIDATES:
+        if path and os.path.exists(path):
+            return path
+    return ""
+
+def pdf_font(font_path: str = None) -> str:
+    """한글 폰트 등록 이름 (font_path 생략 시 find_pdf_font(), 없으면 PdfFontNotFound)"""
+    font_path = font_path or find_pdf_font()
+    if not font_path:
+        raise PdfFontNotFound(
+            "Korean TrueType font not found for PDF export: set GFC_PDF_FONT or install one of "
+            + ", ".join(PDF_FONT_CANDIDATES)
+        )
+    return _register_pdf_font(os.path.abspath(font_path))
+
+@lru_cache(maxsize=None)
+def _register_pdf_font(font_path: str) -> str:
+    # 경로별 이름으로 등록 (프로세스당 경로마다 1회, 다른 폰트 경로가 같은 이름을 덮어쓰지 않음)
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    name = f"{PDF_FONT_NAME}-{hashlib.sha1(font_path.encode('utf-8')).hexdigest()[:8]}"
+    pdfmetrics.registerFont(TTFont(name, font_path))
+    return name
+
+@lru_cache(maxsize=None)
+def _pdf_styles(font: str) -> Dict:
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.styles import ParagraphStyle
+
+    normal = ParagraphStyle("Normal", fontName=font, fontSize=10.5, leading=16, spaceAfter=6,
+                            wordWrap="CJK")
+    return {
+        TITLE: ParagraphStyle("Title", parent=normal, fontSize=18, leading=24, spaceAfter=4),
+        HEADING: ParagraphStyle("Heading", parent=normal, fontSize=13, leading=18, spaceBefore=12,
+                                textColor=HexColor("#00a383")),
+        SUBHEADING: ParagraphStyle("Subheading", parent=normal, fontSize=11.5, spaceBefore=6,
+                                   textColor=HexColor("#1e3a5f")),
+        META: ParagraphStyle("Meta", parent=normal, spaceAfter=1, leftIndent=8),
+        ITEM: ParagraphStyle("Item", parent=normal, leftIndent=12, bulletIndent=2, spaceAfter=3),
+        PARAGRAPH: normal,
+    }
+
+def script_pdf(script: ConsultationScript, font_path: str = None) -> bytes:
+    """PDF 문서 (A4, 한글 폰트 서브셋 내장)"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+    styles = _pdf_styles(pdf_font(font_path))
+    flowables = []
+    for kind, text in script_blocks(script):
+        text = escape(_NON_BMP.sub("", text)).strip()
+        flowables.append(Paragraph(text, styles[kind], bulletText="•" if kind == ITEM else None))
+
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=20 * mm, rightMargin=20 * mm,
+                                 topMargin=18 * mm, bottomMargin=18 * mm,
+                                 title=f"GFC 상담 스크립트 | {script.company}", author="삼성생명 GFC")
+    document.build(flowables)
+    return buffer.getvalue()
+
+EXPORTERS: Dict[str, Callable[[ConsultationScript], object]] = {
+    "md": script_markdown,
+    "docx": script_docx,
+    "pdf": script_pdf,
+}
+
+def export_script(script: ConsultationScript, fmt: str) -> bytes:
+    """형식별 문서 바이트 (md = UTF-8)"""
+    if fmt not in EXPORTERS:
+        raise ValueError(f"unknown export format: {fmt!r} (expected one of {EXPORT_FORMATS})")
+    document = EXPORTERS[fmt](script)
+    return document.encode("utf-8") if isinstance(document, str) else document
+
+# ═══════════════════════════════════════════════════════════
+# BULK
+# ═══════════════════════════════════════════════════════════
+
+def write_script_zip(input_path: str, output_path: str, fmt: str, schema: QuestionSchema = SCHEMA,
+                     chunk_size: int = 2_000) -> int:
+    """배치 입력 전체를 기업별 스크립트 문서로 zip 에 기록, 문서 수 반환"""
+    from .batch import iter_chunks
+    from .report import iter_report_inputs, report_filename
+
+    generated_at = datetime.now()
+    total = 0
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for rows in iter_chunks(input_path, chunk_size):
+            for info, scores, priority_items, solutions in iter_report_inputs(rows, schema):
+                total += 1
+                script = build_script_model(info, scores, priority_items, solutions, "○○(주)", generated_at)
+                name = report_filename(total, info)[:-len(".html")] + f".{fmt}"
+                archive.writestr(name, export_script(script, fmt))
+    return total
+
+def main(argv: Sequence[str] = None) -> int:
+    from .batch import SCHEMAS
+
+    parser = argparse.ArgumentParser(description="GFC 상담 스크립트 문서 일괄 생성")
+    parser.add_argument("input", help="입력 CSV / Parquet 경로 (gfc_core.batch 입력 형식)")
+    parser.add_argument("output", help="출력 zip 경로")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="pdf")
+    parser.add_argument("--schema", choices=sorted(SCHEMAS), default="v2",
+                        help="문항 구성 (v2 = ssgfc.py)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"input not found: {args.input}")
+    if args.format == "pdf" and not find_pdf_font():
+        parser.error("no Korean TrueType font for PDF export (set GFC_PDF_FONT)")
+
+    started = time.perf_counter()
+    documents = write_script_zip(args.input, args.output, args.format, SCHEMAS[args.schema])
+    elapsed = time.perf_counter() - started
+    rate = documents / elapsed if elapsed > 0 else 0.0
+    print(f"{documents:,} {args.format} documents in {elapsed:.2f}s ({rate:,.0f}/s) → {args.output}",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
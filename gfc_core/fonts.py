@@ -0,0 +1,131 @@
+"""
+self-hosted Noto Sans KR 서브셋 빌드 · 폰트 정적 파일 캐시 헤더
+
+앱 · gfc_core 소스에 등장하는 글자(질문 · 라벨 · 솔루션 문구)만 남긴 WOFF2 를 static/fonts/ 에 기록합니다.
+파일 이름에 내용 해시가 들어가므로 장기 캐시(immutable)해도 안전하며, 다시 빌드하면 이름이 바뀝니다.
+theme.font_face_css() 가 이 파일들로 @font-face 를 구성하고, Streamlit 은 server.enableStaticServing 으로
+static/ 을 app/static/ 경로에 제공합니다. Streamlit 정적 응답에는 Cache-Control 이 없으므로
+gfc_app.py (st.App) 로 실행하면 FontCacheMiddleware 가 장기 캐시 헤더를 붙입니다.
+
+빌드: pip install fonttools brotli
+      python -m gfc_core.fonts build NotoSansKR-VariableFont_wght.ttf   (또는 굵기별 정적 폰트 여러 개)
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import os
+import sys
+from typing import Iterable, Sequence
+
+from . import APP_DIR
+from .theme import FONT_DIR, FONT_FILE_PATTERN, FONT_FILE_PREFIX
+
+FONT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+FONT_PATH_MARKER = "/app/static/fonts/"
+# 글자를 수집할 소스 (APP_DIR 기준)
+TEXT_SOURCES = ("*.py", os.path.join("gfc_core", "*.py"))
+# 입력값(숫자 · 영문 회사명 등)용으로 항상 포함
+BASE_TEXT = "".join(chr(code) for code in range(0x20, 0x7F))
+
+def _font_char(char: str) -> bool:
+    # 제어 문자 · 이모지 · 변형 선택자는 제외 (Noto Sans KR 에 없음)
+    code = ord(char)
+    return 0x20 <= code < 0x1F000 and not 0xFE00 <= code <= 0xFE0F
+
+def font_text(paths: Iterable[str] = None) -> str:
+    """서브셋에 포함할 글자 (소스에 등장하는 문자 + 출력 가능한 ASCII)"""
+    if paths is None:
+        paths = sorted(path for pattern in TEXT_SOURCES for path in glob.glob(os.path.join(APP_DIR, pattern)))
+    chars = set(BASE_TEXT)
+    for path in paths:
+        with open(path, encoding="utf-8") as source:
+            chars.update(char for char in source.read() if _font_char(char))
+    return "".join(sorted(chars))
+
+def _weight(font) -> str:
+    """파일 이름용 굵기 (가변 폰트는 wght 축 범위, 예: 100-900)"""
+    if "fvar" in font:
+        for axis in font["fvar"].axes:
+            if axis.axisTag == "wght":
+                return f"{axis.minValue:.0f}-{axis.maxValue:.0f}"
+    return str(font["OS/2"].usWeightClass)
+
+def build_subset(source: str, text: str, output_dir: str = FONT_DIR) -> str:
+    """source 폰트 → text 만 포함한 WOFF2 (같은 굵기의 이전 빌드 파일은 삭제), 생성 경로 반환"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.hinting = False
+    options.desubroutinize = True
+    options.name_IDs = [1, 2]
+    font = TTFont(source)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    data = buffer.getvalue()
+
+    weight = _weight(font)
+    os.makedirs(output_dir, exist_ok=True)
+    for name in os.listdir(output_dir):
+        match = FONT_FILE_PATTERN.match(name)
+        if match and match.group(1) == weight:
+            os.remove(os.path.join(output_dir, name))
+    path = os.path.join(output_dir, f"{FONT_FILE_PREFIX}-{weight}.{hashlib.sha256(data).hexdigest()[:8]}.woff2")
+    with open(path, "wb") as output:
+        output.write(data)
+    return path
+
+class FontCacheMiddleware:
+    """app/static/fonts/ 응답에 장기 캐시 헤더를 붙이는 ASGI 미들웨어 (st.App middleware 용)"""
+
+    def __init__(self, app, cache_control: str = FONT_CACHE_CONTROL):
+        self.app = app
+        self.cache_control = cache_control.encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or FONT_PATH_MARKER not in scope["path"]:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [(name, value) for name, value in message.get("headers", [])
+                           if name.lower() != b"cache-control"]
+                headers.append((b"cache-control", self.cache_control))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="self-hosted Noto Sans KR 서브셋 빌드")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="원본 폰트 → static/fonts 서브셋 WOFF2")
+    build.add_argument("sources", nargs="+", help="Noto Sans KR 원본 (가변 폰트 1개 또는 굵기별 정적 폰트)")
+    build.add_argument("--out", default=FONT_DIR, help="출력 디렉터리")
+    build.add_argument("--extra-text", default="", help="추가로 포함할 글자")
+    commands.add_parser("text", help="서브셋에 포함될 글자 출력")
+    args = parser.parse_args(argv)
+
+    text = font_text()
+    if args.command == "text":
+        print(text)
+        return 0
+
+    text += args.extra_text
+    print(f"{len(text):,} characters", file=sys.stderr)
+    for source in args.sources:
+        path = build_subset(source, text, args.out)
+        print(f"{source} → {path} ({os.path.getsize(path) / 1024:,.1f} KB)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
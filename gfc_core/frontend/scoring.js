@@ -0,0 +1,65 @@
+/*
+ * GFC 브라우저 채점 엔진
+ *
+ * gfc_core.browser.client_schema() 로 내보낸 스키마와 문항별 선택지 인덱스(미응답 = -1)로
+ * gfc_core.scoring.score_codes() 와 같은 순서로 합산합니다 (결과 비트 단위 일치).
+ * 검증: python -m gfc_core.parity (node 가 있으면 이 파일을 실행해 Python 결과와 비교)
+ */
+(function (root, factory) {
+  if (typeof module === "object" && module.exports) {
+    module.exports = factory();
+  } else {
+    root.GFCScoring = factory();
+  }
+})(this, function () {
+  "use strict";
+
+  function optionScore(question, code) {
+    return code >= 0 && code < question.scores.length ? question.scores[code] : 0;
+  }
+
+  /* 섹션 · 종합 리스크율 ({key}_pct, total_pct) — finalize_scores 와 같은 계산 */
+  function scoreCodes(schema, codes) {
+    const result = {};
+    let totalWd = 0;
+    for (const section of schema.sections) {
+      let weightedSum = 0;
+      for (let i = section.start; i < section.stop; i++) {
+        weightedSum += optionScore(schema.questions[i], codes[i]) * schema.questions[i].weight;
+      }
+      totalWd += weightedSum;
+      result[section.key + "_pct"] = section.total_weight > 0 ? weightedSum / section.total_weight * 100 : 0;
+    }
+    if (schema.total_mode === "pooled") {
+      result.total_pct = schema.total_weight ? totalWd / schema.total_weight * 100 : 0;
+    } else {
+      let weightedPct = 0;
+      for (const section of schema.sections) {
+        weightedPct += result[section.key + "_pct"] * section.total_weight;
+      }
+      result.total_pct = schema.total_weight > 0 ? weightedPct / schema.total_weight : 0;
+    }
+    return result;
+  }
+
+  /* get_risk_level 과 같은 레벨 {name, color} */
+  function riskLevel(schema, percentage) {
+    for (const level of schema.risk_levels) {
+      if (percentage <= level.threshold) {
+        return level;
+      }
+    }
+    return schema.risk_levels[schema.risk_levels.length - 1];
+  }
+
+  /* Python f"{value:.0f}" 와 같은 표기 (정확히 .5 이면 짝수로 반올림) */
+  function formatPercent(value) {
+    let rounded = Math.round(value);
+    if (rounded - value === 0.5 && rounded % 2 !== 0) {
+      rounded -= 1;
+    }
+    return String(rounded);
+  }
+
+  return { scoreCodes: scoreCodes, riskLevel: riskLevel, formatPercent: formatPercent };
+});
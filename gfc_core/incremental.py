@@ -0,0 +1,99 @@
+"""
+증분 점수 계산 상태
+
+응답 하나가 바뀌면 해당 문항이 속한 섹션의 가중 점수 합계에 변화분만 더하고,
+우선 대응 항목 순위는 (-점수, -가중치, 문항 순서) 정렬 목록을 bisect 로 유지합니다.
+점수가 0 / 0.5 / 1.0 단위인 기본 문항에서는 가중 합계가 부동소수점으로 정확히 표현되므로
+calculate_all_scores · get_priority_items 결과와 비트 단위로 일치합니다.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Sequence, Tuple
+
+from .schema import SCHEMA, QuestionSchema
+from .scoring import finalize_scores
+from .solutions import solutions_for_mask
+
+class IncrementalScorer:
+    """문항 단위 응답 변경을 O(1) 로 반영하는 점수 상태 (세션당 1개)"""
+
+    def __init__(self, schema: QuestionSchema = SCHEMA):
+        self.schema = schema
+        self._codes: List[int] = [-1] * schema.question_count
+        self._section_of = schema.item_sections
+        self._section_sums: List[float] = [0] * len(schema.sections)
+        self._items: List[Dict] = [
+            {"text": schema.texts[i], "w": schema.weights[i], "score": 0.0,
+             "section": schema.sections[self._section_of[i]].name}
+            for i in range(schema.question_count)
+        ]
+        # 점수 > 0 인 문항의 정렬 키 (get_priority_items 의 안정 정렬과 동일한 순서)
+        self._ranking: List[Tuple[float, int, int]] = []
+        # 섹션별 점수 > 0 문항 수 (추천 솔루션 섹션 비트마스크용)
+        self._risky_counts: List[int] = [0] * len(schema.sections)
+
+    def _rank_key(self, index: int) -> Tuple[float, int, int]:
+        return -self._items[index]["score"], -self._items[index]["w"], index
+
+    def set_code(self, index: int, code: int) -> bool:
+        """문항 index 의 선택지 인덱스 변경 (미정의 = -1), 점수 변화 여부 반환"""
+        if code == self._codes[index]:
+            return False
+        self._codes[index] = code
+        old_score = self._items[index]["score"]
+        new_score = self.schema.option_scores[index][code]
+        if new_score == old_score:
+            return False
+
+        section = self._section_of[index]
+        if old_score > 0:
+            ranking = self._ranking
+            del ranking[bisect_left(ranking, self._rank_key(index))]
+            self._risky_counts[section] -= 1
+        self._section_sums[section] += (new_score - old_score) * self.schema.weights[index]
+        # 이전 결과의 all_items 가 바뀌지 않도록 항목은 교체
+        self._items[index] = {**self._items[index], "score": new_score}
+        if new_score > 0:
+            insort(self._ranking, self._rank_key(index))
+            self._risky_counts[section] += 1
+        return True
+
+    def set_answer(self, index: int, answer: str) -> bool:
+        """문항 index 의 응답 텍스트 변경, 점수 변화 여부 반환"""
+        return self.set_code(index, self.schema.option_index[index].get(answer, -1))
+
+    def update(self, section_answers: Sequence[Sequence[str]]) -> int:
+        """섹션별 전체 응답에서 바뀐 문항만 반영, 점수가 바뀐 문항 수 반환"""
+        changed = 0
+        for index, code in enumerate(self.schema.encode(section_answers)):
+            changed += self.set_code(index, code)
+        return changed
+
+    def update_section(self, key: str, answers: Sequence[str]) -> int:
+        """한 섹션의 응답에서 바뀐 문항만 반영, 점수가 바뀐 문항 수 반환 (섹션 단위 재실행용)"""
+        section = self.schema.section(key)
+        changed = 0
+        for index, answer in zip(range(section.start, section.stop), answers):
+            changed += self.set_answer(index, answer)
+        return changed
+
+    @property
+    def codes(self) -> Tuple[int, ...]:
+        """현재 선택지 인덱스 (문항 순서, 미응답 = -1) — 응답 해시 · 캐시 키용"""
+        return tuple(self._codes)
+
+    def scores(self) -> Dict:
+        """calculate_all_scores() 와 같은 형식의 결과"""
+        return finalize_scores(self._section_sums, list(self._items), self.schema)
+
+    def priority_items(self, limit: int = 5) -> List[Dict]:
+        """get_priority_items() 와 같은 우선 대응 항목"""
+        return [self._items[index] for _, _, index in self._ranking[:limit]]
+
+    def risk_mask(self) -> int:
+        """리스크가 있는 섹션 비트마스크"""
+        return sum(1 << k for k, count in enumerate(self._risky_counts) if count)
+
+    def recommended_solutions(self) -> List[Dict]:
+        """get_recommended_solutions() 와 같은 추천 솔루션"""
+        return solutions_for_mask(self.risk_mask(), self.schema)
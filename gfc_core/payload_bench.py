@@ -0,0 +1,129 @@
+"""
+rerun 당 웹소켓 전송량 측정
+
+Streamlit AppTest 로 앱을 실행하며 입력 시나리오(기본 정보 입력 → 응답 변경 → 화면 전환)를 재현하고,
+rerun 마다 서버가 보내는 ForwardMsg 바이트 수와 delta(요소 추가 · 갱신) 메시지 수를 집계합니다. 브라우저 메시지 캐시를 흉내 내어
+이전 rerun 에서 받은 캐시 대상 메시지(metadata.cacheable)는 해시 참조 크기로 계산합니다.
+
+실행 (저장소 루트에서): python -m gfc_core.payload_bench [--app ssgfc] [--min-cached-size 10000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+from unittest import mock
+
+from . import APP_DIR
+
+def _choose(key: str, index: int) -> Callable:
+    """라디오 key 의 index 번째 선택지를 고르는 조작"""
+    def action(app):
+        # fragment 재실행 뒤의 트리에는 해당 fragment 요소만 있으므로 필요하면 전체 트리를 다시 받음 (측정 제외)
+        if key not in [radio.key for radio in app.radio]:
+            app.run()
+        radio = app.radio(key=key)
+        radio.set_value(radio.options[index])
+    return action
+
+def _view(label: str) -> Callable:
+    """지연 탐색 모드(nav_view)에서 label 화면을 여는 조작"""
+    def action(app):
+        app.session_state["nav_view"] = label
+    return action
+
+# (단계 이름, AppTest 조작) — 첫 단계는 최초 실행
+SCENARIO: Tuple[Tuple[str, Callable], ...] = (
+    ("first run", lambda app: None),
+    ("company", lambda app: app.text_input(key="inp_co").input("테스트(주)")),
+    ("ceo", lambda app: app.text_input(key="inp_ceo").input("김대표")),
+    ("km_0", _choose("km_0", 0)),
+    ("cr_1", _choose("cr_1", 1)),
+    ("aw_0", _choose("aw_0", 1)),
+    ("sc_2", _choose("sc_2", 1)),
+    ("km_0 again", _choose("km_0", 2)),
+    ("dashboard", _view("📊  대시보드")),
+    ("consultant", _view("🤝  AI 컨설턴트")),
+    ("script", _view("📝  스크립트")),
+    ("diagnosis", _view("📋  진단")),
+)
+
+def _recording_runner(runs: List[List]):
+    """실행마다 전송 메시지 목록을 runs 에 기록하는 LocalScriptRunner"""
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    class RecordingScriptRunner(LocalScriptRunner):
+        def run(self, *args, **kwargs):
+            tree = super().run(*args, **kwargs)
+            runs.append(list(self.forward_msgs()))
+            return tree
+
+    return RecordingScriptRunner
+
+def measure_run(messages: Sequence, client_cache: Set[str]) -> Dict:
+    """한 rerun 의 전송량 (full: 캐시 미사용, sent: 브라우저 캐시 참조 반영, deltas: 요소 delta 수)"""
+    from streamlit.runtime.forward_msg_cache import create_reference_msg
+
+    full = sent = references = deltas = 0
+    for msg in messages:
+        deltas += msg.WhichOneof("type") == "delta"
+        size = len(msg.SerializeToString())
+        full += size
+        if msg.metadata.cacheable and msg.hash in client_cache:
+            sent += len(create_reference_msg(msg).SerializeToString())
+            references += 1
+        else:
+            sent += size
+    client_cache.update(msg.hash for msg in messages if msg.metadata.cacheable)
+    return {"messages": len(messages), "full": full, "sent": sent, "references": references, "deltas": deltas}
+
+def run_scenario(app: str, min_cached_size: float = None) -> List[Tuple[str, Dict]]:
+    """시나리오 단계별 전송량"""
+    from streamlit import config
+    from streamlit.testing.v1 import AppTest
+
+    if min_cached_size is not None:
+        config.set_option("global.minCachedMessageSize", min_cached_size)
+
+    runs: List[List] = []
+    client_cache: Set[str] = set()
+    results = []
+    with mock.patch("streamlit.testing.v1.app_test.LocalScriptRunner", _recording_runner(runs)):
+        test = AppTest.from_file(os.path.join(APP_DIR, f"{app}.py"), default_timeout=120)
+        for name, action in SCENARIO:
+            action(test)
+            test.run()
+            if test.exception:
+                raise RuntimeError(f"{app}: {name}: {test.exception[0].message}")
+            results.append((name, measure_run(runs[-1], client_cache)))
+    return results
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="rerun 당 웹소켓 전송량 측정")
+    parser.add_argument("--app", default="ssgfc", help="앱 모듈 이름 (저장소 루트 기준)")
+    parser.add_argument("--min-cached-size", type=float, default=None,
+                        help="global.minCachedMessageSize 재지정 (기본: .streamlit/config.toml)")
+    args = parser.parse_args(argv)
+
+    from streamlit import config
+
+    # 측정 중 저장소 파일을 만들지 않도록 임시 DB 사용
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.setdefault("GFC_DB_PATH", os.path.join(directory, "payload_bench.db"))
+        results = run_scenario(args.app, args.min_cached_size)
+
+    print(f"minCachedMessageSize = {config.get_option('global.minCachedMessageSize'):,.0f} B")
+    print(f"{'step':<14} {'msgs':>5} {'deltas':>6} {'full B':>10} {'sent B':>10} {'refs':>5}")
+    for name, result in results:
+        print(f"{name:<14} {result['messages']:>5} {result['deltas']:>6} {result['full']:>10,} "
+              f"{result['sent']:>10,} {result['references']:>5}")
+    reruns = [result for _, result in results[1:]]
+    deltas = sum(result["deltas"] for result in reruns) / len(reruns)
+    full = sum(result["full"] for result in reruns) / len(reruns)
+    sent = sum(result["sent"] for result in reruns) / len(reruns)
+    print(f"{'rerun avg':<14} {'':>5} {deltas:>6.1f} {full:>10,.0f} {sent:>10,.0f}  ({1 - sent / full:.1%} saved)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
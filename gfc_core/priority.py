@@ -0,0 +1,42 @@
+"""
+우선 대응 항목 추출
+
+정렬 기준: 점수 내림차순 → 가중치 내림차순 → 문항 순서 (안정 정렬과 동일)
+"""
+
+import heapq
+from typing import TYPE_CHECKING, Dict, List
+
+from .schema import SCHEMA, QuestionSchema
+
+if TYPE_CHECKING:
+    import numpy as np
+
+def get_priority_items(all_items: List[Dict], limit: int = 5) -> List[Dict]:
+    """우선 대응 항목 추출 (전체 정렬 없이 상위 limit 건만 선택)"""
+    risky_items = (item for item in all_items if item["score"] > 0)
+    return heapq.nsmallest(limit, risky_items, key=lambda x: (-x["score"], -x["w"]))
+
+def top_k_batch(item_scores, schema: QuestionSchema = SCHEMA, k: int = 5) -> "np.ndarray":
+    """
+    다수 기업 우선 대응 문항 인덱스 일괄 추출
+
+    item_scores: score_batch()["item_scores"] 형태의 (기업 수, 문항 수) 점수 행렬.
+    반환: (기업 수, k) int 행렬, 각 행은 get_priority_items() 순서의 문항 인덱스 (빈 자리 = -1).
+    """
+    import numpy as np
+
+    scores = np.asarray(item_scores, dtype=np.float64)
+    if scores.ndim != 2 or scores.shape[1] != schema.question_count:
+        raise ValueError(f"item_scores must have shape (n, {schema.question_count}), got {scores.shape}")
+
+    # 열을 (가중치 내림차순, 문항 순서) 로 미리 배치한 뒤 점수 기준 안정 정렬 → 동점 순서 보존
+    by_weight = np.argsort(-schema.weight_vector, kind="stable")
+    order = np.argsort(-scores[:, by_weight], axis=1, kind="stable")[:, :k]
+    indices = by_weight[order]
+
+    top = np.full((len(scores), k), -1, dtype=np.int64)
+    width = indices.shape[1]
+    risky = np.take_along_axis(scores, indices, axis=1) > 0
+    top[:, :width] = np.where(risky, indices, -1)
+    return top
@@ -0,0 +1,140 @@
+"""
+GFC 진단 문항 · 리스크 레벨 · 솔루션 상수
+
+모든 Streamlit 앱(ssgfc.py, chart.py, GCFchart.py, gfc_diagnosis.py)이 공유하는 원본 데이터입니다.
+"""
+
+from dataclasses import dataclass
+
+# ═══════════════════════════════════════════════════════════
+# CONSTANTS & CONFIGURATION
+# ═══════════════════════════════════════════════════════════
+
+@dataclass
+class RiskLevel:
+    """리스크 레벨 정의"""
+    name: str
+    color: str
+    threshold: float
+
+RISK_LEVELS = [
+    RiskLevel("양호", "#22c55e", 20),
+    RiskLevel("주의", "#ca8a04", 45),
+    RiskLevel("경계", "#ea580c", 70),
+    RiskLevel("위험", "#dc2626", 100),
+]
+
+WEIGHT_COLORS = {
+    1: "#64748b",
+    2: "#64748b", 
+    3: "#3b82f6",
+    4: "#ca8a04",
+    5: "#ea580c",
+}
+
+RESPONSE_OPTIONS = ["예", "일부 해당", "아니오"]
+RESPONSE_SCORES = {"예": 1.0, "일부 해당": 0.5, "아니오": 0.0}
+
+# ═══════════════════════════════════════════════════════════
+# DIAGNOSTIC DATA
+# ═══════════════════════════════════════════════════════════
+
+KEYMAN_QUESTIONS = [
+    ("대표자 유고 시 의사결정 공백이 발생할 수 있다", 4),
+    ("회사 주요 거래·의사결정이 대표자 개인에게 집중되어 있다", 5),
+    ("대표자가 개인 보증을 서고 있다", 4),
+    ("대표자 개인 재무와 법인 재무가 명확히 분리되어 있지 않다", 3),
+    ("가업 승계 또는 지분 이전 계획이 명확하지 않다", 5),
+    ("대표자 건강·사고 리스크에 대한 대비가 충분하지 않다", 5),
+]
+
+CORPORATE_QUESTIONS = [
+    ("매출이 특정 거래처에 과도하게 집중되어 있다", 4),
+    ("핵심 인력 이탈 시 업무 공백이 크다", 4),
+    ("설비·투자 회수 구조가 장기적이거나 불확실하다", 3),
+    ("현금흐름 변동성이 크다", 4),
+    ("외부 환경 변화(환율·정책·시장)에 취약하다", 3),
+    ("예상치 못한 사고 발생 시 즉각 대응 체계가 부족하다", 5),
+]
+
+AWARENESS_QUESTIONS = [
+    ("대표자 리스크가 곧바로 법인 리스크로 이어질 수 있다", 
+     ["그렇다", "보통", "아니다"], 
+     {"그렇다": 0.0, "보통": 0.5, "아니다": 1.0}, 3),
+    ("매출 중단이나 큰 사고 발생 시, 회사가 정상 운영을 유지할 수 있는 기간(비상자금)을 파악하고 있다", 
+     ["예 (3개월 이상)", "대략 파악", "모름"], 
+     {"예 (3개월 이상)": 0.0, "대략 파악": 0.5, "모름": 1.0}, 4),
+    ("리스크 발생 시 대응 순서와 책임자가 정리되어 있다", 
+     ["예", "아니오"], 
+     {"예": 0.0, "아니오": 1.0}, 4),
+]
+
+# chart.py · GCFchart.py · gfc_diagnosis.py 에서 사용하는 이전 버전 Ⅳ. 리스크 구조 인식 문항
+LEGACY_AWARENESS_QUESTIONS = [
+    ("대표자 리스크가 곧바로 법인 리스크로 이어질 수 있다", 
+     ["그렇다", "보통", "아니다"], 
+     {"그렇다": 0.0, "보통": 0.5, "아니다": 1.0}, 3),
+    ("단일 사고 발생 시 회사가 버틸 수 있는 기간을 알고 있다", 
+     ["예", "아니오"], 
+     {"예": 0.0, "아니오": 1.0}, 4),
+    ("리스크 발생 시 대응 순서와 책임자가 정리되어 있다", 
+     ["예", "아니오"], 
+     {"예": 0.0, "아니오": 1.0}, 4),
+]
+
+SCENARIO_QUESTIONS = [
+    ("대표자가 6개월 이상 경영에서 이탈할 경우",
+     ["큰 영향 없음", "부분적 영향", "경영 전반에 중대한 영향"],
+     {"큰 영향 없음": 0.0, "부분적 영향": 0.5, "경영 전반에 중대한 영향": 1.0}, 5),
+    ("핵심 인력 1~2명이 동시에 이탈할 경우",
+     ["대응 가능", "일부 차질", "심각한 차질"],
+     {"대응 가능": 0.0, "일부 차질": 0.5, "심각한 차질": 1.0}, 4),
+    ("대규모 투자 또는 외부 충격 발생 시",
+     ["내부 대응 가능", "단기 대응 필요", "구조적 대응 필요"],
+     {"내부 대응 가능": 0.0, "단기 대응 필요": 0.5, "구조적 대응 필요": 1.0}, 4),
+]
+
+SOLUTIONS = [
+    {
+        "name": "대표자 리스크 관리",
+        "icon": "👔",
+        "color": "#9333ea",
+        "desc": "CEO Plan · Key-Man 보험 등을 통해 대표자 유고·부적격 시 경영 연속성을 보장합니다.",
+        "trigger": "keyman"
+    },
+    {
+        "name": "종업원 단체보험",
+        "icon": "👨‍👩‍👧‍👦",
+        "color": "#ea580c",
+        "desc": "핵심 인력 이탈·재해 시 기업 운영 안정을 위한 단체보험 설계.",
+        "trigger": "corp"
+    },
+    {
+        "name": "가업승계 컨설팅",
+        "icon": "🏢",
+        "color": "#ca8a04",
+        "desc": "지분 이전·상속·증여를 체계적으로 구조화하여 세금 부담을 최소화합니다.",
+        "trigger": "keyman"
+    },
+    {
+        "name": "법인 절세 컨설팅",
+        "icon": "📋",
+        "color": "#16a34a",
+        "desc": "법인·개인 재무 분리와 절세 구조를 정리하여 불필요한 세금 부담을 줄입니다.",
+        "trigger": "keyman"
+    },
+    {
+        "name": "현금흐름 & 위기대응",
+        "icon": "📊",
+        "color": "#0891b2",
+        "desc": "현금흐름 변동성 대비와 단일 사고 대응 구조를 체계적으로 설계합니다.",
+        "trigger": "corp"
+    },
+    {
+        "name": "종합 재무컨설팅",
+        "icon": "📈",
+        "color": "#2563eb",
+        "desc": "전체 리스크를 종합적으로 평가하여 최적의 구조 설계와 실행 계획을 제안합니다.",
+        "trigger": "all"
+    },
+]
@@ -0,0 +1,469 @@
+"""
+기업별 상담 자료 HTML 리포트
+
+대시보드 · AI 컨설턴트 분석 · 상담 스크립트를 Streamlit 세션 없이 하나의 독립 HTML 파일로 생성합니다.
+CSS 와 차트(SVG)가 모두 문서 안에 포함되어 외부 리소스 없이 열리며, 일괄 모드는 배치 입력
+(CSV / Parquet) 을 청크 단위로 점수 계산하여 리포트를 하나씩 zip 에 바로 기록하므로
+메모리에는 청크 하나만 유지됩니다.
+
+실행: python -m gfc_core.report 입력.csv 리포트.zip [--schema v2] [--chunk-size 2000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from .questions import SOLUTIONS, WEIGHT_COLORS
+from .schema import SCHEMA, QuestionSchema
+from .scoring import get_risk_level
+from .svg import bar_svg, gauge_svg, radar_svg
+from .theme import compact_html, dark_theme_rules
+
+DEFAULT_REPORT_CHUNK_SIZE = 2_000
+# zip 항목 압축 수준 (리포트는 대부분 공통 CSS 라 낮은 수준으로도 충분히 줄어듦)
+ZIP_COMPRESS_LEVEL = 1
+
+RADAR_CATEGORIES = ["대표자<br>리스크", "법인 경영<br>리스크", "리스크 인식<br>부족", "시나리오<br>대응 미흡"]
+BAR_CATEGORIES = ["시나리오 대응 미흡", "리스크 인식 부족", "법인 경영", "대표자"]
+KPI_LABELS = (("km_pct", "대표자 리스크"), ("cr_pct", "법인 경영 리스크"),
+              ("aw_pct", "리스크 인식 부족"), ("sc_pct", "시나리오 대응 미흡"))
+
+# AI 컨설턴트 · 스크립트 고정 조각 (ssgfc.py 탭과 리포트 공용, import 시 1회 압축)
+# 앱은 매 rerun 같은 바이트열을 내보내므로 브라우저 캐시에 있으면 Streamlit 이 해시 참조만 전송 — gfc_core.theme 참고
+CONSULTANT_HEADER_HTML = compact_html('''
+    <div style="font-family: 'Noto Sans KR'; font-size: 26px; font-weight: 700; 
+         color: #00d4aa; margin-bottom: 8px;">
+        🤝 AI 컨설턴트 Ken의 종합 분석
+    </div>
+    ''')
+
+# 프로필 카드 (슬롯: company · industry · employees · revenue)
+CONSULTANT_PROFILE_HTML = compact_html('''
+    <div style="background: #111d2e; border: 1px solid #1e3a5f; border-radius: 10px; 
+         padding: 18px; margin-bottom: 16px;">
+        <div style="display: flex; align-items: center; gap: 16px;">
+            <div style="flex-shrink: 0;">
+                <div style="width: 80px; height: 80px; 
+                     background: linear-gradient(135deg, #00d4aa, #00b894); 
+                     border-radius: 50%; display: flex; align-items: center; 
+                     justify-content: center; font-size: 36px; color: #fff; 
+                     border: 3px solid #00d4aa; 
+                     box-shadow: 0 4px 12px rgba(0,212,170,0.3);">
+                    👨‍💼
+                </div>
+            </div>
+            <div style="flex: 1;">
+                <div style="font-family: 'Noto Sans KR'; font-size: 16px; font-weight: 700; 
+                     color: #00d4aa; margin-bottom: 8px;">
+                    👋 안녕하세요, GFC 컨설턴트 Ken입니다
+                </div>
+                <div style="font-size: 12px; color: #94a3b8; line-height: 1.7; margin-bottom: 10px;">
+                    20년간 한국-중남미 협력 프로젝트를 수행하며 <b>58개 사이트</b>의 
+                    디지털 전환(DX) 전략을 수립한 경험을 바탕으로, 귀사의 
+                    <b>종합 리스크 진단 결과</b>를 데이터 기반으로 상세히 분석해 드리겠습니다.
+                </div>
+                <div style="font-size:13px; color:#4a6a84;">
+                    📊 현재 분석 대상: <b style="color:#e0e6ed;">{company}</b> | 
+                    {industry} · 종업원 {employees}명 · 연매출 {revenue}
+                </div>
+            </div>
+        </div>
+    </div>
+    ''')
+
+CONSULTANT_PROPOSALS = (
+    ("⏱️ 1. 단기 (3개월 이내)", "#00d4aa",
+     "• 키맨 보험 가입으로 대표자 유고 리스크 대비<br>"
+     "• 기업재해 보장 상품으로 종업원 안전망 구축<br>"
+     "• 퇴직연금 제도 점검 및 최적화"),
+    ("📅 2. 중기 (6~12개월)", "#f5a623",
+     "• 가업승계 시뮬레이션 (증여 vs 상속 세금 비교)<br>"
+     "• 법인세 절세 전략 수립 (삼성생명 세무사 협업)<br>"
+     "• 정기 재무 건강검진 체계 구축"),
+    ("🎯 3. 장기 (1~3년)", "#a29bfe",
+     "• 후계자 육성 프로그램 및 지분 이전 계획<br>"
+     "• 가족신탁, 재산분할 등 고급 절세 전략<br>"
+     "• 삼성패밀리오피스 연계한 자산관리 (10억 이상 자산가 대상)"),
+)
+
+PROPOSAL_GRADIENTS = {
+    "#00d4aa": "linear-gradient(135deg, #0d2818, #1a3a2e)",
+    "#f5a623": "linear-gradient(135deg, #2a1f0d, #3a2f1d)",
+    "#a29bfe": "linear-gradient(135deg, #1a1a2e, #2a2a4e)",
+}
+
+PROPOSAL_CARDS_HTML = tuple(compact_html(f'''
+        <div style="background: {PROPOSAL_GRADIENTS[color_code]}; padding: 14px; border-radius: 8px; 
+             border-left: 4px solid {color_code}; margin-bottom: 10px;">
+            <div style="font-size: 13px; font-weight: 700; color: {color_code}; 
+                 margin-bottom: 8px;">{title}</div>
+            <div style="font-size: 12px; color: #c8d8e4; line-height: 1.7;">{content}</div>
+        </div>
+        ''') for title, color_code, content in CONSULTANT_PROPOSALS)
+
+DIFFERENTIATION_HTML = compact_html('''
+    <div style="background: rgba(0, 212, 170, 0.08); padding: 16px; border-radius: 8px; 
+         border: 2px solid #00d4aa; margin-top: 16px;">
+        <div style="font-size: 14px; font-weight: 700; color: #00d4aa; margin-bottom: 10px;">
+            💎 차별화 포인트
+        </div>
+        <div style="font-size: 13px; color: #cbd5e1; line-height: 1.8;">
+            제조 기업의 지속 가능한 성장과 가치 창출 프로세스를 이해하고, 그 가치의 근원을 데이터로 분석하며
+            <b style="color: #00d4aa;">경영 리스크를 최소화</b>하는 실전 컨설팅을 수행해 왔습니다.<br><br> 
+            기업이 땀 흘려 만든 가치가 세금과 리스크로 훼손되지 않도록, 삼성생명의 전문가 네트워크(세무사·회계사·법무사)와 협업하여    
+            귀사의 <b>영속적 경영과 안정적 가업승계</b>를 설계해 드리겠습니다.
+        </div>
+    </div>
+    ''')
+
+NEXT_STEPS_HTML = compact_html('''
+    <div style="background: #141e2b; padding: 16px; border-radius: 8px; 
+         border: 1px solid #1e3a5f; margin-top: 16px;">
+        <div style="font-size: 14px; font-weight: 700; color: #f5a623; margin-bottom: 10px;">
+            📞 다음 단계 — 무료 심층 상담 신청
+        </div>
+        <div style="font-size: 12px; color: #c8d8e4; line-height: 1.7; margin-bottom: 12px;">
+            위 분석 결과를 바탕으로 <b style="color: #00d4aa;">귀사 맞춤형 절세 시뮬레이션</b>을 
+            준비해 드리겠습니다.
+        </div>
+        <div style="background: rgba(245, 166, 35, 0.05); padding: 12px; border-radius: 6px; 
+             border-left: 3px solid #f5a623; margin-bottom: 12px;">
+            <div style="font-size: 11px; font-weight: 700; color: #f5a623; margin-bottom: 6px;">
+                📋 상담 신청 시 제공되는 자료
+            </div>
+            <div style="font-size: 11px; color: #c8d8e4; line-height: 1.6;">
+                • 가업승계 시나리오별 세금 비교표 (증여 vs 상속)<br>
+                • 법인보험 가입 시 절세 효과 계산서<br>
+                • 퇴직연금 최적화 방안<br>
+                • ROI 예측 대시보드 (5년/10년 단위)
+            </div>
+        </div>
+        <div style="background: rgba(0, 212, 170, 0.08); padding: 10px; border-radius: 6px; 
+             border: 1px solid #00d4aa; text-align: center;">
+            <span style="font-size: 12px; color: #00d4aa; font-weight: 700;">
+                📧 io7hub@naver.com | ☎ 010-2610-5194
+            </span>
+        </div>
+    </div>
+    ''')
+
+# 단기/중기/장기 제안 · 차별화 포인트 · 다음 단계 (고정 내용이므로 요소 하나로 — 캐시 참조 1개로 전송)
+CONSULTANT_CLOSING_HTML = "".join(PROPOSAL_CARDS_HTML + (DIFFERENTIATION_HTML, NEXT_STEPS_HTML))
+
+SCRIPT_CLOSING_HTML = compact_html('''
+    <div class="sc-sec" style="margin-top:14px">4. 마무리 및 다음 단계</div>
+    <div class="sc-close">
+      오늘 진단 결과를 기반으로, 우리기업에 맞는 
+      <strong>종합 법인 재무 컨설팅 제안서</strong>를 별도로 작성하여 드리겠습니다.<br><br>
+      세무사, 회계사, 법무사 등 전문가와 협업하여 <strong>최적의 구조</strong>를 설계드리고,
+      삼성생명 GFC의 교육과 지원 체계와 함께 단계별 실행 계획까지 제안드리겠습니다.<br><br>
+      다음 단계로 <strong>상세 제안서 검토 일정</strong>을 잡아드리면 되겠습니다. 
+      언제 가능하신가요?
+    </div>
+  </div>
+  ''')
+
+_REPORT_CSS = """
+body { margin: 0; background: #0f1623; color: #cbd5e1;
+       font-family: 'Noto Sans KR', 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif; }
+.rp-wrap { max-width: 960px; margin: 0 auto; padding: 24px 18px 40px; }
+.rp-title { font-size: 20px; font-weight: 800; color: #fff; margin: 0 0 4px; }
+.rp-sub { font-size: 11px; color: #64748b; margin: 0 0 18px; }
+.rp-part { font-size: 16px; font-weight: 800; color: #00d4aa; margin: 32px 0 12px;
+           padding-bottom: 6px; border-bottom: 1px solid #1e3a5f; }
+.rp-h { font-size: 13px; font-weight: 700; color: #fff; margin: 16px 0 8px; }
+.rp-card { background: #111d2e; border: 1px solid #1e3a5f; border-radius: 10px; padding: 16px;
+           margin-bottom: 14px; font-size: 12.5px; line-height: 1.8; }
+.rp-charts { display: grid; grid-template-columns: 1fr 1fr; gap: 12px; }
+@media print { .rp-part { page-break-before: always; } .rp-part.first { page-break-before: auto; } }
+"""
+
+@lru_cache(maxsize=None)
+def report_css() -> str:
+    """리포트용 CSS (다크 테마 컴포넌트 스타일 + 문서 레이아웃, 앱 정적 경로 폰트 제외)"""
+    return f"<style>{dark_theme_rules()}{_REPORT_CSS}</style>"
+
+def _company(info: Dict) -> str:
+    return info.get("company", "") or "○○(주)"
+
+# ═══════════════════════════════════════════════════════════
+# SECTIONS (ssgfc.py 대시보드 · AI 컨설턴트 · 스크립트 탭과 공용)
+# ═══════════════════════════════════════════════════════════
+
+def kpi_row_html(scores: Dict) -> str:
+    """KPI 카드 행 (종합 + 섹션별 리스크율)"""
+    total_pct = scores["total_pct"]
+    label, color = get_risk_level(total_pct)
+    kpis = [f'<div class="gfc-kpi"><div class="val" style="color:{color}">{total_pct:.0f}%</div>'
+            f'<div class="lbl">종합 리스크율</div>'
+            f'<div style="font-size:10px;font-weight:700;color:{color};margin-top:2px">{label}</div></div>']
+    for key, kpi_label in KPI_LABELS:
+        kpis.append(f'<div class="gfc-kpi"><div class="val" style="color:{get_risk_level(scores[key])[1]}">'
+                    f'{scores[key]:.0f}%</div><div class="lbl">{kpi_label}</div></div>')
+    return f'<div class="gfc-kpi-row">{"".join(kpis)}</div>'
+
+def priority_item_html(item: Dict, rank: int) -> str:
+    """우선 대응 항목 카드"""
+    color = WEIGHT_COLORS.get(item["w"], "#64748b")
+    response = "예" if item["score"] == 1.0 else "일부 해당"
+    return (
+        f'<div class="gfc-pri"><span class="rk" style="color:{color}">#{rank}</span>'
+        f'<div class="info"><div class="cat">{escape(item["section"])}</div>'
+        f'<div class="txt">{escape(item["text"])}</div></div>'
+        f'<span class="wtag" style="background:{color}">가중치 {item["w"]}</span>'
+        f'<span class="wtag" style="background:#475569">{response}</span></div>'
+    )
+
+def priority_list_html(priority_items: List[Dict]) -> str:
+    """우선 대응 항목 목록 (없으면 양호 안내)"""
+    if not priority_items:
+        return '<div class="gfc-empty">모든 항목 양호 🎉</div>'
+    return "".join(priority_item_html(item, rank) for rank, item in enumerate(priority_items, 1))
+
+def solution_card_html(solution: Dict) -> str:
+    """추천 솔루션 카드"""
+    return (
+        f'<div class="gfc-sol"><span class="ico">{solution["icon"]}</span><div>'
+        f'<div class="nm" style="color:{solution["color"]}">{solution["name"]}</div>'
+        f'<div class="dc">{solution["desc"]}</div></div></div>'
+    )
+
+def solution_list_html(solutions: List[Dict]) -> str:
+    """추천 솔루션 목록 (없으면 양호 안내)"""
+    if not solutions:
+        return '<div class="gfc-empty">현재 추천 솔루션 없음 — 모든 항목 양호 🎉</div>'
+    return "".join(solution_card_html(solution) for solution in solutions)
+
+def dashboard_html(scores: Dict, priority_items: List[Dict], solutions: List[Dict]) -> str:
+    """대시보드 (KPI · 게이지 · 레이더 · 바 차트 · 우선 대응 항목 · 추천 솔루션)"""
+    total_pct = scores["total_pct"]
+    label, color = get_risk_level(total_pct)
+    section_values = [scores["km_pct"], scores["cr_pct"], scores["aw_pct"], scores["sc_pct"]]
+    bar_values = section_values[::-1]
+    return "".join([
+        '<div class="rp-part first">📊 대시보드</div>',
+        kpi_row_html(scores),
+        '<div class="rp-charts">',
+        f'<div>{gauge_svg(round(total_pct, 1), label, color)}</div>',
+        f'<div>{radar_svg(section_values, RADAR_CATEGORIES)}</div>',
+        '</div>',
+        bar_svg(bar_values, BAR_CATEGORIES, [get_risk_level(v)[1] for v in bar_values],
+                [f"{v:.0f}%" for v in bar_values]),
+        '<div class="rp-h">🔥 우선 대응 항목</div>',
+        priority_list_html(priority_items),
+        '<div class="rp-h">💎 추천 솔루션</div>',
+        solution_list_html(solutions),
+    ])
+
+def consultant_profile_html(info: Dict) -> str:
+    """AI 컨설턴트 프로필 카드 (분석 대상 기업 정보)"""
+    return CONSULTANT_PROFILE_HTML.format(
+        company=escape(_company(info)),
+        industry=escape(info.get("industry", "") or "미입력"),
+        employees=escape(info.get("employees", "") or "?"),
+        revenue=escape(info.get("revenue", "") or "미입력"),
+    )
+
+def consultant_analysis_html(scores: Dict, priority_items: List[Dict]) -> str:
+    """종합 진단 결과 · 우선 대응 항목(상위 5건) · 제안 제목"""
+    total_pct = scores["total_pct"]
+    label, color = get_risk_level(total_pct)
+    return "".join([
+        compact_html(f'''
+        <div style="background: linear-gradient(135deg, #141e2b, #1a2736); padding: 18px; 
+             border-radius: 10px; border-left: 4px solid {color}; margin-bottom: 16px;">
+            <div style="font-size: 15px; font-weight: 700; color: {color}; margin-bottom: 10px;">
+                📋 종합 진단 결과
+            </div>
+            <div style="font-size: 13px; color: #cbd5e1; line-height: 1.8;">
+                귀사의 <b>종합 리스크율은 {total_pct:.0f}%</b>로 
+                <b style="color: {color};">{label}</b> 수준입니다.<br><br>
+                4가지 핵심 리스크 카테고리를 가중평균하여 산출한 결과이며,<br>
+                대표자 리스크({scores["km_pct"]:.0f}%), 법인 경영 리스크({scores["cr_pct"]:.0f}%), 
+                리스크 인식 부족({scores["aw_pct"]:.0f}%), 시나리오 대응 미흡({scores["sc_pct"]:.0f}%)을 반영했습니다.
+            </div>
+        </div>
+        '''),
+        '<div style="font-size: 14px; font-weight: 700; color: #fff; margin: 16px 0 8px;">🔥 우선 대응 항목</div>',
+        priority_list_html(priority_items[:5]),
+        '<div style="font-size: 14px; font-weight: 700; color: #fff; margin: 20px 0 8px;">'
+        '🎯 Ken의 종합 컨설팅 제안</div>',
+    ])
+
+def consultant_html(info: Dict, scores: Dict, priority_items: List[Dict]) -> str:
+    """AI 컨설턴트 종합 분석 (프로필 · 종합 진단 · 단계별 제안 · 다음 단계)"""
+    return "".join([
+        '<div class="rp-part">🤝 AI 컨설턴트 Ken의 종합 분석</div>',
+        consultant_profile_html(info),
+        consultant_analysis_html(scores, priority_items),
+        CONSULTANT_CLOSING_HTML,
+    ])
+
+def script_html(info: Dict, scores: Dict, priority_items: List[Dict], solutions: List[Dict]) -> str:
+    """상담 스크립트 문서 (.gfc-script — 헤더 · 도입 인사 · 리스크별 상담 · 솔루션 · 마무리)"""
+    total_pct = scores["total_pct"]
+    label, color = get_risk_level(total_pct)
+    company = _company(info)
+    ceo = escape(info.get("ceo", "") or "대표자")
+    short_name = escape(company.replace("(주)", "").replace("(유)", "").replace("㈜", ""))
+    top_section = escape(priority_items[0]["section"]) if priority_items else "주요 영역"
+
+    parts = [
+        '<div class="gfc-script"><div class="sc-hdr"><h2>GFC 상담 스크립트</h2>',
+        '<p>삼성생명 기업재무컨설팅 · 진단 기반 자동생성</p></div><div class="sc-meta">',
+        f'<span><strong>기업명:</strong> {escape(company)}</span>',
+        f'<span><strong>업종:</strong> {escape(info.get("industry", "") or "미입력")}</span>',
+        f'<span><strong>종업원 수:</strong> {escape(info.get("employees", "") or "?")}명</span>',
+        f'<span><strong>대표자:</strong> {ceo}</span>',
+        f'<span><strong>설립 연차:</strong> {escape(info.get("est", "") or "미입력")}</span>',
+        f'<span><strong>진단 충족율:</strong> <span style="color:{color};font-weight:700">'
+        f'{total_pct:.0f}% ({label})</span></span></div>',
+        '<div class="sc-sec">1. 도입 인사</div><div class="sc-intro">',
+        f'안녕하세요, {ceo} 대표님. 삼성생명 GFC 기업재무컨설팅 <strong>{short_name}</strong> ',
+        '담당 컨설턴트 Ken입니다.<br><br>오늘 우리회사의 법인 리스크 사전 진단을 완료했는데, 종합 리스크율이 ',
+        f'<strong style="color:{color}">{total_pct:.0f}%({label})</strong> 수준으로 나왔습니다.<br>',
+        f"특히 <strong>'{top_section}'</strong> 부분에서 즉각적인 대비가 필요한 사항들이 도출되었습니다.<br><br>",
+        '오늘 주요 내용을 안내드리고, 우리기업에 맞는 종합 컨설팅 제안까지 함께 검토하겠습니다.</div>',
+    ]
+
+    grouped: Dict[str, List[Dict]] = {}
+    for item in priority_items:
+        grouped.setdefault(item["section"], []).append(item)
+    if grouped:
+        parts.append('<div class="sc-sec" style="margin-top:14px">2. 리스크별 상세 상담</div>')
+        for section, items in grouped.items():
+            parts.append(f'<div style="font-size:11px;font-weight:700;color:#fff;margin:10px 0 5px">'
+                         f'▸ {escape(section)} <span style="background:#475569;color:#fff;font-size:8px;'
+                         f'font-weight:700;border-radius:3px;padding:1px 5px">{len(items)}건</span></div>')
+            for item in items:
+                response = "예" if item["score"] == 1.0 else "일부 해당"
+                parts.append(
+                    f'<div class="sc-block" style="border-color:{WEIGHT_COLORS.get(item["w"], "#64748b")}">'
+                    f'<div class="bq">📌 진단 항목 (가중치 {item["w"]}) — {escape(item["section"])}</div>'
+                    f'<div class="bt"><strong>질문:</strong> {escape(item["text"])}<br>'
+                    f'<strong>응답:</strong> {response}</div></div>'
+                )
+    if solutions:
+        parts.append('<div class="sc-sec" style="margin-top:14px">3. 추천 솔루션 제안</div>')
+        parts.extend(
+            f'<div style="display:flex;gap:7px;align-items:flex-start;margin-bottom:5px">'
+            f'<span style="background:{solution["color"]};color:#fff;font-size:8px;font-weight:700;'
+            f'border-radius:3px;padding:2px 6px;white-space:nowrap;flex-shrink:0">'
+            f'{solution["icon"]} {solution["name"]}</span>'
+            f'<span style="font-size:10.5px;color:#cbd5e1;line-height:1.6">{solution["desc"]}</span></div>'
+            for solution in solutions
+        )
+    parts.append(SCRIPT_CLOSING_HTML)
+    return "".join(parts)
+
+def report_body_html(info: Dict, scores: Dict, priority_items: List[Dict], solutions: List[Dict]) -> str:
+    """상담 자료 본문 (대시보드 + AI 컨설턴트 + 스크립트, 생성 시각과 무관)"""
+    return "".join([
+        dashboard_html(scores, priority_items, solutions),
+        consultant_html(info, scores, priority_items),
+        '<div class="rp-part">📝 GFC 상담 스크립트</div>',
+        script_html(info, scores, priority_items, solutions),
+    ])
+
+def report_document(info: Dict, body_html: str, generated_at: datetime = None) -> str:
+    """상담 자료 본문 → 독립 HTML 문서 (제목 · 생성 시각 포함)"""
+    generated_at = generated_at or datetime.now()
+    company = escape(_company(info))
+    return "".join([
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        f'<title>GFC 상담 자료 | {company}</title>',
+        report_css(),
+        '</head><body><div class="rp-wrap">',
+        f'<div class="rp-title">⚖️ {company} 법인 리스크 진단 상담 자료</div>',
+        f'<div class="rp-sub">삼성생명 GFC 기업재무컨설팅 · {generated_at:%Y-%m-%d %H:%M} 생성</div>',
+        body_html,
+        '</div></body></html>',
+    ])
+
+def render_report(info: Dict, scores: Dict, priority_items: List[Dict], solutions: List[Dict],
+                  generated_at: datetime = None) -> str:
+    """기업 1곳의 상담 자료 (대시보드 + AI 컨설턴트 + 스크립트) 독립 HTML 문서"""
+    return report_document(info, report_body_html(info, scores, priority_items, solutions), generated_at)
+
+# ═══════════════════════════════════════════════════════════
+# BULK
+# ═══════════════════════════════════════════════════════════
+
+def iter_report_inputs(rows: Sequence[Dict], schema: QuestionSchema = SCHEMA) -> Iterator[Tuple[Dict, Dict, List[Dict], List[Dict]]]:
+    """배치 입력 행 → (info, scores, 우선 대응 항목, 추천 솔루션) (청크 단위 일괄 계산)"""
+    from .batch import INFO_COLUMNS, SCORE_COLUMNS, encode_rows
+    from .priority import top_k_batch
+    from .scoring import score_batch
+    from .solutions import solutions_for_masks
+
+    scores = score_batch(encode_rows(rows, schema), schema)
+    pct_columns = {name: scores[name].tolist() for name in SCORE_COLUMNS}
+    item_scores = scores["item_scores"].tolist()
+    top_items = top_k_batch(scores["item_scores"], schema).tolist()
+    recommended = solutions_for_masks(scores["risk_mask"], schema).tolist()
+    section_names = [schema.sections[k].name for k in schema.item_sections]
+
+    for r, row in enumerate(rows):
+        info = {name: ("" if row.get(name) is None else str(row.get(name))) for name in INFO_COLUMNS}
+        row_scores = {name: pct_columns[name][r] for name in SCORE_COLUMNS}
+        priority_items = [
+            {"text": schema.texts[i], "w": schema.weights[i], "score": item_scores[r][i],
+             "section": section_names[i]}
+            for i in top_items[r] if i >= 0
+        ]
+        solutions = [solution for solution, hit in zip(SOLUTIONS, recommended[r]) if hit]
+        yield info, row_scores, priority_items, solutions
+
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+def report_filename(index: int, info: Dict) -> str:
+    """zip 항목 이름 (행 번호 + 기업명, 파일명에 쓸 수 없는 문자 제거)"""
+    name = _UNSAFE_NAME.sub("_", info.get("company", "")).strip("_")[:60]
+    return f"{index:06d}_{name or 'company'}.html"
+
+def write_report_zip(input_path: str, output_path: str, schema: QuestionSchema = SCHEMA,
+                     chunk_size: int = DEFAULT_REPORT_CHUNK_SIZE) -> int:
+    """배치 입력 전체를 기업별 HTML 리포트로 zip 에 기록, 리포트 수 반환"""
+    from .batch import iter_chunks
+
+    generated_at = datetime.now()
+    total = 0
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL) as archive:
+        for rows in iter_chunks(input_path, chunk_size):
+            for info, scores, priority_items, solutions in iter_report_inputs(rows, schema):
+                total += 1
+                html = render_report(info, scores, priority_items, solutions, generated_at)
+                archive.writestr(report_filename(total, info), html)
+    return total
+
+def main(argv: Sequence[str] = None) -> int:
+    from .batch import SCHEMAS
+
+    parser = argparse.ArgumentParser(description="GFC 기업별 상담 자료 HTML 일괄 생성")
+    parser.add_argument("input", help="입력 CSV / Parquet 경로 (gfc_core.batch 입력 형식)")
+    parser.add_argument("output", help="출력 zip 경로")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_REPORT_CHUNK_SIZE)
+    parser.add_argument("--schema", choices=sorted(SCHEMAS), default="v2",
+                        help="문항 구성 (v2 = ssgfc.py)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"input not found: {args.input}")
+
+    started = time.perf_counter()
+    reports = write_report_zip(args.input, args.output, SCHEMAS[args.schema], args.chunk_size)
+    elapsed = time.perf_counter() - started
+    rate = reports / elapsed if elapsed > 0 else 0.0
+    print(f"{reports:,} reports in {elapsed:.2f}s ({rate:,.0f} reports/s) → {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+컴파일된 진단 문항 스키마
+
+문항 상수로부터 import 시 1회 생성되는 불변 객체로, 가중치 배열 · 선택지→인덱스 테이블 ·
+섹션 구간 · 정규화 가중치를 보관합니다. 모든 점수 계산은 이 스키마의 인덱스 조회로 수행됩니다.
+
+섹션별 응답 조합은 유한하므로(예: 대표자 6문항 × (3 선택지 + 미응답) = 4,096 가지) 조합 번호 →
+가중 점수 합계 · 리스크율 · 리스크 문항 비트를 전수 계산한 조회표(SectionTable)를 스키마마다
+최초 사용 시 만들어 둡니다. 조회표는 스키마(= 문항 상수)에서 파생되므로 문항이 바뀌면 함께 바뀝니다.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import product
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from .questions import (
+    AWARENESS_QUESTIONS,
+    CORPORATE_QUESTIONS,
+    KEYMAN_QUESTIONS,
+    LEGACY_AWARENESS_QUESTIONS,
+    RESPONSE_OPTIONS,
+    RESPONSE_SCORES,
+    SCENARIO_QUESTIONS,
+)
+
+# 종합 리스크율 산출 방식
+TOTAL_SECTION_WEIGHTED = "section"  # Σ(섹션 리스크율 × 섹션 가중치) / 전체 가중치
+TOTAL_POOLED = "pooled"             # Σ(전체 가중 점수) / 전체 가중치 × 100
+
+# ═══════════════════════════════════════════════════════════
+# SCHEMA
+# ═══════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class SectionSchema:
+    """섹션 메타데이터 (문항 구간 및 정규화 가중치)"""
+    key: str
+    name: str
+    start: int
+    stop: int
+    total_weight: int
+
+    @property
+    def slice(self) -> slice:
+        return slice(self.start, self.stop)
+
+@dataclass(frozen=True, eq=False)
+class SectionTable:
+    """섹션 응답 조합 전수 조회표 (조합 번호 → 가중 점수 합계 · 리스크율 · 리스크 문항 비트)"""
+    section: SectionSchema
+    radices: Tuple[int, ...]          # 문항별 자리 크기 = 선택지 수 + 1 (마지막 자리값 = 미응답)
+    strides: Tuple[int, ...]          # 문항별 자릿값 (첫 문항이 최상위)
+    weighted_sums: Tuple[float, ...]
+    percentages: Tuple[float, ...]
+    risk_bits: Tuple[int, ...]        # 점수 > 0 인 문항 비트 (섹션 내 문항 순서)
+
+    def pack(self, codes: Sequence[int]) -> int:
+        """전체 문항 선택지 인덱스 → 이 섹션의 조합 번호 (미응답 -1 = 마지막 자리값)"""
+        packed = 0
+        for code, radix, stride in zip(codes[self.section.start:self.section.stop], self.radices, self.strides):
+            packed += (code if code >= 0 else radix - 1) * stride
+        return packed
+
+    # 배치 경로용 배열 (최초 접근 시 생성)
+    @cached_property
+    def arrays(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """(weighted_sums, percentages, risk_bits) NumPy 배열"""
+        import numpy as np
+
+        arrays = (np.array(self.weighted_sums, dtype=np.float64),
+                  np.array(self.percentages, dtype=np.float64),
+                  np.array(self.risk_bits, dtype=np.int64))
+        for array in arrays:
+            array.flags.writeable = False
+        return arrays
+
+@dataclass(frozen=True, eq=False)
+class QuestionSchema:
+    """컴파일된 진단 문항 스키마 (import 시 1회 생성, 불변)"""
+    sections: Tuple[SectionSchema, ...]
+    texts: Tuple[str, ...]
+    weights: Tuple[int, ...]
+    options: Tuple[Tuple[str, ...], ...]
+    option_index: Tuple[Mapping[str, int], ...]
+    option_scores: Tuple[Tuple[float, ...], ...]  # 마지막 원소 = 미정의 응답(-1) 0점
+    total_weight: int
+    total_mode: str
+
+    @property
+    def question_count(self) -> int:
+        return len(self.weights)
+
+    # 배치 계산용 배열은 NumPy 를 쓰는 경로에서만 최초 접근 시 생성 (앱 시작 시 NumPy import 회피)
+    @cached_property
+    def weight_vector(self) -> "np.ndarray":
+        import numpy as np
+
+        weight_vector = np.array(self.weights, dtype=np.float64)
+        weight_vector.flags.writeable = False
+        return weight_vector
+
+    @cached_property
+    def score_table(self) -> "np.ndarray":
+        """(문항 수, 최대 선택지 수) 점수표, 미정의 응답(-1) = 마지막 열 0점"""
+        import numpy as np
+
+        max_options = max(len(scores) for scores in self.option_scores)
+        score_table = np.zeros((self.question_count, max_options), dtype=np.float64)
+        for i, scores in enumerate(self.option_scores):
+            score_table[i, :len(scores) - 1] = scores[:-1]
+        score_table.flags.writeable = False
+        return score_table
+
+    @cached_property
+    def item_sections(self) -> Tuple[int, ...]:
+        """문항별 섹션 순번 (sections 인덱스)"""
+        return tuple(k for k, section in enumerate(self.sections) for _ in range(section.start, section.stop))
+
+    @cached_property
+    def section_tables(self) -> Tuple[SectionTable, ...]:
+        """sections 순서의 섹션별 전수 조회표"""
+        return tuple(_section_table(self, section) for section in self.sections)
+
+    @cached_property
+    def pack_matrix(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """배치 조합 번호 계산용 (문항별 자리 크기, (문항 수, 섹션 수) 자릿값 행렬) float32 배열"""
+        import numpy as np
+
+        radices = np.zeros(self.question_count, dtype=np.float32)
+        strides = np.zeros((self.question_count, len(self.sections)), dtype=np.float32)
+        for k, table in enumerate(self.section_tables):
+            radices[table.section.slice] = table.radices
+            strides[table.section.slice, k] = table.strides
+        radices.flags.writeable = False
+        strides.flags.writeable = False
+        return radices, strides
+
+    @cached_property
+    def option_counts(self) -> "np.ndarray":
+        """문항별 선택지 수 int64 배열 (유효 선택지 인덱스 = -1 ~ 선택지 수 - 1)"""
+        import numpy as np
+
+        option_counts = np.array([len(scores) - 1 for scores in self.option_scores], dtype=np.int64)
+        option_counts.flags.writeable = False
+        return option_counts
+
+    def check_codes(self, codes: "np.ndarray") -> None:
+        """
+        (행 수, 문항 수) 선택지 인덱스 행렬 검사
+
+        정수가 아닌 값은 정수 변환 시 잘려 다른 선택지로 채점되고, 범위를 벗어난 값은 조합 번호에서
+        이웃 문항 자리로 넘어가므로, 정수(정수 값의 실수 포함)이면서 -1 <= 값 < 선택지 수 가 아니면
+        ValueError 를 냅니다.
+        """
+        import numpy as np
+
+        if np.issubdtype(codes.dtype, np.floating):
+            if not np.array_equal(codes, np.trunc(codes)):
+                raise ValueError("answer codes must be integer values, got non-integer or NaN floats")
+        elif not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError(f"answer codes must be integers, got dtype {codes.dtype}")
+        invalid = (codes < -1) | (codes >= self.option_counts)
+        if invalid.any():
+            row, col = np.argwhere(invalid)[0]
+            raise ValueError(f"answer code {codes[row, col]} at row {row}, question {col} "
+                             f"out of range [-1, {self.option_counts[col]})")
+
+    def pack_batch(self, codes: "np.ndarray") -> "np.ndarray":
+        """
+        (행 수, 문항 수) 선택지 인덱스 행렬 → (행 수, 섹션 수) 섹션별 조합 번호
+
+        미응답(-1) 은 자리 크기를 더해 마지막 자리값으로 바꾼 뒤 자릿값 행렬과 곱합니다.
+        조합 수가 2^24 미만이므로 float32 행렬곱 결과가 정확한 정수입니다.
+        정수가 아니거나 범위를 벗어난 선택지 인덱스는 ValueError (check_codes).
+        """
+        self.check_codes(codes)
+        return self._pack_checked(codes)
+
+    def _pack_checked(self, codes: "np.ndarray") -> "np.ndarray":
+        """pack_batch 본체 (check_codes 를 이미 통과한 행렬용, 검사 생략)"""
+        import numpy as np
+
+        radices, strides = self.pack_matrix
+        digits = codes.astype(np.float32)
+        digits += (codes < 0) * radices
+        return (digits @ strides).astype(np.intp)
+
+    @cached_property
+    def item_table(self) -> Tuple[Tuple[Dict, ...], ...]:
+        """
+        문항별 · 선택지 인덱스별 결과 항목 (마지막 = 미응답, 인덱스 -1 로 조회)
+
+        점수 결과의 all_items 가 이 항목을 공유하므로 읽기 전용으로 다뤄야 합니다.
+        """
+        section_of = self.item_sections
+        return tuple(
+            tuple({"text": self.texts[i], "w": self.weights[i], "score": score,
+                   "section": self.sections[section_of[i]].name}
+                  for score in self.option_scores[i])
+            for i in range(self.question_count)
+        )
+
+    def section(self, key: str) -> SectionSchema:
+        """섹션 키로 섹션 조회"""
+        for section in self.sections:
+            if section.key == key:
+                return section
+        raise KeyError(key)
+
+    def encode(self, section_answers: Sequence[Sequence[str]]) -> List[int]:
+        """섹션별 응답 텍스트를 선택지 인덱스로 변환 (미정의 응답 = -1)"""
+        codes = []
+        for section, answers in zip(self.sections, section_answers):
+            for i in range(section.start, section.stop):
+                codes.append(self.option_index[i].get(answers[i - section.start], -1))
+        return codes
+
+def _section_table(schema: QuestionSchema, section: SectionSchema) -> SectionTable:
+    # 합산 순서를 score_codes 의 문항 순서와 같게 유지 (결과 비트 단위 일치)
+    indices = range(section.start, section.stop)
+    radices = tuple(len(schema.option_scores[i]) for i in indices)
+    strides = []
+    stride = 1
+    for radix in reversed(radices):
+        strides.append(stride)
+        stride *= radix
+    strides.reverse()
+
+    weighted_sums, percentages, risk_bits = [], [], []
+    # product 는 마지막 문항이 가장 빨리 바뀌므로 생성 순서 = 조합 번호 순서
+    for digits in product(*(range(radix) for radix in radices)):
+        weighted_sum = 0
+        bits = 0
+        for bit, (i, digit) in enumerate(zip(indices, digits)):
+            score = schema.option_scores[i][digit]
+            weighted_sum += score * schema.weights[i]
+            if score > 0:
+                bits |= 1 << bit
+        weighted_sums.append(weighted_sum)
+        percentages.append((weighted_sum / section.total_weight * 100) if section.total_weight > 0 else 0)
+        risk_bits.append(bits)
+    return SectionTable(section, radices, tuple(strides), tuple(weighted_sums), tuple(percentages),
+                        tuple(risk_bits))
+
+def compile_schema(questionnaire: Sequence[Tuple[str, str, Sequence[Tuple]]],
+                   total_mode: str = TOTAL_SECTION_WEIGHTED) -> QuestionSchema:
+    """(섹션 키, 섹션명, [(문항, 선택지, 점수맵, 가중치), ...]) 목록으로 스키마 생성"""
+    if total_mode not in (TOTAL_SECTION_WEIGHTED, TOTAL_POOLED):
+        raise ValueError(f"unknown total_mode: {total_mode!r}")
+
+    sections, texts, weights, options, option_index, option_scores = [], [], [], [], [], []
+    for key, name, questions in questionnaire:
+        start = len(texts)
+        for text, opts, score_map, weight in questions:
+            texts.append(text)
+            weights.append(weight)
+            options.append(tuple(opts))
+            option_index.append(MappingProxyType({opt: j for j, opt in enumerate(opts)}))
+            option_scores.append(tuple(score_map.get(opt, 0.0) for opt in opts) + (0.0,))
+        sections.append(SectionSchema(key, name, start, len(texts), sum(weights[start:])))
+
+    return QuestionSchema(
+        sections=tuple(sections),
+        texts=tuple(texts),
+        weights=tuple(weights),
+        options=tuple(options),
+        option_index=tuple(option_index),
+        option_scores=tuple(option_scores),
+        total_weight=sum(weights),
+        total_mode=total_mode,
+    )
+
+def build_questionnaire(awareness_questions: Sequence[Tuple]) -> List[Tuple[str, str, Sequence[Tuple]]]:
+    """4개 섹션 문항 구성 (열 순서: KEYMAN(6) → CORPORATE(6) → AWARENESS(3) → SCENARIO(3))"""
+    return [
+        ("km", "대표자 리스크",
+         [(text, RESPONSE_OPTIONS, RESPONSE_SCORES, w) for text, w in KEYMAN_QUESTIONS]),
+        ("cr", "법인 경영 리스크",
+         [(text, RESPONSE_OPTIONS, RESPONSE_SCORES, w) for text, w in CORPORATE_QUESTIONS]),
+        ("aw", "리스크 인식", awareness_questions),
+        ("sc", "시나리오", SCENARIO_QUESTIONS),
+    ]
+
+# ssgfc.py (v2.0 문항)
+SCHEMA = compile_schema(build_questionnaire(AWARENESS_QUESTIONS))
+# chart.py (이전 인식 문항, 섹션 가중평균)
+LEGACY_SCHEMA = compile_schema(build_questionnaire(LEGACY_AWARENESS_QUESTIONS))
+# GCFchart.py · gfc_diagnosis.py (이전 인식 문항, 전체 가중 점수 합산)
+LEGACY_POOLED_SCHEMA = compile_schema(build_questionnaire(LEGACY_AWARENESS_QUESTIONS),
+                                      total_mode=TOTAL_POOLED)
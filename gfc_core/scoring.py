@@ -0,0 +1,169 @@
+"""
+리스크 점수 계산 엔진
+
+단일 기업(score_codes / calculate_all_scores)과 다수 기업 일괄 계산(score_batch)이
+동일한 섹션 전수 조회표(schema.section_tables)를 사용하므로 결과가 비트 단위로 일치합니다.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Tuple
+
+from .questions import RESPONSE_SCORES, RISK_LEVELS
+from .schema import SCHEMA, TOTAL_POOLED, QuestionSchema
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# ═══════════════════════════════════════════════════════════
+# BUSINESS LOGIC
+# ═══════════════════════════════════════════════════════════
+
+def get_risk_level(percentage: float) -> Tuple[str, str]:
+    """리스크율에 따른 레벨과 색상 반환"""
+    for level in RISK_LEVELS:
+        if percentage <= level.threshold:
+            return level.name, level.color
+    return RISK_LEVELS[-1].name, RISK_LEVELS[-1].color
+
+def calculate_section_score(questions: List[Tuple], answers: List[str],
+                            section_name: str, score_map: Dict = None) -> Tuple[float, List[Dict]]:
+    """섹션별 리스크율 및 아이템 계산"""
+    score_map = score_map or RESPONSE_SCORES
+    total_weight = 0
+    weighted_sum = 0
+    items = []
+
+    for i, (text, weight) in enumerate(questions):
+        total_weight += weight
+        score = score_map.get(answers[i], 0.0)
+        weighted_sum += score * weight
+
+        items.append({
+            "text": text,
+            "w": weight,
+            "score": score,
+            "section": section_name
+        })
+
+    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
+    return percentage, items
+
+def calculate_custom_section_score(questions: List[Tuple], answers: List[str],
+                                   section_name: str) -> Tuple[float, List[Dict]]:
+    """커스텀 스코어맵을 사용하는 섹션 계산 (Awareness, Scenario)"""
+    total_weight = 0
+    weighted_sum = 0
+    items = []
+
+    for i, (text, options, score_map, weight) in enumerate(questions):
+        total_weight += weight
+        score = score_map.get(answers[i], 0.0)
+        weighted_sum += score * weight
+
+        items.append({
+            "text": text,
+            "w": weight,
+            "score": score,
+            "section": section_name
+        })
+
+    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
+    return percentage, items
+
+def score_codes(codes: Sequence[int], schema: QuestionSchema = SCHEMA) -> Dict:
+    """선택지 인덱스 기반 전체 리스크 점수 계산 (섹션당 조회표 1회 조회)"""
+    section_sums = [table.weighted_sums[table.pack(codes)] for table in schema.section_tables]
+    item_table = schema.item_table
+    all_items = [item_table[i][code] for i, code in enumerate(codes)]
+    return finalize_scores(section_sums, all_items, schema)
+
+def finalize_scores(section_sums: Sequence[float], all_items: List[Dict],
+                    schema: QuestionSchema = SCHEMA) -> Dict:
+    """섹션별 가중 점수 합계로 섹션 · 종합 리스크율 결과 구성"""
+    result = {}
+    total_wd = 0
+    for section, weighted_sum in zip(schema.sections, section_sums):
+        total_wd += weighted_sum
+        total_weight = section.total_weight
+        result[f"{section.key}_pct"] = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
+
+    total_wt = schema.total_weight
+    if schema.total_mode == TOTAL_POOLED:
+        # 전체 가중 점수 합산
+        result["total_pct"] = (total_wd / total_wt * 100) if total_wt else 0
+    else:
+        # 종합 리스크율 (섹션 가중평균)
+        weighted_pct = 0
+        for section in schema.sections:
+            weighted_pct += result[f"{section.key}_pct"] * section.total_weight
+        result["total_pct"] = weighted_pct / total_wt if total_wt > 0 else 0
+
+    for section in schema.sections:
+        result[f"{section.key}_wt"] = section.total_weight
+    result["total_wt"] = total_wt
+    result["all_items"] = all_items
+    return result
+
+def encode_answers(km_answers: List[str], cr_answers: List[str],
+                   aw_answers: List[str], sc_answers: List[str],
+                   schema: QuestionSchema = SCHEMA) -> List[int]:
+    """응답 텍스트를 배치 입력용 선택지 인덱스로 변환 (미정의 응답 = -1)"""
+    return schema.encode([km_answers, cr_answers, aw_answers, sc_answers])
+
+def calculate_all_scores(km_answers: List[str], cr_answers: List[str],
+                        aw_answers: List[str], sc_answers: List[str],
+                        schema: QuestionSchema = SCHEMA) -> Dict:
+    """전체 리스크 점수 계산"""
+    return score_codes(encode_answers(km_answers, cr_answers, aw_answers, sc_answers, schema), schema)
+
+def weighted_total(section_pcts: Mapping[str, float], weights: Mapping[str, float],
+                   default_weight: float = 0.25) -> float:
+    """고정 비율 가중평균 (섹션명 → 리스크율, 섹션명 → 비율)"""
+    return sum(pct * weights.get(name, default_weight) for name, pct in section_pcts.items())
+
+# ═══════════════════════════════════════════════════════════
+# BATCH SCORING
+# ═══════════════════════════════════════════════════════════
+
+def score_batch(answers_matrix, schema: QuestionSchema = SCHEMA) -> Dict[str, "np.ndarray"]:
+    """
+    다수 기업 일괄 리스크 점수 계산
+
+    answers_matrix: (기업 수, 18) int8 행렬, 각 값은 문항 선택지 인덱스 (-1 = 미응답).
+    정수가 아니거나 선택지 수 이상 · -1 미만인 값이 있으면 ValueError.
+    calculate_all_scores()와 같은 섹션 조회표를 사용하므로 결과가 비트 단위로 일치합니다.
+    risk_mask: 리스크가 있는 섹션 비트마스크 (solutions.solutions_for_masks 입력).
+    """
+    import numpy as np
+
+    # int8 변환 전에 1회 검사 (실수는 잘리고, 128 이상은 음수로 감김)
+    codes = np.asarray(answers_matrix)
+    if codes.ndim != 2 or codes.shape[1] != schema.question_count:
+        raise ValueError(f"answers_matrix must have shape (n, {schema.question_count}), got {codes.shape}")
+    schema.check_codes(codes)
+    codes = codes.astype(np.int8, copy=False)
+
+    # 섹션별 조합 번호 → 조회표 인덱싱 (문항 점수 계산 · 합산 없음)
+    result = {}
+    weighted_pct = np.zeros(len(codes))
+    total_wd = np.zeros(len(codes))
+    masks = np.zeros(len(codes), dtype=np.int64)
+    packed_sections = schema._pack_checked(codes)
+    for k, table in enumerate(schema.section_tables):
+        weighted_sums, percentages, risk_bits = table.arrays
+        packed = packed_sections[:, k]
+        pct = percentages[packed]
+        result[f"{table.section.key}_pct"] = pct
+        weighted_pct = weighted_pct + pct * table.section.total_weight
+        total_wd = total_wd + weighted_sums[packed]
+        masks |= (risk_bits[packed] != 0).astype(np.int64) << k
+
+    total_wt = schema.total_weight
+    if not total_wt:
+        result["total_pct"] = np.zeros(len(codes))
+    elif schema.total_mode == TOTAL_POOLED:
+        result["total_pct"] = total_wd / total_wt * 100
+    else:
+        result["total_pct"] = weighted_pct / total_wt
+    result["item_scores"] = schema.score_table[np.arange(schema.question_count), codes]
+    result["risk_mask"] = masks
+    return result
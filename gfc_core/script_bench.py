@@ -0,0 +1,158 @@
+"""
+상담 스크립트 렌더링 벤치마크
+
+템플릿 방식 generate_consultation_script 와 기존 문자열 연결 방식(참조 구현) 의 출력이
+동일한지 확인하고, 초당 생성 건수를 비교합니다. 출력이 다르면 종료 코드 1 을 반환합니다.
+
+실행: python -m gfc_core.script_bench [--samples 2000] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .priority import get_priority_items
+from .questions import SOLUTIONS
+from .schema import SCHEMA
+from .scoring import get_risk_level, score_codes
+from .script import generate_consultation_script
+from .solutions import get_recommended_solutions
+
+def reference_consultation_script(info: Dict, scores: Dict, priority_items: List[Dict],
+                                  solutions: List[Dict], default_company: str = "WOORI(주)",
+                                  generated_at: datetime = None) -> str:
+    """기존 generate_consultation_script 원본 (생성 시각만 인자로 받도록 변경)"""
+    total_pct = scores["total_pct"]
+    label, _ = get_risk_level(total_pct)
+
+    company = info.get("company", default_company) or default_company
+    industry = info.get("industry", "") or "업종 미입력"
+    employees = info.get("employees", "") or "?"
+    ceo = info.get("ceo", "대표자") or "대표자"
+    est = info.get("est", "") or "미입력"
+    revenue = info.get("revenue", "") or "미입력"
+
+    lines = [
+        "=" * 52,
+        "   GFC 상담 스크립트  |  삼성생명 기업재무컨설팅",
+        "   진단 기반 자동생성",
+        "=" * 52,
+        "",
+        f"  기업명    : {company}",
+        f"  업종      : {industry}",
+        f"  종업원 수 : {employees}명",
+        f"  대표자    : {ceo}",
+        f"  설립 연차 : {est}",
+        f"  연 매출   : {revenue}",
+        f"  진단 충족율: {total_pct:.0f}% ({label})",
+        f"  생성일    : {(generated_at or datetime.now()).strftime('%Y.%m.%d %H:%M')}",
+        "",
+        "─" * 52,
+        " 1. 도입 인사",
+        "─" * 52,
+    ]
+
+    top_section = priority_items[0]["section"] if priority_items else "주요 영역"
+    lines.append(f"""
+안녕하세요, {ceo}님. 삼성생명 GFC 기업재무컨설팅 담당 컨설턴트입니다.
+
+오늘 귀사의 법인 리스크 사전 진단을 완료했는데,
+종합 리스크율이 {total_pct:.0f}%({label}) 수준으로 나왔습니다.
+
+특히 '{top_section}' 부분에서 즉각적인 대비가 필요한
+사항들이 도출되었습니다.
+
+오늘 주요 내용을 안내드리고, 귀사에 맞는
+종합 컨설팅 제안까지 함께 검토하겠습니다.
+""")
+
+    lines.extend(["─" * 52, " 2. 리스크별 상세 상담", "─" * 52])
+
+    grouped = OrderedDict()
+    for item in priority_items:
+        section = item["section"]
+        grouped.setdefault(section, []).append(item)
+
+    for section, items in grouped.items():
+        lines.append(f"\n▸ {section} ({len(items)}건 해당)")
+        lines.append("-" * 40)
+        for item in items:
+            response = "예" if item['score'] == 1.0 else "일부 해당" if item['score'] == 0.5 else "아니오"
+            lines.append(f"  📌 진단 항목 (가중치 {item['w']})")
+            lines.append(f"     질문 : {item['text']}")
+            lines.append(f"     응답 : {response}")
+            lines.append("")
+
+    lines.extend(["─" * 52, " 3. 추천 솔루션 제안", "─" * 52])
+    for solution in solutions:
+        lines.append(f"\n  {solution['icon']} {solution['name']}")
+        lines.append(f"     {solution['desc']}")
+
+    lines.extend(["\n" + "─" * 52, " 4. 마무리 및 다음 단계", "─" * 52])
+    lines.append("""
+오늘 진단 결과를 기반으로, 귀사에 맞는
+'종합 법인 재무 컨설팅 제안서'를 별도로 작성하여 드리겠습니다.
+
+세무사, 회계사, 법무사 등 전문가와 협업하여
+최적의 구조를 설계드리고, 단계별 실행 계획까지
+제안드리겠습니다.
+
+다음 단계로 상세 제안서 검토 일정을 잡아드리면 되겠습니다.
+언제 가능하신가요?
+""")
+    lines.append("=" * 52)
+
+    return "\n".join(lines)
+
+def sample_inputs(samples: int, seed: int) -> List[Tuple[Dict, Dict, List[Dict], List[Dict]]]:
+    """무작위 응답 기반 (info, scores, 우선 대응 항목, 추천 솔루션) 목록"""
+    rng = random.Random(seed)
+    inputs = []
+    for n in range(samples):
+        codes = [rng.randrange(-1, len(options)) for options in SCHEMA.options]
+        scores = score_codes(codes, SCHEMA)
+        info = {"company": f"테스트{n}(주)" if n % 5 else "", "industry": rng.choice(["제조업", ""]),
+                "ceo": rng.choice(["김대표", ""]), "employees": rng.choice(["10~30", ""]),
+                "est": rng.choice(["5~10년", ""]), "revenue": rng.choice(["50~100억", ""])}
+        inputs.append((info, scores, get_priority_items(scores["all_items"]),
+                       get_recommended_solutions(scores["all_items"]) if n % 7 else list(SOLUTIONS)))
+    return inputs
+
+def measure(render: Callable, inputs: Sequence[Tuple], repeat: int, generated_at: datetime) -> float:
+    """최고 반복 기준 초당 생성 건수"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for info, scores, priority_items, solutions in inputs:
+            render(info, scores, priority_items, solutions, generated_at=generated_at)
+        best = min(best, time.perf_counter() - started)
+    return len(inputs) / best
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="상담 스크립트 렌더링 벤치마크")
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    inputs = sample_inputs(args.samples, args.seed)
+    generated_at = datetime(2025, 1, 1, 9, 0)
+    mismatches = sum(
+        generate_consultation_script(*sample, generated_at=generated_at)
+        != reference_consultation_script(*sample, generated_at=generated_at)
+        for sample in inputs
+    )
+
+    reference = measure(reference_consultation_script, inputs, args.repeat, generated_at)
+    templated = measure(generate_consultation_script, inputs, args.repeat, generated_at)
+    print(f"{'reference':<10} {reference:>10,.0f} scripts/s")
+    print(f"{'template':<10} {templated:>10,.0f} scripts/s  ({templated / reference:.2f}x)")
+    print(f"{'output':<10} {'OK' if not mismatches else f'MISMATCH {mismatches}/{len(inputs)}'}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
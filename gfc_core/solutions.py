@@ -0,0 +1,110 @@
+"""
+리스크 유형별 추천 솔루션 매칭
+
+섹션마다 비트 1개를 배정하고(sections 순서), 솔루션마다 추천 조건이 되는 섹션 비트마스크를
+미리 계산해 둡니다. 응답별로 "리스크(점수 > 0)가 있는 섹션" 비트마스크를 만들면
+솔루션 추천 여부는 AND 한 번으로 결정됩니다.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .questions import SOLUTIONS
+from .schema import SCHEMA, QuestionSchema
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 솔루션 trigger → 추천 조건 섹션 키 (None = 모든 섹션)
+TRIGGER_SECTIONS = {
+    "keyman": ("km",),
+    "corp": ("cr",),
+    "all": None,
+}
+
+@lru_cache(maxsize=None)
+def solution_masks(schema: QuestionSchema = SCHEMA) -> Tuple[int, ...]:
+    """SOLUTIONS 순서의 솔루션별 섹션 비트마스크 (정의되지 않은 trigger = 0, 추천 안 함)"""
+    all_sections = (1 << len(schema.sections)) - 1
+    masks = []
+    for solution in SOLUTIONS:
+        keys = TRIGGER_SECTIONS.get(solution["trigger"], ())
+        if keys is None:
+            masks.append(all_sections)
+        else:
+            masks.append(sum(1 << k for k, section in enumerate(schema.sections) if section.key in keys))
+    return tuple(masks)
+
+def risk_mask(item_scores: Sequence[float], schema: QuestionSchema = SCHEMA) -> int:
+    """문항 순서의 점수 목록 → 리스크가 있는 섹션 비트마스크"""
+    mask = 0
+    for section_index, score in zip(schema.item_sections, item_scores):
+        if score > 0:
+            mask |= 1 << section_index
+    return mask
+
+def solutions_for_mask(mask: int, schema: QuestionSchema = SCHEMA) -> List[Dict]:
+    """섹션 비트마스크에 해당하는 추천 솔루션 (SOLUTIONS 순서)"""
+    return [solution for solution, solution_mask in zip(SOLUTIONS, solution_masks(schema))
+            if mask & solution_mask]
+
+@lru_cache(maxsize=None)
+def _item_section_names(schema: QuestionSchema = SCHEMA) -> Tuple[str, ...]:
+    """문항 순서의 섹션 이름 (all_items 가 스키마 순서인지 확인용)"""
+    return tuple(schema.sections[k].name for k in schema.item_sections)
+
+def _solutions_by_section(all_items: List[Dict], schema: QuestionSchema = SCHEMA) -> List[Dict]:
+    """문항의 section 이름으로 리스크 섹션을 찾는 추천 (문항 수 · 순서와 무관)"""
+    section_names = {section.key: section.name for section in schema.sections}
+    risk_sections = {item["section"] for item in all_items if item["score"] > 0}
+    recommended = []
+    for solution in SOLUTIONS:
+        keys = TRIGGER_SECTIONS.get(solution["trigger"], ())
+        if keys is None:
+            matched = bool(risk_sections)
+        else:
+            matched = any(section_names[key] in risk_sections for key in keys)
+        if matched:
+            recommended.append(solution)
+    return recommended
+
+def get_recommended_solutions(all_items: List[Dict], schema: QuestionSchema = SCHEMA) -> List[Dict]:
+    """
+    추천 솔루션 필터링
+
+    all_items 가 calculate_all_scores() 의 문항 순서(스키마 순서)이면 섹션 비트마스크로,
+    문항 수나 순서가 다르면(일부 문항 · 정렬된 목록 등) 문항의 section 이름으로 판정합니다.
+    """
+    if tuple(item["section"] for item in all_items) != _item_section_names(schema):
+        return _solutions_by_section(all_items, schema)
+    return solutions_for_mask(risk_mask([item["score"] for item in all_items], schema), schema)
+
+def recommend_batch(item_scores, schema: QuestionSchema = SCHEMA) -> "np.ndarray":
+    """
+    다수 기업 추천 솔루션 일괄 계산
+
+    item_scores: score_batch()["item_scores"] 형태의 (기업 수, 문항 수) 점수 행렬.
+    반환: (기업 수, 솔루션 수) bool 행렬, 열 순서 = SOLUTIONS.
+    """
+    import numpy as np
+
+    scores = np.asarray(item_scores)
+    if scores.ndim != 2 or scores.shape[1] != schema.question_count:
+        raise ValueError(f"item_scores must have shape (n, {schema.question_count}), got {scores.shape}")
+
+    masks = np.zeros(len(scores), dtype=np.int64)
+    for k, section in enumerate(schema.sections):
+        has_risk = (scores[:, section.slice] > 0).any(axis=1)
+        masks |= has_risk.astype(np.int64) << k
+    return solutions_for_masks(masks, schema)
+
+def solutions_for_masks(masks, schema: QuestionSchema = SCHEMA) -> "np.ndarray":
+    """
+    섹션 비트마스크 배열 → 추천 솔루션 bool 행렬 (열 순서 = SOLUTIONS)
+
+    masks: score_batch()["risk_mask"] 형태의 (기업 수,) 정수 배열.
+    """
+    import numpy as np
+
+    masks = np.asarray(masks, dtype=np.int64)
+    return (masks[:, None] & np.array(solution_masks(schema), dtype=np.int64)) != 0
@@ -0,0 +1,88 @@
+"""
+앱 콜드 스타트 시간 측정
+
+앱마다 새 Python 프로세스를 띄워 (1) 앱 모듈 import 시간과 import 직후 로드된 무거운 모듈,
+(2) Streamlit AppTest 첫 렌더링 시간(앱 의존성 import 포함)을 측정합니다.
+기준값을 넘으면 종료 코드 1 을 반환하므로 회귀 확인용으로 사용할 수 있습니다.
+
+실행: python -m gfc_core.startup_bench [--runs 3] [--max-import-ms 500] [--max-render-ms 3000] [앱 ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, Sequence
+
+from . import APP_DIR
+
+APPS = ("ssgfc", "chart", "GCFchart", "gfc_diagnosis", "GFCchart")
+HEAVY_MODULES = ("plotly.graph_objects", "numpy", "pandas")
+
+# 앱 모듈 import (Streamlit 자체 import 시간은 제외)
+_IMPORT_PROBE = """
+import importlib, json, sys, time, warnings
+warnings.simplefilter("ignore")
+import streamlit
+before = set(sys.modules)
+started = time.perf_counter()
+importlib.import_module({app!r})
+elapsed = time.perf_counter() - started
+heavy = [m for m in {heavy!r} if m in sys.modules and m not in before]
+print(json.dumps({{"ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+# AppTest 첫 렌더링 (앱 스크립트 실행 + 앱 의존성 import)
+_RENDER_PROBE = """
+import json, time, warnings
+warnings.simplefilter("ignore")
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({path!r}, default_timeout=120)
+started = time.perf_counter()
+app.run()
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "errors": len(app.exception)}}))
+"""
+
+def _probe(code: str) -> Dict:
+    completed = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True,
+                               text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def measure_app(app: str, runs: int) -> Dict:
+    """앱별 import / 첫 렌더링 시간 중앙값 (ms)"""
+    imports = [_probe(_IMPORT_PROBE.format(app=app, heavy=HEAVY_MODULES)) for _ in range(runs)]
+    path = os.path.join(APP_DIR, f"{app}.py")
+    renders = [_probe(_RENDER_PROBE.format(path=path)) for _ in range(runs)]
+    return {
+        "app": app,
+        "import_ms": statistics.median(r["ms"] for r in imports),
+        "render_ms": statistics.median(r["ms"] for r in renders),
+        "heavy": imports[-1]["heavy"],
+        "errors": max(r["errors"] for r in renders),
+    }
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="앱 콜드 스타트 시간 측정")
+    parser.add_argument("apps", nargs="*", default=list(APPS), help="측정할 앱 모듈명")
+    parser.add_argument("--runs", type=int, default=3, help="앱별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="앱 import 시간 기준값")
+    parser.add_argument("--max-render-ms", type=float, default=None, help="첫 렌더링 시간 기준값")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'app':<14} {'import':>9} {'render':>9}  heavy imports")
+    for app in args.apps:
+        result = measure_app(app, args.runs)
+        over = (result["errors"] > 0
+                or (args.max_import_ms is not None and result["import_ms"] > args.max_import_ms)
+                or (args.max_render_ms is not None and result["render_ms"] > args.max_render_ms))
+        failed |= over
+        print(f"{app:<14} {result['import_ms']:>7.0f}ms {result['render_ms']:>7.0f}ms  "
+              f"{', '.join(result['heavy']) or '-'}{'  FAIL' if over else ''}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
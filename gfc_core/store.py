@@ -0,0 +1,340 @@
+"""
+진단 결과 저장소 (SQLite)
+
+완료된 진단(기업 정보 · 응답 원본 · 섹션별 리스크율 · 우선 대응 항목)을 내장 SQLite 파일에 보관합니다.
+WAL 모드로 여러 Streamlit 세션이 동시에 읽고 쓸 수 있으며, 기업명 · 담당 컨설턴트 · 진단일 ·
+리스크 레벨 인덱스로 이전 진단을 바로 다시 불러올 수 있습니다.
+저장과 같은 트랜잭션에서 기본 정보 차원별 집계 큐브(리스크율 분포 · 우선 항목 빈도)를 갱신합니다.
+add() 로 쌓인 기록은 batch_size 마다, 그리고 프로세스 종료 시(atexit) 기록됩니다.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from . import APP_DIR
+from .scoring import get_risk_level
+
+# 실행 디렉터리와 무관하게 앱 디렉터리에 저장
+DEFAULT_DB_PATH = os.path.join(APP_DIR, "gfc_diagnoses.db")
+# add() 로 쌓인 기록을 한 트랜잭션으로 기록하는 단위
+DEFAULT_BATCH_SIZE = 500
+
+# 기본 정보 필드 (진단 탭 info 키)
+INFO_FIELDS = ("company", "industry", "ceo", "adviser", "est", "employees", "revenue",
+               "ceo_age", "ceo_share")
+SECTION_KEYS = ("km", "cr", "aw", "sc")
+
+_SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS diagnoses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    diagnosis_date TEXT NOT NULL,
+    {", ".join(f"{field} TEXT NOT NULL DEFAULT ''" for field in INFO_FIELDS)},
+    questionnaire TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    km_pct REAL NOT NULL,
+    cr_pct REAL NOT NULL,
+    aw_pct REAL NOT NULL,
+    sc_pct REAL NOT NULL,
+    total_pct REAL NOT NULL,
+    risk_level TEXT NOT NULL,
+    priority TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_diagnoses_company ON diagnoses (company, diagnosis_date);
+CREATE INDEX IF NOT EXISTS idx_diagnoses_adviser ON diagnoses (adviser, diagnosis_date);
+CREATE INDEX IF NOT EXISTS idx_diagnoses_date ON diagnoses (diagnosis_date);
+CREATE INDEX IF NOT EXISTS idx_diagnoses_risk_level ON diagnoses (risk_level, diagnosis_date);
+CREATE TABLE IF NOT EXISTS portfolio_cube (
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (dimension, value, metric, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS portfolio_priority (
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    item TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, value, item)
+) WITHOUT ROWID;
+"""
+
+# 포트폴리오 집계 큐브 — 저장 시 같은 트랜잭션에서 증분 갱신되므로 조회 비용이 진단 건수와 무관
+CUBE_DIMENSIONS = ("est", "employees", "revenue", "ceo_age", "ceo_share")
+CUBE_METRICS = ("total_pct", "km_pct", "cr_pct", "aw_pct", "sc_pct")
+# 리스크율 분포 구간 수 (10% 단위, 100% 는 마지막 구간)
+CUBE_BINS = 10
+# 전체 집계 슬라이스
+ALL_DIMENSION = "all"
+
+_COLUMNS = (("created_at", "diagnosis_date") + INFO_FIELDS
+            + ("questionnaire", "answers", "km_pct", "cr_pct", "aw_pct", "sc_pct", "total_pct",
+               "risk_level", "priority"))
+_INSERT_SQL = (f"INSERT INTO diagnoses ({', '.join(_COLUMNS)}) "
+               f"VALUES ({', '.join('?' for _ in _COLUMNS)})")
+_CUBE_UPSERT_SQL = (
+    "INSERT INTO portfolio_cube (dimension, value, metric, bucket, count, total) VALUES (?, ?, ?, ?, 1, ?) "
+    "ON CONFLICT (dimension, value, metric, bucket) "
+    "DO UPDATE SET count = count + 1, total = total + excluded.total"
+)
+_PRIORITY_UPSERT_SQL = (
+    "INSERT INTO portfolio_priority (dimension, value, item, count) VALUES (?, ?, ?, 1) "
+    "ON CONFLICT (dimension, value, item) DO UPDATE SET count = count + 1"
+)
+_SUMMARY_COLUMNS = ("id", "diagnosis_date", "company", "industry", "ceo", "adviser",
+                    "total_pct", "risk_level")
+
+def build_record(info: Dict, section_answers: Sequence[Sequence[str]], scores: Dict,
+                 priority_items: List[Dict], questionnaire: str = "v2",
+                 created_at: datetime = None) -> Dict:
+    """진단 1건 저장용 레코드 구성 (section_answers = KEYMAN → CORPORATE → AWARENESS → SCENARIO)"""
+    created_at = created_at or datetime.now()
+    record = {
+        "created_at": created_at.isoformat(timespec="seconds"),
+        "diagnosis_date": created_at.date().isoformat(),
+        "questionnaire": questionnaire,
+        "answers": {key: list(answers) for key, answers in zip(SECTION_KEYS, section_answers)},
+        "risk_level": get_risk_level(scores["total_pct"])[0],
+        "priority": [item["text"] for item in priority_items],
+    }
+    for field in INFO_FIELDS:
+        record[field] = info.get(field) or ""
+    for key in SECTION_KEYS + ("total",):
+        record[f"{key}_pct"] = scores[f"{key}_pct"]
+    return record
+
+def _row_values(record: Dict) -> tuple:
+    values = []
+    for column in _COLUMNS:
+        value = record[column]
+        values.append(json.dumps(value, ensure_ascii=False) if column in ("answers", "priority") else value)
+    return tuple(values)
+
+def _bucket(pct: float) -> int:
+    return min(max(int(pct * CUBE_BINS // 100), 0), CUBE_BINS - 1)
+
+def _cube_rows(records: Iterable[Dict]):
+    """레코드별 큐브 · 우선 항목 빈도 갱신 행 (전체 + 입력된 차원별 슬라이스)"""
+    cube_rows, priority_rows = [], []
+    for record in records:
+        slices = [(ALL_DIMENSION, "")] + [
+            (dimension, record[dimension]) for dimension in CUBE_DIMENSIONS if record.get(dimension)
+        ]
+        for dimension, value in slices:
+            for metric in CUBE_METRICS:
+                pct = record[metric]
+                cube_rows.append((dimension, value, metric, _bucket(pct), pct))
+            priority_rows.extend((dimension, value, item) for item in record["priority"])
+    return cube_rows, priority_rows
+
+def _insert(conn: sqlite3.Connection, records: List[Dict]):
+    """진단 기록 + 큐브 갱신 (호출자 트랜잭션 안에서)"""
+    conn.executemany(_INSERT_SQL, [_row_values(record) for record in records])
+    cube_rows, priority_rows = _cube_rows(records)
+    conn.executemany(_CUBE_UPSERT_SQL, cube_rows)
+    conn.executemany(_PRIORITY_UPSERT_SQL, priority_rows)
+
+def _decode(row: sqlite3.Row) -> Dict:
+    record = dict(row)
+    for column in ("answers", "priority"):
+        if column in record:
+            record[column] = json.loads(record[column])
+    return record
+
+# 프로세스 종료 시 add() 대기열을 기록할 저장소 (약한 참조, 저장소 수명에 관여하지 않음)
+_OPEN_STORES: "weakref.WeakSet[DiagnosisStore]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_stores():
+    for store in list(_OPEN_STORES):
+        store.flush()
+
+class DiagnosisStore:
+    """진단 결과 SQLite 저장소 (스레드별 연결, 프로세스 내 여러 세션이 공유)"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._pending: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA_SQL)
+        if self._cube_count() != self.count():
+            self.rebuild_cubes()
+        _OPEN_STORES.add(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ── 쓰기 ────────────────────────────────────────────────
+
+    def save(self, record: Dict) -> int:
+        """진단 1건 즉시 저장, id 반환"""
+        with self._connect() as conn:
+            diagnosis_id = conn.execute(_INSERT_SQL, _row_values(record)).lastrowid
+            cube_rows, priority_rows = _cube_rows([record])
+            conn.executemany(_CUBE_UPSERT_SQL, cube_rows)
+            conn.executemany(_PRIORITY_UPSERT_SQL, priority_rows)
+            return diagnosis_id
+
+    def save_many(self, records: Iterable[Dict]) -> int:
+        """여러 건을 한 트랜잭션으로 저장, 저장 건수 반환"""
+        records = list(records)
+        self._write(records)
+        return len(records)
+
+    def add(self, record: Dict):
+        """기록 대기열에 추가 (batch_size 마다 일괄 저장)"""
+        with self._pending_lock:
+            self._pending.append(record)
+            if len(self._pending) < self.batch_size:
+                return
+            records, self._pending = self._pending, []
+        self._write(records)
+
+    def flush(self) -> int:
+        """대기 중인 기록 일괄 저장, 저장 건수 반환"""
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+        self._write(records)
+        return len(records)
+
+    def _write(self, records: List[Dict]):
+        if records:
+            with self._connect() as conn:
+                _insert(conn, records)
+
+    def rebuild_cubes(self, chunk_size: int = 10_000):
+        """저장된 전체 진단으로 집계 큐브 재구성 (큐브 도입 이전 저장소 · 불일치 복구용)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM portfolio_cube")
+            conn.execute("DELETE FROM portfolio_priority")
+            for records in self.iter_records(chunk_size=chunk_size):
+                cube_rows, priority_rows = _cube_rows(records)
+                conn.executemany(_CUBE_UPSERT_SQL, cube_rows)
+                conn.executemany(_PRIORITY_UPSERT_SQL, priority_rows)
+
+    # ── 조회 ────────────────────────────────────────────────
+
+    def find(self, company: str = None, adviser: str = None, risk_level: str = None,
+             date_from: str = None, date_to: str = None, limit: int = 50) -> List[Dict]:
+        """조건별 진단 목록 (최신순, 요약 컬럼) — company 는 앞부분 일치"""
+        clauses, params = [], []
+        if company:
+            clauses.append("company >= ? AND company < ?")
+            params += [company, company + "\U0010ffff"]
+        if adviser:
+            clauses.append("adviser = ?")
+            params.append(adviser)
+        if risk_level:
+            clauses.append("risk_level = ?")
+            params.append(risk_level)
+        if date_from:
+            clauses.append("diagnosis_date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("diagnosis_date <= ?")
+            params.append(date_to)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connect().execute(
+            f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM diagnoses {where} "
+            f"ORDER BY diagnosis_date DESC, id DESC LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def load(self, diagnosis_id: int) -> Optional[Dict]:
+        """진단 1건 전체 (answers · priority 복원)"""
+        row = self._connect().execute("SELECT * FROM diagnoses WHERE id = ?", (diagnosis_id,)).fetchone()
+        return _decode(row) if row else None
+
+    def latest(self, company: str, adviser: str = None) -> Optional[Dict]:
+        """기업의 가장 최근 진단 (기업명 완전 일치)"""
+        sql = "SELECT * FROM diagnoses WHERE company = ?"
+        params = [company]
+        if adviser:
+            sql += " AND adviser = ?"
+            params.append(adviser)
+        row = self._connect().execute(sql + " ORDER BY diagnosis_date DESC, id DESC LIMIT 1", params).fetchone()
+        return _decode(row) if row else None
+
+    def iter_records(self, after_id: int = 0, chunk_size: int = 10_000) -> Iterator[List[Dict]]:
+        """id > after_id 인 진단 전체를 id 순 chunk_size 건씩 (아카이브 내보내기용)"""
+        conn = self._connect()
+        while True:
+            rows = conn.execute("SELECT * FROM diagnoses WHERE id > ? ORDER BY id LIMIT ?",
+                                (after_id, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield [_decode(row) for row in rows]
+            after_id = rows[-1]["id"]
+
+    def count(self) -> int:
+        """저장된 진단 건수"""
+        return self._connect().execute("SELECT COUNT(*) FROM diagnoses").fetchone()[0]
+
+    # ── 포트폴리오 집계 ─────────────────────────────────────
+
+    def _cube_count(self) -> int:
+        row = self._connect().execute(
+            "SELECT COALESCE(SUM(count), 0) FROM portfolio_cube WHERE dimension = ? AND value = '' "
+            "AND metric = ?", (ALL_DIMENSION, CUBE_METRICS[0]),
+        ).fetchone()
+        return row[0]
+
+    def portfolio_values(self, dimension: str) -> Dict[str, int]:
+        """차원별 저장된 값과 진단 건수"""
+        rows = self._connect().execute(
+            "SELECT value, SUM(count) FROM portfolio_cube WHERE dimension = ? AND metric = ? GROUP BY value",
+            (dimension, CUBE_METRICS[0]),
+        ).fetchall()
+        return {value: count for value, count in rows}
+
+    def portfolio(self, dimension: str = ALL_DIMENSION, value: str = "", top: int = 10) -> Dict:
+        """
+        슬라이스별 포트폴리오 집계
+
+        반환: {"count": 진단 건수,
+               "metrics": {metric: {"histogram": 구간별 건수 (CUBE_BINS 개), "mean": 평균}},
+               "priority": [(항목, 빈도), ...] 빈도 내림차순 top 건}
+        """
+        if dimension == ALL_DIMENSION:
+            value = ""
+        elif dimension not in CUBE_DIMENSIONS:
+            raise ValueError(f"unknown dimension: {dimension!r} (expected one of {CUBE_DIMENSIONS})")
+        conn = self._connect()
+        metrics = {metric: {"histogram": [0] * CUBE_BINS, "mean": 0.0} for metric in CUBE_METRICS}
+        totals = dict.fromkeys(CUBE_METRICS, 0.0)
+        for metric, bucket, count, total in conn.execute(
+            "SELECT metric, bucket, count, total FROM portfolio_cube WHERE dimension = ? AND value = ?",
+            (dimension, value),
+        ):
+            metrics[metric]["histogram"][bucket] = count
+            totals[metric] += total
+        count = sum(metrics[CUBE_METRICS[0]]["histogram"])
+        if count:
+            for metric in CUBE_METRICS:
+                metrics[metric]["mean"] = totals[metric] / count
+        priority = conn.execute(
+            "SELECT item, count FROM portfolio_priority WHERE dimension = ? AND value = ? "
+            "ORDER BY count DESC, item LIMIT ?",
+            (dimension, value, top),
+        ).fetchall()
+        return {"count": count, "metrics": metrics, "priority": [tuple(row) for row in priority]}
@@ -0,0 +1,171 @@
+"""
+경량 SVG 차트 렌더러
+
+Plotly 없이 게이지 · 레이더 · 수평 바 차트를 인라인 SVG 문자열로 생성합니다.
+색상 · 구간은 RISK_LEVELS 및 대시보드 Plotly 차트와 동일하며, 결과는 한 줄 문자열이므로
+st.markdown(..., unsafe_allow_html=True) 로 바로 삽입할 수 있습니다.
+"""
+
+import math
+from html import escape
+from typing import List, Sequence, Tuple
+
+from .questions import RISK_LEVELS
+
+FONT_FAMILY = "Noto Sans KR"
+TEXT_COLOR = "#cbd5e1"
+TICK_COLOR = "#64748b"
+AXIS_LABEL_COLOR = "#94a3b8"
+GRID_COLOR = "#1e3a5f"
+
+GAUGE_BG_COLOR = "#1a2736"
+# RISK_LEVELS 순서와 동일한 게이지 구간 배경색
+GAUGE_STEP_COLORS = ("#1a2e3d", "#1f3040", "#261f2e", "#2a1a1a")
+
+RADAR_LINE_COLOR = "#dc2626"
+RADAR_FILL_COLOR = "rgba(220,38,38,0.15)"
+
+def _num(value: float) -> str:
+    """좌표 출력 (소수점 1자리, 불필요한 0 제거)"""
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+def _text(x: float, y: float, content: str, size: int, color: str,
+          anchor: str = "middle", weight: str = None) -> str:
+    bold = f' font-weight="{weight}"' if weight else ""
+    return (f'<text x="{_num(x)}" y="{_num(y)}" font-size="{size}" fill="{color}" '
+            f'text-anchor="{anchor}"{bold}>{escape(content)}</text>')
+
+def _svg(width: int, height: int, body: List[str]) -> str:
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+            f'width="100%" style="max-height:{height}px;display:block;margin:auto" '
+            f'font-family="{FONT_FAMILY}" role="img">{"".join(body)}</svg>')
+
+def format_percent(percentage: float) -> str:
+    """게이지 숫자 표기 (33.0 → 33%, 33.6 → 33.6%)"""
+    return f"{round(percentage, 1):g}%"
+
+# ═══════════════════════════════════════════════════════════
+# GAUGE
+# ═══════════════════════════════════════════════════════════
+
+def risk_bands() -> List[Tuple[float, float, str, str]]:
+    """RISK_LEVELS 기반 게이지 구간 (시작, 끝, 레벨명, 배경색)"""
+    bands, start = [], 0
+    for level, step_color in zip(RISK_LEVELS, GAUGE_STEP_COLORS):
+        bands.append((start, level.threshold, level.name, step_color))
+        start = level.threshold
+    return bands
+
+def _gauge_point(cx: float, cy: float, r: float, value: float) -> Tuple[float, float]:
+    angle = math.pi * (1 - max(0.0, min(value, 100.0)) / 100)
+    return cx + r * math.cos(angle), cy - r * math.sin(angle)
+
+def _gauge_arc(cx: float, cy: float, r: float, start: float, stop: float,
+               color: str, width: float) -> str:
+    x0, y0 = _gauge_point(cx, cy, r, start)
+    x1, y1 = _gauge_point(cx, cy, r, stop)
+    return (f'<path d="M{_num(x0)} {_num(y0)}A{_num(r)} {_num(r)} 0 0 1 {_num(x1)} {_num(y1)}" '
+            f'fill="none" stroke="{color}" stroke-width="{_num(width)}"/>')
+
+def gauge_svg(percentage: float, label: str, color: str) -> str:
+    """종합 리스크율 반원 게이지"""
+    width, height = 300, 200
+    cx, cy, r, band = 150, 155, 105, 34
+
+    body = [_gauge_arc(cx, cy, r, 0, 100, GAUGE_BG_COLOR, band + 4)]
+    for start, stop, _, step_color in risk_bands():
+        body.append(_gauge_arc(cx, cy, r, start, stop, step_color, band))
+    if percentage > 0:
+        body.append(_gauge_arc(cx, cy, r, 0, percentage, color, band * 0.5))
+
+    x0, y0 = _gauge_point(cx, cy, r - band / 2, percentage)
+    x1, y1 = _gauge_point(cx, cy, r + band / 2, percentage)
+    body.append(f'<line x1="{_num(x0)}" y1="{_num(y0)}" x2="{_num(x1)}" y2="{_num(y1)}" '
+                f'stroke="{color}" stroke-width="3"/>')
+
+    for start, _, name, _ in risk_bands():
+        tx, ty = _gauge_point(cx, cy, r + band / 2 + 10, start)
+        anchor = "end" if start < 40 else ("start" if start > 60 else "middle")
+        body.append(_text(tx, ty, name, 9, TICK_COLOR, anchor))
+
+    body.append(_text(cx, cy - 12, format_percent(percentage), 28, "#fff", weight="700"))
+    body.append(_text(cx, cy + 28, label, 14, color, weight="700"))
+    body.append(f"<title>종합 리스크율 {escape(format_percent(percentage))} ({escape(label)})</title>")
+    return _svg(width, height, body)
+
+# ═══════════════════════════════════════════════════════════
+# RADAR
+# ═══════════════════════════════════════════════════════════
+
+def radar_svg(values: Sequence[float], categories: Sequence[str]) -> str:
+    """레이더 차트 (첫 축 = 오른쪽, 반시계 방향 · 카테고리의 <br> 은 줄바꿈)"""
+    width, height = 400, 290
+    cx, cy, r = 200, 145, 105
+    count = len(values)
+
+    def point(i: int, value: float) -> Tuple[float, float]:
+        angle = 2 * math.pi * i / count
+        scaled = r * max(0.0, min(value, 100.0)) / 100
+        return cx + scaled * math.cos(angle), cy - scaled * math.sin(angle)
+
+    body = []
+    for tick in (25, 50, 75, 100):
+        body.append(f'<circle cx="{cx}" cy="{cy}" r="{_num(r * tick / 100)}" fill="none" '
+                    f'stroke="{GRID_COLOR}"/>')
+    for i in range(count):
+        x, y = point(i, 100)
+        body.append(f'<line x1="{cx}" y1="{cy}" x2="{_num(x)}" y2="{_num(y)}" stroke="{GRID_COLOR}"/>')
+    for tick in (0, 25, 50, 75, 100):
+        body.append(_text(cx + r * tick / 100, cy + 10, str(tick), 8, "#475569"))
+
+    for i, category in enumerate(categories):
+        angle = 2 * math.pi * i / count
+        x, y = cx + (r + 14) * math.cos(angle), cy - (r + 14) * math.sin(angle)
+        anchor = "middle" if abs(math.cos(angle)) < 0.3 else ("start" if math.cos(angle) > 0 else "end")
+        lines = category.split("<br>")
+        top = y - (len(lines) - 1) * 7 + (4 if abs(math.sin(angle)) < 0.3 else (-4 if math.sin(angle) > 0 else 10))
+        spans = "".join(f'<tspan x="{_num(x)}" dy="{0 if j == 0 else 14}">{escape(line)}</tspan>'
+                        for j, line in enumerate(lines))
+        body.append(f'<text x="{_num(x)}" y="{_num(top)}" font-size="11" fill="{AXIS_LABEL_COLOR}" '
+                    f'text-anchor="{anchor}">{spans}</text>')
+
+    points = [point(i, v) for i, v in enumerate(values)]
+    body.append(f'<polygon points="{" ".join(f"{_num(x)},{_num(y)}" for x, y in points)}" '
+                f'fill="{RADAR_FILL_COLOR}" stroke="{RADAR_LINE_COLOR}" stroke-width="2"/>')
+    for (x, y), value, category in zip(points, values, categories):
+        body.append(f'<circle cx="{_num(x)}" cy="{_num(y)}" r="3" fill="{RADAR_LINE_COLOR}">'
+                    f'<title>{escape(category.replace("<br>", " "))} {value:.0f}%</title></circle>')
+    return _svg(width, height, body)
+
+# ═══════════════════════════════════════════════════════════
+# HORIZONTAL BAR
+# ═══════════════════════════════════════════════════════════
+
+def bar_svg(values: Sequence[float], categories: Sequence[str], colors: Sequence[str],
+            labels: Sequence[str]) -> str:
+    """수평 바 차트 (Plotly 와 동일하게 첫 카테고리가 맨 아래)"""
+    width, height = 600, 180
+    left, right, top, bottom = 130, 590, 8, 152
+    row = (bottom - top) / len(values)
+    bar_height = row * 0.6
+
+    def x_of(value: float) -> float:
+        return left + (right - left) * max(0.0, min(value, 100.0)) / 100
+
+    body = []
+    for tick in (0, 25, 50, 75, 100):
+        x = x_of(tick)
+        body.append(f'<line x1="{_num(x)}" y1="{top}" x2="{_num(x)}" y2="{bottom}" stroke="{GRID_COLOR}"/>')
+        body.append(_text(x, bottom + 16, str(tick), 9, TICK_COLOR))
+
+    for i, (value, category, color, label) in enumerate(zip(values, categories, colors, labels)):
+        y = bottom - (i + 1) * row + (row - bar_height) / 2
+        bar_width = x_of(value) - left
+        body.append(f'<rect x="{left}" y="{_num(y)}" width="{_num(bar_width)}" height="{_num(bar_height)}" '
+                    f'fill="{color}"><title>{escape(category)} 리스크율: {value:.0f}%</title></rect>')
+        body.append(_text(left - 8, y + bar_height / 2 + 4, category, 11, AXIS_LABEL_COLOR, "end"))
+        if bar_width >= 32:
+            body.append(_text(left + bar_width - 6, y + bar_height / 2 + 4, label, 11, "#fff", "end"))
+        else:
+            body.append(_text(left + bar_width + 4, y + bar_height / 2 + 4, label, 11, TEXT_COLOR, "start"))
+    return _svg(width, height, body)
@@ -0,0 +1,440 @@
+"""
+다크 테마 CSS (ssgfc.py · chart.py 공용)
+
+CSS · 고정 HTML 조각은 프로세스당 1회 압축해 두고 매 rerun 같은 바이트열을 내보냅니다.
+Streamlit 은 global.minCachedMessageSize 이상인 요소 메시지를 브라우저에 캐시하고
+이후 rerun 에서는 해시 참조만 보내므로, 내용이 고정된 조각은 세션당 1회만 전송됩니다.
+HtmlBatch 로 한 섹션의 HTML 조각(항목 · 카드 · 구분선)을 모아 요소 하나(delta 1개)로 내보내면
+rerun 당 delta 메시지 수와 DOM 요소 수가 줄어듭니다. (측정: python -m gfc_core.payload_bench)
+
+폰트는 외부 CDN 대신 static/fonts 의 Noto Sans KR 서브셋(python -m gfc_core.fonts build)을
+Streamlit 정적 경로(app/static/)로 제공하며, 파일이 없으면 시스템 한글 폰트로 표시합니다.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import List
+
+from . import APP_DIR
+
+# Streamlit 정적 파일 제공 (server.enableStaticServing): <앱 디렉터리>/static → app/static/
+FONT_DIR = os.path.join(APP_DIR, "static", "fonts")
+FONT_URL = "app/static/fonts"
+FONT_FAMILY = "Noto Sans KR"
+FONT_FILE_PREFIX = "NotoSansKR-GFC"
+# NotoSansKR-GFC-<굵기 또는 굵기 범위>.<내용 해시 8자>.woff2
+FONT_FILE_PATTERN = re.compile(rf"{FONT_FILE_PREFIX}-(\d+(?:-\d+)?)\.[0-9a-f]{{8}}\.woff2$")
+
+def compact_html(markup: str) -> str:
+    """HTML 조각의 줄 앞뒤 공백 · 빈 줄 제거 (한 줄로 합쳐 마크다운 블록 해석을 피함)"""
+    return " ".join(line.strip() for line in markup.splitlines() if line.strip())
+
+class HtmlBatch:
+    """섹션 HTML 조각 모음 (add 로 모은 조각을 html() 하나로 합쳐 st.markdown 1회로 출력)"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+
+    def add(self, markup: str) -> "HtmlBatch":
+        """조각 추가 (compact_html 로 한 줄로 압축 — 합친 뒤에도 빈 줄 · 들여쓰기 코드 블록이 생기지 않음)"""
+        self.parts.append(compact_html(markup))
+        return self
+
+    def __len__(self) -> int:
+        return len(self.parts)
+
+    def html(self) -> str:
+        return "".join(self.parts)
+
+def compact_css(css: str) -> str:
+    """CSS 공백 압축 (선택자 · 값 내부 의미는 유지)"""
+    css = re.sub(r"\s+", " ", css).strip()
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}")
+
+@lru_cache(maxsize=None)
+def font_face_css() -> str:
+    """self-hosted 폰트 @font-face 규칙 (static/fonts 서브셋 파일 기준, 없으면 빈 문자열)"""
+    names = sorted(os.listdir(FONT_DIR)) if os.path.isdir(FONT_DIR) else []
+    rules = []
+    for name in names:
+        match = FONT_FILE_PATTERN.match(name)
+        if match:
+            weight = match.group(1).replace("-", " ")
+            rules.append(f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;font-weight:{weight};"
+                         f"font-display:swap;src:url('{FONT_URL}/{name}') format('woff2')}}")
+    return "".join(rules)
+
+@lru_cache(maxsize=None)
+def dark_theme_rules() -> str:
+    """다크 테마 CSS 규칙 (<style> · @font-face 제외, 압축)"""
+    return compact_css(_DARK_THEME_CSS)
+
+@lru_cache(maxsize=None)
+def load_dark_theme_css() -> str:
+    """다크 테마 CSS 반환 (압축 · 프로세스당 1회 생성)"""
+    return f"<style>{font_face_css()}{dark_theme_rules()}</style>"
+
+_DARK_THEME_CSS = """
+    .stApp { 
+        background: #0f1623 !important; 
+        color: #cbd5e1 !important; 
+        font-family: 'Noto Sans KR', 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif !important; 
+    }
+    
+    .main .block-container { 
+        padding-top: 8px !important; 
+        padding-left: 18px !important; 
+        padding-right: 18px !important; 
+        max-width: 960px !important; 
+        margin: 0 auto !important; 
+    }
+    
+    .gfc-header { 
+        background: linear-gradient(135deg, #0a1220 0%, #152238 55%, #1a2d4a 100%); 
+        border-bottom: 1px solid #1e3a5f;
+        padding: 24px 22px 20px; 
+        border-radius: 0; 
+        margin: -8px -18px 0; 
+    }
+    
+    .gfc-header h1 { 
+        color: #fff; 
+        font-size: 22px; 
+        font-weight: 800; 
+        margin: 0; 
+        line-height: 1.3; 
+    }
+    
+    .gfc-header h1 span { 
+        color: #60a5fa; 
+    }
+    
+    .gfc-header p { 
+        color: #64748b; 
+        font-size: 11px; 
+        margin: 6px 0 0; 
+        line-height: 1.55; 
+        max-width: 700px; 
+    }
+    
+    .gfc-live { 
+        display: inline-flex; 
+        align-items: center; 
+        gap: 6px; 
+        margin-bottom: 8px; 
+    }
+    
+    .gfc-live-dot { 
+        width: 7px; 
+        height: 7px; 
+        border-radius: 50%; 
+        background: #22c55e; 
+        animation: pulse 2s infinite; 
+    }
+    
+    .gfc-live span { 
+        font-size: 10px; 
+        color: #60a5fa; 
+        font-weight: 700; 
+        letter-spacing: 1.4px; 
+        text-transform: uppercase; 
+    }
+    
+    @keyframes pulse { 
+        0%, 100% { opacity: 1 } 
+        50% { opacity: 0.4 } 
+    }
+    
+    div[data-testid="stTabs"] { 
+        border-bottom: 1px solid #1e3a5f !important; 
+    }
+    
+    button[data-testid="tab-btn"] { 
+        background: none !important; 
+        color: #64748b !important; 
+        font-size: 12px !important; 
+        font-weight: 600 !important; 
+        border: none !important; 
+        padding: 9px 14px !important; 
+        border-bottom: 2px solid transparent !important; 
+    }
+    
+    button[data-testid="tab-btn"][aria-selected="true"] { 
+        color: #60a5fa !important; 
+        border-bottom-color: #60a5fa !important; 
+    }
+    
+    .streamlit-expander { 
+        border: 1px solid #1e3a5f !important; 
+        background: #111d2e !important; 
+        border-radius: 8px !important; 
+        margin-bottom: 5px !important; 
+    }
+    
+    .streamlit-expander .streamlit-expander-header { 
+        color: #fff !important; 
+        font-weight: 700 !important; 
+        font-size: 12.5px !important; 
+    }
+    
+    .stSelectbox label, .stTextInput label { 
+        color: #64748b !important; 
+        font-size: 10px !important; 
+        text-transform: uppercase; 
+        letter-spacing: 0.7px; 
+        font-weight: 700 !important; 
+    }
+    
+    .stSelectbox > div > div { 
+        background: #0f1a2a !important; 
+        border: 1px solid #1e3a5f !important; 
+        color: #fff !important; 
+        border-radius: 6px !important; 
+        font-size: 12.5px !important; 
+    }
+    
+    .stTextInput > div > input { 
+        background: #0f1a2a !important; 
+        border: 1px solid #1e3a5f !important; 
+        color: #fff !important; 
+        border-radius: 6px !important; 
+        font-size: 12.5px !important; 
+    }
+    
+    .stTextInput > div > input:focus { 
+        border-color: #60a5fa !important; 
+        box-shadow: none !important; 
+    }
+    
+    .stTextInput > div > input::placeholder { 
+        color: #475569 !important; 
+    }
+    
+    .stRadio label { 
+        color: #cbd5e1 !important; 
+        font-size: 11.5px !important; 
+    }
+    
+    .stRadio > div > div label { 
+        color: #cbd5e1 !important; 
+        font-size: 11.5px !important; 
+    }
+    
+    .gfc-kpi-row { 
+        display: flex; 
+        gap: 10px; 
+        flex-wrap: wrap; 
+        margin-bottom: 12px; 
+    }
+    
+    .gfc-kpi { 
+        background: #131f33; 
+        border: 1px solid #1e3a5f; 
+        border-radius: 10px; 
+        padding: 14px 16px; 
+        flex: 1; 
+        min-width: 130px; 
+        text-align: center; 
+    }
+    
+    .gfc-kpi .val { 
+        font-size: 24px; 
+        font-weight: 800; 
+        line-height: 1; 
+        margin-bottom: 3px; 
+    }
+    
+    .gfc-kpi .lbl { 
+        font-size: 9.5px; 
+        color: #64748b; 
+        font-weight: 600; 
+    }
+    
+    .gfc-pri { 
+        background: #131f33; 
+        border: 1px solid #1e3a5f; 
+        border-radius: 7px; 
+        padding: 8px 10px; 
+        display: flex; 
+        align-items: flex-start; 
+        gap: 8px; 
+        margin-bottom: 4px; 
+    }
+    
+    .gfc-pri .rk { 
+        font-size: 11px; 
+        font-weight: 800; 
+        color: #64748b; 
+        width: 18px; 
+        text-align: center; 
+        flex-shrink: 0; 
+    }
+    
+    .gfc-pri .info { 
+        flex: 1; 
+        min-width: 0; 
+    }
+    
+    .gfc-pri .cat { 
+        font-size: 9px; 
+        color: #64748b; 
+        margin-bottom: 1px; 
+    }
+    
+    .gfc-pri .txt { 
+        font-size: 10.5px; 
+        color: #cbd5e1; 
+    }
+    
+    .gfc-pri .wtag { 
+        font-size: 8px; 
+        font-weight: 700; 
+        color: #fff; 
+        border-radius: 3px; 
+        padding: 1px 5px; 
+        flex-shrink: 0; 
+    }
+    
+    .gfc-sol { 
+        background: #131f33; 
+        border: 1px solid #1e3a5f; 
+        border-radius: 8px; 
+        padding: 10px 12px; 
+        display: flex; 
+        align-items: flex-start; 
+        gap: 8px; 
+        margin-bottom: 5px; 
+    }
+    
+    .gfc-sol .ico { 
+        font-size: 18px; 
+        flex-shrink: 0; 
+    }
+    
+    .gfc-sol .nm { 
+        font-size: 11px; 
+        font-weight: 700; 
+        color: #fff; 
+        margin-bottom: 2px; 
+    }
+    
+    .gfc-sol .dc { 
+        font-size: 9.5px; 
+        color: #64748b; 
+        line-height: 1.45; 
+    }
+    
+    .gfc-script { 
+        background: #1a2736; 
+        border: 1px solid #2a4a6b; 
+        border-top: 2px solid #ca8a04; 
+        border-radius: 10px; 
+        padding: 22px 24px; 
+        margin-top: 8px; 
+    }
+    
+    .gfc-script .sc-hdr { 
+        text-align: center; 
+        border-bottom: 1px solid #2a4a6b; 
+        padding-bottom: 12px; 
+        margin-bottom: 16px; 
+    }
+    
+    .gfc-script .sc-hdr h2 { 
+        color: #fff; 
+        font-size: 15px; 
+        font-weight: 800; 
+        margin: 0; 
+    }
+    
+    .gfc-script .sc-hdr p { 
+        color: #ca8a04; 
+        font-size: 9.5px; 
+        margin: 3px 0 0; 
+        font-weight: 600; 
+        letter-spacing: 1px; 
+    }
+    
+    .gfc-script .sc-meta { 
+        display: grid; 
+        grid-template-columns: 1fr 1fr; 
+        gap: 3px 14px; 
+        margin-bottom: 14px; 
+        font-size: 10.5px; 
+        color: #64748b; 
+    }
+    
+    .gfc-script .sc-meta strong { 
+        color: #fff; 
+        font-weight: 600; 
+    }
+    
+    .gfc-script .sc-sec { 
+        font-size: 10.5px; 
+        font-weight: 700; 
+        color: #ca8a04; 
+        letter-spacing: 0.3px; 
+        margin: 14px 0 6px; 
+        display: flex; 
+        align-items: center; 
+        gap: 6px; 
+    }
+    
+    .gfc-script .sc-sec::after { 
+        content: ''; 
+        flex: 1; 
+        height: 1px; 
+        background: #2a4a6b; 
+    }
+    
+    .gfc-script .sc-intro { 
+        background: #151f30; 
+        border-left: 3px solid #60a5fa; 
+        border-radius: 6px; 
+        padding: 14px 16px; 
+        font-size: 11.5px; 
+        color: #cbd5e1; 
+        line-height: 1.9; 
+    }
+    
+    .gfc-script .sc-block { 
+        background: #151f30; 
+        border-left: 2px solid; 
+        border-radius: 5px; 
+        padding: 9px 12px; 
+        margin-bottom: 4px; 
+    }
+    
+    .gfc-script .sc-block .bq { 
+        font-size: 9.5px; 
+        color: #94a3b8; 
+        margin-bottom: 2px; 
+    }
+    
+    .gfc-script .sc-block .bt { 
+        font-size: 10.5px; 
+        color: #cbd5e1; 
+        line-height: 1.6; 
+    }
+    
+    .gfc-script .sc-close { 
+        background: #151f30; 
+        border-left: 3px solid #22c55e; 
+        border-radius: 6px; 
+        padding: 14px 16px; 
+        font-size: 11px; 
+        color: #cbd5e1; 
+        line-height: 1.85; 
+        margin-top: 6px; 
+    }
+    
+    .gfc-empty { 
+        color: #22c55e; 
+        font-size: 11px; 
+        text-align: center; 
+        padding: 10px; 
+    }
+    """
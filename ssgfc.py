@@ -14,504 +14,183 @@ Streamlit 기반 AI 진단 엔진 + KPI 대시보드 + AI 컨설턴트
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 from datetime import datetime
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
-from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+import importlib.util
+import inspect
+import json
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+
+from gfc_core import (
+    AWARENESS_QUESTIONS,
+    CORPORATE_QUESTIONS,
+    DEFAULT_DB_PATH,
+    KEYMAN_QUESTIONS,
+    RESPONSE_OPTIONS,
+    SCENARIO_QUESTIONS,
+    WEIGHT_COLORS,
+    DiagnosisStore,
+    HtmlBatch,
+    IncrementalScorer,
+    bar_svg,
+    build_record,
+    build_script_model,
+    calculate_all_scores,
+    compact_html,
+    gauge_svg,
+    generate_consultation_script,
+    get_priority_items,
+    get_recommended_solutions,
+    get_risk_level,
+    load_dark_theme_css,
+    radar_svg,
+)
+from gfc_core.browser import diagnosis_component
+from gfc_core.export import EXPORT_FORMATS, MIME_TYPES, export_script, find_pdf_font
+from gfc_core.report import (
+    CONSULTANT_CLOSING_HTML,
+    CONSULTANT_HEADER_HTML,
+    consultant_analysis_html,
+    consultant_profile_html,
+    kpi_row_html,
+    priority_list_html,
+    report_body_html,
+    report_document,
+    script_html,
+    solution_list_html,
+)
+
+# Plotly 는 차트 생성 시점에 import (진단 탭 첫 렌더링을 지연시키지 않도록)
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # ═══════════════════════════════════════════════════════════
-# CONSTANTS & CONFIGURATION
+# CONFIGURATION
 # ═══════════════════════════════════════════════════════════
 
-@dataclass
-class RiskLevel:
-    """리스크 레벨 정의"""
-    name: str
-    color: str
-    threshold: float
-
-RISK_LEVELS = [
-    RiskLevel("양호", "#22c55e", 20),
-    RiskLevel("주의", "#ca8a04", 45),
-    RiskLevel("경계", "#ea580c", 70),
-    RiskLevel("위험", "#dc2626", 100),
-]
-
-WEIGHT_COLORS = {
-    1: "#64748b",
-    2: "#64748b", 
-    3: "#3b82f6",
-    4: "#ca8a04",
-    5: "#ea580c",
+PLACEHOLDER = "─ 선택 ─"
+EST_OPTIONS = [PLACEHOLDER, "5년 미만", "5~10년", "10~20년", "20년 이상"]
+EMPLOYEE_OPTIONS = [PLACEHOLDER, "10명 미만", "10~30명", "30~100명", "100명 이상"]
+REVENUE_OPTIONS = [PLACEHOLDER, "50억 미만", "50~100억", "100~300억", "300억 이상"]
+CEO_AGE_OPTIONS = [PLACEHOLDER, "40대 이하", "50대", "60대 이상"]
+CEO_SHARE_OPTIONS = [PLACEHOLDER, "50% 미만", "50~80%", "80% 이상"]
+
+# 진단 저장소 (SQLite, 프로세스 내 모든 세션 공유)
+DB_PATH = os.environ.get("GFC_DB_PATH", DEFAULT_DB_PATH)
+
+# 스크립트 문서 내보내기 형식 (PDF 는 reportlab 과 내장할 한글 TrueType 폰트가 있을 때)
+EXPORT_LABELS = {"md": "Markdown", "docx": "Word (.docx)", "pdf": "PDF"}
+PDF_EXPORT_AVAILABLE = importlib.util.find_spec("reportlab") is not None and bool(find_pdf_font())
+
+@st.cache_resource
+def get_store() -> DiagnosisStore:
+    return DiagnosisStore(DB_PATH)
+
+# 불러오기 시 복원할 위젯 키 ← 저장 레코드 필드
+INFO_WIDGETS = {
+    "inp_co": "company",
+    "inp_in": "industry",
+    "inp_ceo": "ceo",
+    "inp_adv": "adviser",
+}
+SELECT_WIDGETS = {
+    "sel_est": ("est", EST_OPTIONS),
+    "sel_emp": ("employees", EMPLOYEE_OPTIONS),
+    "sel_rev": ("revenue", REVENUE_OPTIONS),
+    "sel_age": ("ceo_age", CEO_AGE_OPTIONS),
+    "sel_shr": ("ceo_share", CEO_SHARE_OPTIONS),
+}
+
+# 포트폴리오 탭 슬라이스 차원 (저장 레코드 필드, 라벨, 선택지) · 분포 지표
+PORTFOLIO_DIMENSIONS = (
+    ("est", "법인 설립 연차", EST_OPTIONS),
+    ("employees", "임직원 수", EMPLOYEE_OPTIONS),
+    ("revenue", "연 매출 규모", REVENUE_OPTIONS),
+    ("ceo_age", "대표자 연령대", CEO_AGE_OPTIONS),
+    ("ceo_share", "대표자 지분율", CEO_SHARE_OPTIONS),
+)
+PORTFOLIO_METRICS = (
+    ("total_pct", "종합 리스크율"),
+    ("km_pct", "대표자 리스크"),
+    ("cr_pct", "법인 경영 리스크"),
+    ("aw_pct", "리스크 인식 부족"),
+    ("sc_pct", "시나리오 대응 미흡"),
+)
+ANSWER_WIDGETS = (
+    ("km", [RESPONSE_OPTIONS] * len(KEYMAN_QUESTIONS)),
+    ("cr", [RESPONSE_OPTIONS] * len(CORPORATE_QUESTIONS)),
+    ("aw", [options for _, options, _, _ in AWARENESS_QUESTIONS]),
+    ("sc", [options for _, options, _, _ in SCENARIO_QUESTIONS]),
+)
+
+# 화면 전환 방식: "lazy" (기본, 보이는 화면만 실행) | "tabs" (st.tabs 로 모든 탭을 매 실행마다 렌더링)
+NAV_MODES = ("lazy", "tabs")
+NAV_MODE = os.environ.get("GFC_NAV_MODE", "lazy").lower()
+if NAV_MODE not in NAV_MODES:
+    raise ValueError(f"GFC_NAV_MODE must be one of {NAV_MODES}, got {NAV_MODE!r}")
+# st.tabs(on_change="rerun") 미지원 버전(< 1.5x)은 가로 라디오로 화면 선택
+LAZY_TABS_AVAILABLE = "on_change" in inspect.signature(st.tabs).parameters
+
+# 진단 응답 반영 방식: "fragment" (기본, 바뀐 섹션 · 요약만 재실행) | "submit" (섹션별 폼, 반영 버튼을 눌러야 전송)
+# | "browser" (브라우저 채점 컴포넌트, 반영 시에만 응답 코드 · 점수 전송) | "full" (클릭마다 전체 재실행)
+DIAG_MODES = ("fragment", "submit", "browser", "full")
+DIAG_MODE = os.environ.get("GFC_DIAG_MODE", "fragment").lower()
+if DIAG_MODE not in DIAG_MODES:
+    raise ValueError(f"GFC_DIAG_MODE must be one of {DIAG_MODES}, got {DIAG_MODE!r}")
+# 섹션 fragment 는 st.fragment(key=) · st.rerun(<fragment key>) 지원 버전의 지연 화면 모드에서만 사용
+# (tabs 모드에서는 다른 탭도 화면에 남아 있으므로 전체 재실행으로 갱신)
+DIAG_FRAGMENTS = (DIAG_MODE != "full" and NAV_MODE == "lazy" and hasattr(st, "fragment")
+                  and "key" in inspect.signature(st.fragment).parameters)
+
+# 화면 (이름, 탭 라벨)
+VIEWS = (
+    ("diag", "📋  진단"),
+    ("dash", "📊  대시보드"),
+    ("portfolio", "🗂️  포트폴리오"),
+    ("consult", "🤝  AI 컨설턴트"),
+    ("script", "📝  스크립트"),
+)
+# 화면별 위젯 키 — 그리지 않는 화면의 위젯 상태는 실행 종료 시 삭제되므로 다시 기록해 유지
+VIEW_WIDGETS = {
+    "diag": (tuple(INFO_WIDGETS) + tuple(SELECT_WIDGETS) + ("load_co", "load_adv", "load_sel")
+             + tuple(f"{prefix}_{i}" for prefix, option_lists in ANSWER_WIDGETS
+                     for i in range(len(option_lists)))),
+    "portfolio": ("pf_dim", "pf_val"),
+    "script": ("export_fmt",),
 }
 
-RESPONSE_OPTIONS = ["예", "일부 해당", "아니오"]
-RESPONSE_SCORES = {"예": 1.0, "일부 해당": 0.5, "아니오": 0.0}
+def _select_value(stored: str, options: List[str]) -> str:
+    """저장값 → selectbox 선택지 (임직원 수는 '명' 을 제거해 저장됨)"""
+    for option in options[1:]:
+        if stored in (option, option.replace("명", "")):
+            return option
+    return PLACEHOLDER
 
-# ═══════════════════════════════════════════════════════════
-# DIAGNOSTIC DATA
-# ═══════════════════════════════════════════════════════════
+def _stored_value(option: str, field: str) -> str:
+    """selectbox 선택지 → 저장값 (진단 탭 info 변환과 동일)"""
+    return option.replace("명", "") if field == "employees" else option
 
-KEYMAN_QUESTIONS = [
-    ("대표자 유고 시 의사결정 공백이 발생할 수 있다", 4),
-    ("회사 주요 거래·의사결정이 대표자 개인에게 집중되어 있다", 5),
-    ("대표자가 개인 보증을 서고 있다", 4),
-    ("대표자 개인 재무와 법인 재무가 명확히 분리되어 있지 않다", 3),
-    ("가업 승계 또는 지분 이전 계획이 명확하지 않다", 5),
-    ("대표자 건강·사고 리스크에 대한 대비가 충분하지 않다", 5),
-]
-
-CORPORATE_QUESTIONS = [
-    ("매출이 특정 거래처에 과도하게 집중되어 있다", 4),
-    ("핵심 인력 이탈 시 업무 공백이 크다", 4),
-    ("설비·투자 회수 구조가 장기적이거나 불확실하다", 3),
-    ("현금흐름 변동성이 크다", 4),
-    ("외부 환경 변화(환율·정책·시장)에 취약하다", 3),
-    ("예상치 못한 사고 발생 시 즉각 대응 체계가 부족하다", 5),
-]
-
-AWARENESS_QUESTIONS = [
-    ("대표자 리스크가 곧바로 법인 리스크로 이어질 수 있다", 
-     ["그렇다", "보통", "아니다"], 
-     {"그렇다": 0.0, "보통": 0.5, "아니다": 1.0}, 3),
-    ("매출 중단이나 큰 사고 발생 시, 회사가 정상 운영을 유지할 수 있는 기간(비상자금)을 파악하고 있다", 
-     ["예 (3개월 이상)", "대략 파악", "모름"], 
-     {"예 (3개월 이상)": 0.0, "대략 파악": 0.5, "모름": 1.0}, 4),
-    ("리스크 발생 시 대응 순서와 책임자가 정리되어 있다", 
-     ["예", "아니오"], 
-     {"예": 0.0, "아니오": 1.0}, 4),
-]
-
-SCENARIO_QUESTIONS = [
-    ("대표자가 6개월 이상 경영에서 이탈할 경우",
-     ["큰 영향 없음", "부분적 영향", "경영 전반에 중대한 영향"],
-     {"큰 영향 없음": 0.0, "부분적 영향": 0.5, "경영 전반에 중대한 영향": 1.0}, 5),
-    ("핵심 인력 1~2명이 동시에 이탈할 경우",
-     ["대응 가능", "일부 차질", "심각한 차질"],
-     {"대응 가능": 0.0, "일부 차질": 0.5, "심각한 차질": 1.0}, 4),
-    ("대규모 투자 또는 외부 충격 발생 시",
-     ["내부 대응 가능", "단기 대응 필요", "구조적 대응 필요"],
-     {"내부 대응 가능": 0.0, "단기 대응 필요": 0.5, "구조적 대응 필요": 1.0}, 4),
-]
-
-SOLUTIONS = [
-    {
-        "name": "대표자 리스크 관리",
-        "icon": "👔",
-        "color": "#9333ea",
-        "desc": "CEO Plan · Key-Man 보험 등을 통해 대표자 유고·부적격 시 경영 연속성을 보장합니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "종업원 단체보험",
-        "icon": "👨‍👩‍👧‍👦",
-        "color": "#ea580c",
-        "desc": "핵심 인력 이탈·재해 시 기업 운영 안정을 위한 단체보험 설계.",
-        "trigger": "corp"
-    },
-    {
-        "name": "가업승계 컨설팅",
-        "icon": "🏢",
-        "color": "#ca8a04",
-        "desc": "지분 이전·상속·증여를 체계적으로 구조화하여 세금 부담을 최소화합니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "법인 절세 컨설팅",
-        "icon": "📋",
-        "color": "#16a34a",
-        "desc": "법인·개인 재무 분리와 절세 구조를 정리하여 불필요한 세금 부담을 줄입니다.",
-        "trigger": "keyman"
-    },
-    {
-        "name": "현금흐름 & 위기대응",
-        "icon": "📊",
-        "color": "#0891b2",
-        "desc": "현금흐름 변동성 대비와 단일 사고 대응 구조를 체계적으로 설계합니다.",
-        "trigger": "corp"
-    },
-    {
-        "name": "종합 재무컨설팅",
-        "icon": "📈",
-        "color": "#2563eb",
-        "desc": "전체 리스크를 종합적으로 평가하여 최적의 구조 설계와 실행 계획을 제안합니다.",
-        "trigger": "all"
-    },
-]
+def load_saved_diagnosis(diagnosis_id: int):
+    """저장된 진단을 진단 탭 위젯 상태로 복원 (버튼 on_click 콜백)"""
+    record = get_store().load(diagnosis_id)
+    if not record:
+        return
+    for key, field in INFO_WIDGETS.items():
+        st.session_state[key] = record[field]
+    for key, (field, options) in SELECT_WIDGETS.items():
+        st.session_state[key] = _select_value(record[field], options)
+    for prefix, option_lists in ANSWER_WIDGETS:
+        for i, (answer, options) in enumerate(zip(record["answers"].get(prefix, []), option_lists)):
+            if answer in options:
+                st.session_state[f"{prefix}_{i}"] = answer
+    st.session_state["loaded_id"] = diagnosis_id
 
 # ═══════════════════════════════════════════════════════════
 # STYLES & UI COMPONENTS
 # ═══════════════════════════════════════════════════════════
 
-def load_dark_theme_css() -> str:
-    """다크 테마 CSS 반환"""
-    return """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700;800&display=swap');
-    
-    .stApp { 
-        background: #0f1623 !important; 
-        color: #cbd5e1 !important; 
-        font-family: 'Noto Sans KR', sans-serif !important; 
-    }
-    
-    .main .block-container { 
-        padding-top: 8px !important; 
-        padding-left: 18px !important; 
-        padding-right: 18px !important; 
-        max-width: 960px !important; 
-        margin: 0 auto !important; 
-    }
-    
-    .gfc-header { 
-        background: linear-gradient(135deg, #0a1220 0%, #152238 55%, #1a2d4a 100%); 
-        border-bottom: 1px solid #1e3a5f;
-        padding: 24px 22px 20px; 
-        border-radius: 0; 
-        margin: -8px -18px 0; 
-    }
-    
-    .gfc-header h1 { 
-        color: #fff; 
-        font-size: 22px; 
-        font-weight: 800; 
-        margin: 0; 
-        line-height: 1.3; 
-    }
-    
-    .gfc-header h1 span { 
-        color: #60a5fa; 
-    }
-    
-    .gfc-header p { 
-        color: #64748b; 
-        font-size: 11px; 
-        margin: 6px 0 0; 
-        line-height: 1.55; 
-        max-width: 700px; 
-    }
-    
-    .gfc-live { 
-        display: inline-flex; 
-        align-items: center; 
-        gap: 6px; 
-        margin-bottom: 8px; 
-    }
-    
-    .gfc-live-dot { 
-        width: 7px; 
-        height: 7px; 
-        border-radius: 50%; 
-        background: #22c55e; 
-        animation: pulse 2s infinite; 
-    }
-    
-    .gfc-live span { 
-        font-size: 10px; 
-        color: #60a5fa; 
-        font-weight: 700; 
-        letter-spacing: 1.4px; 
-        text-transform: uppercase; 
-    }
-    
-    @keyframes pulse { 
-        0%, 100% { opacity: 1 } 
-        50% { opacity: 0.4 } 
-    }
-    
-    div[data-testid="stTabs"] { 
-        border-bottom: 1px solid #1e3a5f !important; 
-    }
-    
-    button[data-testid="tab-btn"] { 
-        background: none !important; 
-        color: #64748b !important; 
-        font-size: 12px !important; 
-        font-weight: 600 !important; 
-        border: none !important; 
-        padding: 9px 14px !important; 
-        border-bottom: 2px solid transparent !important; 
-    }
-    
-    button[data-testid="tab-btn"][aria-selected="true"] { 
-        color: #60a5fa !important; 
-        border-bottom-color: #60a5fa !important; 
-    }
-    
-    .streamlit-expander { 
-        border: 1px solid #1e3a5f !important; 
-        background: #111d2e !important; 
-        border-radius: 8px !important; 
-        margin-bottom: 5px !important; 
-    }
-    
-    .streamlit-expander .streamlit-expander-header { 
-        color: #fff !important; 
-        font-weight: 700 !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stSelectbox label, .stTextInput label { 
-        color: #64748b !important; 
-        font-size: 10px !important; 
-        text-transform: uppercase; 
-        letter-spacing: 0.7px; 
-        font-weight: 700 !important; 
-    }
-    
-    .stSelectbox > div > div { 
-        background: #0f1a2a !important; 
-        border: 1px solid #1e3a5f !important; 
-        color: #fff !important; 
-        border-radius: 6px !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stTextInput > div > input { 
-        background: #0f1a2a !important; 
-        border: 1px solid #1e3a5f !important; 
-        color: #fff !important; 
-        border-radius: 6px !important; 
-        font-size: 12.5px !important; 
-    }
-    
-    .stTextInput > div > input:focus { 
-        border-color: #60a5fa !important; 
-        box-shadow: none !important; 
-    }
-    
-    .stTextInput > div > input::placeholder { 
-        color: #475569 !important; 
-    }
-    
-    .stRadio label { 
-        color: #cbd5e1 !important; 
-        font-size: 11.5px !important; 
-    }
-    
-    .stRadio > div > div label { 
-        color: #cbd5e1 !important; 
-        font-size: 11.5px !important; 
-    }
-    
-    .gfc-kpi-row { 
-        display: flex; 
-        gap: 10px; 
-        flex-wrap: wrap; 
-        margin-bottom: 12px; 
-    }
-    
-    .gfc-kpi { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 10px; 
-        padding: 14px 16px; 
-        flex: 1; 
-        min-width: 130px; 
-        text-align: center; 
-    }
-    
-    .gfc-kpi .val { 
-        font-size: 24px; 
-        font-weight: 800; 
-        line-height: 1; 
-        margin-bottom: 3px; 
-    }
-    
-    .gfc-kpi .lbl { 
-        font-size: 9.5px; 
-        color: #64748b; 
-        font-weight: 600; 
-    }
-    
-    .gfc-pri { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 7px; 
-        padding: 8px 10px; 
-        display: flex; 
-        align-items: flex-start; 
-        gap: 8px; 
-        margin-bottom: 4px; 
-    }
-    
-    .gfc-pri .rk { 
-        font-size: 11px; 
-        font-weight: 800; 
-        color: #64748b; 
-        width: 18px; 
-        text-align: center; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-pri .info { 
-        flex: 1; 
-        min-width: 0; 
-    }
-    
-    .gfc-pri .cat { 
-        font-size: 9px; 
-        color: #64748b; 
-        margin-bottom: 1px; 
-    }
-    
-    .gfc-pri .txt { 
-        font-size: 10.5px; 
-        color: #cbd5e1; 
-    }
-    
-    .gfc-pri .wtag { 
-        font-size: 8px; 
-        font-weight: 700; 
-        color: #fff; 
-        border-radius: 3px; 
-        padding: 1px 5px; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-sol { 
-        background: #131f33; 
-        border: 1px solid #1e3a5f; 
-        border-radius: 8px; 
-        padding: 10px 12px; 
-        display: flex; 
-        align-items: flex-start; 
-        gap: 8px; 
-        margin-bottom: 5px; 
-    }
-    
-    .gfc-sol .ico { 
-        font-size: 18px; 
-        flex-shrink: 0; 
-    }
-    
-    .gfc-sol .nm { 
-        font-size: 11px; 
-        font-weight: 700; 
-        color: #fff; 
-        margin-bottom: 2px; 
-    }
-    
-    .gfc-sol .dc { 
-        font-size: 9.5px; 
-        color: #64748b; 
-        line-height: 1.45; 
-    }
-    
-    .gfc-script { 
-        background: #1a2736; 
-        border: 1px solid #2a4a6b; 
-        border-top: 2px solid #ca8a04; 
-        border-radius: 10px; 
-        padding: 22px 24px; 
-        margin-top: 8px; 
-    }
-    
-    .gfc-script .sc-hdr { 
-        text-align: center; 
-        border-bottom: 1px solid #2a4a6b; 
-        padding-bottom: 12px; 
-        margin-bottom: 16px; 
-    }
-    
-    .gfc-script .sc-hdr h2 { 
-        color: #fff; 
-        font-size: 15px; 
-        font-weight: 800; 
-        margin: 0; 
-    }
-    
-    .gfc-script .sc-hdr p { 
-        color: #ca8a04; 
-        font-size: 9.5px; 
-        margin: 3px 0 0; 
-        font-weight: 600; 
-        letter-spacing: 1px; 
-    }
-    
-    .gfc-script .sc-meta { 
-        display: grid; 
-        grid-template-columns: 1fr 1fr; 
-        gap: 3px 14px; 
-        margin-bottom: 14px; 
-        font-size: 10.5px; 
-        color: #64748b; 
-    }
-    
-    .gfc-script .sc-meta strong { 
-        color: #fff; 
-        font-weight: 600; 
-    }
-    
-    .gfc-script .sc-sec { 
-        font-size: 10.5px; 
-        font-weight: 700; 
-        color: #ca8a04; 
-        letter-spacing: 0.3px; 
-        margin: 14px 0 6px; 
-        display: flex; 
-        align-items: center; 
-        gap: 6px; 
-    }
-    
-    .gfc-script .sc-sec::after { 
-        content: ''; 
-        flex: 1; 
-        height: 1px; 
-        background: #2a4a6b; 
-    }
-    
-    .gfc-script .sc-intro { 
-        background: #151f30; 
-        border-left: 3px solid #60a5fa; 
-        border-radius: 6px; 
-        padding: 14px 16px; 
-        font-size: 11.5px; 
-        color: #cbd5e1; 
-        line-height: 1.9; 
-    }
-    
-    .gfc-script .sc-block { 
-        background: #151f30; 
-        border-left: 2px solid; 
-        border-radius: 5px; 
-        padding: 9px 12px; 
-        margin-bottom: 4px; 
-    }
-    
-    .gfc-script .sc-block .bq { 
-        font-size: 9.5px; 
-        color: #94a3b8; 
-        margin-bottom: 2px; 
-    }
-    
-    .gfc-script .sc-block .bt { 
-        font-size: 10.5px; 
-        color: #cbd5e1; 
-        line-height: 1.6; 
-    }
-    
-    .gfc-script .sc-close { 
-        background: #151f30; 
-        border-left: 3px solid #22c55e; 
-        border-radius: 6px; 
-        padding: 14px 16px; 
-        font-size: 11px; 
-        color: #cbd5e1; 
-        line-height: 1.85; 
-        margin-top: 6px; 
-    }
-    
-    .gfc-empty { 
-        color: #22c55e; 
-        font-size: 11px; 
-        text-align: center; 
-        padding: 10px; 
-    }
-    </style>
-    """
-
 def render_header():
     """앱 헤더 렌더링"""
     st.markdown("""
@@ -526,12 +205,23 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
 
+@contextmanager
+def html_section():
+    """섹션 HTML 조각을 HtmlBatch 에 모아 블록 종료 시 st.markdown 1회로 출력 (조각이 없으면 출력 안 함)"""
+    batch = HtmlBatch()
+    yield batch
+    if batch:
+        st.markdown(batch.html(), unsafe_allow_html=True)
+
+QUESTION_DIVIDER_HTML = '<hr style="border:none;border-top:1px solid #1e3a5f;margin:6px 0">'
+
 def render_question_with_weight(text: str, weight: int, index: int, key_prefix: str, 
-                                 options: List[str] = None) -> str:
-    """가중치 배지가 포함된 질문 렌더링"""
+                                 options: List[str] = None, on_change: Callable = None,
+                                 default_index: int = -1, before: str = "") -> str:
+    """가중치 배지가 포함된 질문 렌더링 (before: 질문 머리글과 함께 출력할 앞 구분선 · 안내 HTML)"""
     color = WEIGHT_COLORS.get(weight, "#64748b")
     st.markdown(
-        f'<div style="display:flex;align-items:center;gap:7px;margin-bottom:3px">'
+        f'{before}<div style="display:flex;align-items:center;gap:7px;margin-bottom:3px">'
         f'<span style="background:{color};color:#fff;font-size:8px;font-weight:800;'
         f'border-radius:3px;padding:1px 5px;flex-shrink:0">{weight}</span>'
         f'<span style="font-size:12px;color:#cbd5e1">{text}</span></div>',
@@ -542,155 +232,15 @@ def render_question_with_weight(text: str, weight: int, index: int, key_prefix:
     answer = st.radio(
         "", 
         options, 
-        index=len(options) - 1, 
+        index=default_index % len(options), 
         key=f"{key_prefix}_{index}", 
         horizontal=True, 
-        label_visibility="hidden"
+        label_visibility="hidden",
+        on_change=on_change,
+        args=(key_prefix,) if on_change else None,
     )
-    st.markdown('<hr style="border:none;border-top:1px solid #1e3a5f;margin:6px 0">', 
-                unsafe_allow_html=True)
     return answer
 
-def render_priority_item(item: Dict, rank: int):
-    """우선 대응 항목 렌더링"""
-    color = WEIGHT_COLORS.get(item["w"], "#64748b")
-    response = "예" if item["score"] == 1.0 else "일부 해당"
-    
-    st.markdown(f"""
-    <div class="gfc-pri">
-      <span class="rk" style="color:{color}">#{rank}</span>
-      <div class="info">
-        <div class="cat">{item['section']}</div>
-        <div class="txt">{item['text']}</div>
-      </div>
-      <span class="wtag" style="background:{color}">가중치 {item['w']}</span>
-      <span class="wtag" style="background:#475569">{response}</span>
-    </div>
-    """, unsafe_allow_html=True)
-
-def render_solution_card(solution: Dict):
-    """솔루션 카드 렌더링"""
-    st.markdown(f"""
-    <div class="gfc-sol">
-      <span class="ico">{solution['icon']}</span>
-      <div>
-        <div class="nm" style="color:{solution['color']}">{solution['name']}</div>
-        <div class="dc">{solution['desc']}</div>
-      </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-# ═══════════════════════════════════════════════════════════
-# BUSINESS LOGIC
-# ═══════════════════════════════════════════════════════════
-
-def get_risk_level(percentage: float) -> Tuple[str, str]:
-    """리스크율에 따른 레벨과 색상 반환"""
-    for level in RISK_LEVELS:
-        if percentage <= level.threshold:
-            return level.name, level.color
-    return RISK_LEVELS[-1].name, RISK_LEVELS[-1].color
-
-def calculate_section_score(questions: List[Tuple], answers: List[str], 
-                            section_name: str, score_map: Dict = None) -> Tuple[float, List[Dict]]:
-    """섹션별 리스크율 및 아이템 계산"""
-    score_map = score_map or RESPONSE_SCORES
-    total_weight = 0
-    weighted_sum = 0
-    items = []
-    
-    for i, (text, weight) in enumerate(questions):
-        total_weight += weight
-        score = score_map.get(answers[i], 0.0)
-        weighted_sum += score * weight
-        
-        items.append({
-            "text": text,
-            "w": weight,
-            "score": score,
-            "section": section_name
-        })
-    
-    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
-    return percentage, items
-
-def calculate_custom_section_score(questions: List[Tuple], answers: List[str], 
-                                   section_name: str) -> Tuple[float, List[Dict]]:
-    """커스텀 스코어맵을 사용하는 섹션 계산 (Awareness, Scenario)"""
-    total_weight = 0
-    weighted_sum = 0
-    items = []
-    
-    for i, (text, options, score_map, weight) in enumerate(questions):
-        total_weight += weight
-        score = score_map.get(answers[i], 0.0)
-        weighted_sum += score * weight
-        
-        items.append({
-            "text": text,
-            "w": weight,
-            "score": score,
-            "section": section_name
-        })
-    
-    percentage = (weighted_sum / total_weight * 100) if total_weight > 0 else 0
-    return percentage, items
-
-def calculate_all_scores(km_answers: List[str], cr_answers: List[str], 
-                        aw_answers: List[str], sc_answers: List[str]) -> Dict:
-    """전체 리스크 점수 계산"""
-    # 각 섹션별 계산
-    km_pct, km_items = calculate_section_score(KEYMAN_QUESTIONS, km_answers, "대표자 리스크")
-    cr_pct, cr_items = calculate_section_score(CORPORATE_QUESTIONS, cr_answers, "법인 경영 리스크")
-    aw_pct, aw_items = calculate_custom_section_score(AWARENESS_QUESTIONS, aw_answers, "리스크 인식")
-    sc_pct, sc_items = calculate_custom_section_score(SCENARIO_QUESTIONS, sc_answers, "시나리오")
-    
-    # 가중치 합산
-    km_wt = sum(w for _, w in KEYMAN_QUESTIONS)
-    cr_wt = sum(w for _, w in CORPORATE_QUESTIONS)
-    aw_wt = sum(q[3] for q in AWARENESS_QUESTIONS)
-    sc_wt = sum(q[3] for q in SCENARIO_QUESTIONS)
-    total_wt = km_wt + cr_wt + aw_wt + sc_wt
-    
-    # 종합 리스크율 (가중평균)
-    total_pct = (km_pct * km_wt + cr_pct * cr_wt + aw_pct * aw_wt + sc_pct * sc_wt) / total_wt if total_wt > 0 else 0
-    
-    return {
-        "km_pct": km_pct,
-        "cr_pct": cr_pct,
-        "aw_pct": aw_pct,
-        "sc_pct": sc_pct,
-        "total_pct": total_pct,
-        "km_wt": km_wt,
-        "cr_wt": cr_wt,
-        "aw_wt": aw_wt,
-        "sc_wt": sc_wt,
-        "total_wt": total_wt,
-        "all_items": km_items + cr_items + aw_items + sc_items,
-    }
-
-def get_priority_items(all_items: List[Dict], limit: int = 5) -> List[Dict]:
-    """우선 대응 항목 추출"""
-    risky_items = [item for item in all_items if item["score"] > 0]
-    return sorted(risky_items, key=lambda x: (-x["score"], -x["w"]))[:limit]
-
-def get_recommended_solutions(all_items: List[Dict]) -> List[Dict]:
-    """추천 솔루션 필터링"""
-    has_keyman = any(item["score"] > 0 and item["section"] == "대표자 리스크" for item in all_items)
-    has_corp = any(item["score"] > 0 and item["section"] == "법인 경영 리스크" for item in all_items)
-    has_any = any(item["score"] > 0 for item in all_items)
-    
-    recommended = []
-    for solution in SOLUTIONS:
-        if solution["trigger"] == "keyman" and has_keyman:
-            recommended.append(solution)
-        elif solution["trigger"] == "corp" and has_corp:
-            recommended.append(solution)
-        elif solution["trigger"] == "all" and has_any:
-            recommended.append(solution)
-    
-    return recommended
-
 # ═══════════════════════════════════════════════════════════
 # CHART GENERATION
 # ═══════════════════════════════════════════════════════════
@@ -702,10 +252,51 @@ PLOT_LAYOUT = dict(
     margin=dict(l=10, r=10, t=10, b=10),
 )
 
-def create_gauge_chart(percentage: float) -> go.Figure:
+# 차트 렌더러: "plotly" (기본) | "svg" (Plotly 미사용 인라인 SVG, 저사양 태블릿용)
+CHART_RENDERERS = ("plotly", "svg")
+CHART_RENDERER = os.environ.get("GFC_CHART_RENDERER", "plotly").lower()
+if CHART_RENDERER not in CHART_RENDERERS:
+    raise ValueError(f"GFC_CHART_RENDERER must be one of {CHART_RENDERERS}, got {CHART_RENDERER!r}")
+
+RADAR_CATEGORIES = ["대표자<br>리스크", "법인 경영<br>리스크", "리스크 인식<br>부족", "시나리오<br>대응 미흡"]
+BAR_CATEGORIES = ["시나리오 대응 미흡", "리스크 인식 부족", "법인 경영", "대표자"]
+
+# 차트 캐시: 소수점 CHART_PRECISION 자리로 반올림한 리스크율 + 레벨 색상 · 표시 텍스트를 키로 사용
+# (점수가 바뀌지 않은 재실행에서는 스펙 조립을 건너뜀). 캐시에는 변경 불가능한 JSON 문자열만 두고
+# 호출마다 새 Figure 를 만들어 반환하므로, 호출 측에서 Figure 를 수정해도 캐시가 오염되지 않습니다.
+CHART_PRECISION = 1
+CHART_CACHE_SIZE = 256
+
+def _chart_value(percentage: float) -> float:
+    return round(percentage, CHART_PRECISION)
+
+def _figure_from_json(spec_json: str) -> "go.Figure":
+    """캐시된 스펙 JSON → 새 Figure (검증 생략)"""
+    import plotly.graph_objects as go
+
+    return go.Figure(json.loads(spec_json), _validate=False)
+
+def create_gauge_chart(percentage: float) -> "go.Figure":
     """종합 리스크율 게이지 차트"""
     label, color = get_risk_level(percentage)
-    
+    return _figure_from_json(_gauge_spec(_chart_value(percentage), label, color))
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _gauge_spec(percentage: float, label: str, color: str) -> str:
+    spec = _figure_spec("gauge")
+    gauge = spec["data"][0]["gauge"]
+    spec["data"][0]["value"] = percentage
+    gauge["bar"]["color"] = color
+    gauge["threshold"]["line"]["color"] = color
+    gauge["threshold"]["value"] = percentage
+    annotation = spec["layout"]["annotations"][0]
+    annotation["text"] = f"<b>{label}</b>"
+    annotation["font"]["color"] = color
+    return json.dumps(spec)
+
+def _build_gauge_figure(percentage: float, label: str, color: str) -> "go.Figure":
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=percentage,
@@ -740,9 +331,20 @@ def create_gauge_chart(percentage: float) -> go.Figure:
     )
     return fig
 
-def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
+def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> "go.Figure":
     """4축 레이더 차트"""
-    categories = ["대표자<br>리스크", "법인 경영<br>리스크", "리스크 인식<br>부족", "시나리오<br>대응 미흡"]
+    return _figure_from_json(_radar_spec(_chart_value(km), _chart_value(cr), _chart_value(aw), _chart_value(sc)))
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _radar_spec(km: float, cr: float, aw: float, sc: float) -> str:
+    spec = _figure_spec("radar")
+    spec["data"][0]["r"] = [km, cr, aw, sc, km]
+    return json.dumps(spec)
+
+def _build_radar_figure(km: float, cr: float, aw: float, sc: float) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    categories = RADAR_CATEGORIES
     values = [km, cr, aw, sc]
     values_closed = values + [values[0]]
     categories_closed = categories + [categories[0]]
@@ -783,18 +385,35 @@ def create_radar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
     fig.update_layout(**layout_config)
     return fig
 
-def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
+def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> "go.Figure":
     """카테고리별 수평 바 차트"""
-    categories = ["시나리오 대응 미흡", "리스크 인식 부족", "법인 경영", "대표자"]
-    values = [sc, aw, cr, km]
-    colors = [get_risk_level(v)[1] for v in values]
+    values = (sc, aw, cr, km)
+    colors = tuple(get_risk_level(v)[1] for v in values)
+    labels = tuple(f"{v:.0f}%" for v in values)
+    return _figure_from_json(_bar_spec(tuple(_chart_value(v) for v in values), colors, labels))
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _bar_spec(values: tuple, colors: tuple, labels: tuple) -> str:
+    spec = _figure_spec("bar")
+    bar = spec["data"][0]
+    bar["x"] = list(values)
+    bar["marker"]["color"] = list(colors)
+    bar["marker"]["line"]["color"] = list(colors)
+    bar["text"] = list(labels)
+    return json.dumps(spec)
+
+def _build_bar_figure(values: tuple, colors: tuple, labels: tuple) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    categories = BAR_CATEGORIES
+    values, colors = list(values), list(colors)
     
     fig = go.Figure(go.Bar(
         x=values,
         y=categories,
         orientation="h",
         marker=dict(color=colors, line=dict(color=colors, width=0)),
-        text=[f"{v:.0f}%" for v in values],
+        text=list(labels),
         textposition="inside",
         textfont=dict(size=11, color="#fff"),
         hovertemplate="%{y}<br>리스크율: %{x:.0f}%<extra></extra>"
@@ -815,211 +434,251 @@ def create_bar_chart(km: float, cr: float, aw: float, sc: float) -> go.Figure:
     )
     return fig
 
+# 차트 템플릿: 고정 스타일(축 · 색상 · 레이아웃)을 포함한 Figure 를 최초 1회 생성 · 직렬화해 두고,
+# 렌더링 시에는 JSON 사본에 값 · 색상 · 텍스트만 덮어써 Plotly 검증 없이 Figure 를 구성
+def _template_builders() -> Dict:
+    level, color = get_risk_level(0)
+    return {
+        "gauge": lambda: _build_gauge_figure(0, level, color),
+        "radar": lambda: _build_radar_figure(0, 0, 0, 0),
+        "bar": lambda: _build_bar_figure((0, 0, 0, 0), (color,) * 4, ("0%",) * 4),
+    }
+
+@lru_cache(maxsize=None)
+def _figure_template(name: str) -> str:
+    return _template_builders()[name]().to_json()
+
+def _figure_spec(name: str) -> Dict:
+    """차트 템플릿 JSON 사본"""
+    return json.loads(_figure_template(name))
+
+PLOTLY_CONFIG = {"displayModeBar": False}
+
+def render_gauge_chart(percentage: float):
+    """게이지 차트 출력 (CHART_RENDERER 에 따라 Plotly / SVG)"""
+    if CHART_RENDERER == "svg":
+        label, color = get_risk_level(percentage)
+        st.markdown(gauge_svg(_chart_value(percentage), label, color), unsafe_allow_html=True)
+    else:
+        st.plotly_chart(create_gauge_chart(percentage), use_container_width=True, config=PLOTLY_CONFIG)
+
+def render_radar_chart(km: float, cr: float, aw: float, sc: float):
+    """레이더 차트 출력 (CHART_RENDERER 에 따라 Plotly / SVG)"""
+    if CHART_RENDERER == "svg":
+        st.markdown(radar_svg([km, cr, aw, sc], RADAR_CATEGORIES), unsafe_allow_html=True)
+    else:
+        st.plotly_chart(create_radar_chart(km, cr, aw, sc), use_container_width=True, config=PLOTLY_CONFIG)
+
+def render_bar_chart(km: float, cr: float, aw: float, sc: float):
+    """수평 바 차트 출력 (CHART_RENDERER 에 따라 Plotly / SVG)"""
+    if CHART_RENDERER == "svg":
+        values = [sc, aw, cr, km]
+        st.markdown(bar_svg(values, BAR_CATEGORIES, [get_risk_level(v)[1] for v in values],
+                            [f"{v:.0f}%" for v in values]), unsafe_allow_html=True)
+    else:
+        st.plotly_chart(create_bar_chart(km, cr, aw, sc), use_container_width=True, config=PLOTLY_CONFIG)
+
 # ═══════════════════════════════════════════════════════════
-# SCRIPT & CONSULTANT GENERATION
+# VIEW RESULTS (응답 해시 기준 캐시)
 # ═══════════════════════════════════════════════════════════
 
-def generate_consultation_script(info: Dict, scores: Dict, priority_items: List[Dict], 
-                                 solutions: List[Dict]) -> str:
-    """상담 스크립트 생성"""
-    total_pct = scores["total_pct"]
-    label, _ = get_risk_level(total_pct)
-    
-    company = info.get("company", "WOORI(주)") or "WOORI(주)"
-    industry = info.get("industry", "") or "업종 미입력"
-    employees = info.get("employees", "") or "?"
-    ceo = info.get("ceo", "대표자") or "대표자"
-    est = info.get("est", "") or "미입력"
-    revenue = info.get("revenue", "") or "미입력"
-    
-    lines = [
-        "=" * 52,
-        "   GFC 상담 스크립트  |  삼성생명 기업재무컨설팅",
-        "   진단 기반 자동생성",
-        "=" * 52,
-        "",
-        f"  기업명    : {company}",
-        f"  업종      : {industry}",
-        f"  종업원 수 : {employees}명",
-        f"  대표자    : {ceo}",
-        f"  설립 연차 : {est}",
-        f"  연 매출   : {revenue}",
-        f"  진단 충족율: {total_pct:.0f}% ({label})",
-        f"  생성일    : {datetime.now().strftime('%Y.%m.%d %H:%M')}",
-        "",
-        "─" * 52,
-        " 1. 도입 인사",
-        "─" * 52,
-    ]
-    
-    top_section = priority_items[0]["section"] if priority_items else "주요 영역"
-    lines.append(f"""
-안녕하세요, {ceo}님. 삼성생명 GFC 기업재무컨설팅 담당 컨설턴트입니다.
-
-오늘 귀사의 법인 리스크 사전 진단을 완료했는데,
-종합 리스크율이 {total_pct:.0f}%({label}) 수준으로 나왔습니다.
+def view_result(name: str, compute: Callable[[], Any]) -> Any:
+    """화면 결과 — 현재 응답 해시에 대해 처음 요청될 때만 compute() 실행 (세션별)"""
+    answer_hash = st.session_state.get("answer_hash")
+    cache = st.session_state.setdefault("view_cache", {})
+    cached = cache.get(name)
+    if cached is None or cached[0] != answer_hash:
+        cached = cache[name] = (answer_hash, compute())
+    return cached[1]
 
-특히 '{top_section}' 부분에서 즉각적인 대비가 필요한
-사항들이 도출되었습니다.
+def diagnosis_recommendations(scores: Dict) -> Tuple[List[Dict], List[Dict]]:
+    """(우선 대응 항목, 추천 솔루션) — 대시보드 · AI 컨설턴트 · 스크립트 공용"""
+    def compute():
+        scorer = st.session_state.get("scorer")
+        if scorer:
+            return scorer.priority_items(), scorer.recommended_solutions()
+        return get_priority_items(scores["all_items"]), get_recommended_solutions(scores["all_items"])
+    return view_result("recommendations", compute)
 
-오늘 주요 내용을 안내드리고, 귀사에 맞는
-종합 컨설팅 제안까지 함께 검토하겠습니다.
-""")
-    
-    lines.extend(["─" * 52, " 2. 리스크별 상세 상담", "─" * 52])
-    
-    # 섹션별 그룹화
-    grouped = OrderedDict()
-    for item in priority_items:
-        section = item["section"]
-        grouped.setdefault(section, []).append(item)
-    
-    for section, items in grouped.items():
-        lines.append(f"\n▸ {section} ({len(items)}건 해당)")
-        lines.append("-" * 40)
-        for item in items:
-            response = "예" if item['score'] == 1.0 else "일부 해당" if item['score'] == 0.5 else "아니오"
-            lines.append(f"  📌 진단 항목 (가중치 {item['w']})")
-            lines.append(f"     질문 : {item['text']}")
-            lines.append(f"     응답 : {response}")
-            lines.append("")
-    
-    lines.extend(["─" * 52, " 3. 추천 솔루션 제안", "─" * 52])
-    for solution in solutions:
-        lines.append(f"\n  {solution['icon']} {solution['name']}")
-        lines.append(f"     {solution['desc']}")
-    
-    lines.extend(["\n" + "─" * 52, " 4. 마무리 및 다음 단계", "─" * 52])
-    lines.append("""
-오늘 진단 결과를 기반으로, 귀사에 맞는
-'종합 법인 재무 컨설팅 제안서'를 별도로 작성하여 드리겠습니다.
-
-세무사, 회계사, 법무사 등 전문가와 협업하여
-최적의 구조를 설계드리고, 단계별 실행 계획까지
-제안드리겠습니다.
-
-다음 단계로 상세 제안서 검토 일정을 잡아드리면 되겠습니다.
-언제 가능하신가요?
-""")
-    lines.append("=" * 52)
-    
-    return "\n".join(lines)
+def keep_widget_state(views: List[str]):
+    """그리지 않는 화면의 위젯 상태 유지 (Streamlit 은 실행 중 렌더링되지 않은 위젯 상태를 삭제)"""
+    for view in views:
+        for key in VIEW_WIDGETS.get(view, ()):
+            if key in st.session_state:
+                st.session_state[key] = st.session_state[key]
 
 # ═══════════════════════════════════════════════════════════
 # TAB RENDERERS
 # ═══════════════════════════════════════════════════════════
 
-def render_diagnostic_tab():
-    """진단 탭 렌더링"""
-    # Ⅰ. 기본 정보
-    with st.expander("⚙️  Ⅰ. 기본 정보 (Fact Check)", expanded=True):
+def render_load_panel():
+    """저장된 진단 검색 · 불러오기"""
+    with st.expander("📂  저장된 진단 불러오기", expanded=False):
+        c1, c2 = st.columns(2)
+        company = c1.text_input("기업명 검색", placeholder="기업명 앞부분", key="load_co")
+        adviser = c2.text_input("담당 컨설턴트", placeholder="전체", key="load_adv")
+        found = get_store().find(company=company.strip(), adviser=adviser.strip(), limit=20)
+        if not found:
+            st.markdown('<div class="gfc-empty">저장된 진단이 없습니다</div>', unsafe_allow_html=True)
+            return
+        labels = {
+            row["id"]: f"{row['diagnosis_date']} · {row['company'] or '(기업명 없음)'} · "
+                       f"{row['total_pct']:.0f}% {row['risk_level']}"
+                       + (f" · {row['adviser']}" if row["adviser"] else "")
+            for row in found
+        }
+        selected = st.selectbox("진단 선택", list(labels), format_func=labels.get, key="load_sel")
+        st.button("불러오기", key="load_btn", on_click=load_saved_diagnosis, args=(selected,))
+
+def render_save_button(info: Dict, section_answers: List[List[str]], scores: Dict, priority_items: List[Dict]):
+    """현재 진단 저장"""
+    if st.button("💾  진단 저장", key="save_btn", use_container_width=True):
+        record = build_record(info, section_answers, scores, priority_items)
+        diagnosis_id = get_store().save(record)
+        st.session_state["loaded_id"] = diagnosis_id
+        st.success(f"저장 완료 · {record['company'] or '(기업명 없음)'} · {record['diagnosis_date']}")
+
+# 진단 섹션 (위젯 키 접두어 → 제목, 안내 문구, 요약 라벨)
+ANSWER_SECTIONS = {
+    "km": ("⚖️  Ⅱ. 대표자 리스크 진단 (Key-Man Risk)  ·  가중치 적용",
+           '아래 항목 중 현재 회사 상황에 가장 가까운 항목을 선택하세요. '
+           '<span style="color:#dc2626">숫자 배지 = 가중치</span>',
+           "대표자 리스크"),
+    "cr": ("🏢  Ⅲ. 법인 경영 리스크 진단 (Corporate Risk)  ·  가중치 적용",
+           '아래 항목 중 현재 회사 상황에 가장 가까운 항목을 선택하세요. '
+           '<span style="color:#dc2626">숫자 배지 = 가중치</span>',
+           "법인 경영 리스크"),
+    "aw": ("🧠  Ⅳ. 리스크 대응 준비도 점검",
+           '우리 회사의 위기 대응 능력과 준비 수준을 점검합니다.',
+           "리스크 인식 부족"),
+    "sc": ("🎯  Ⅴ. 시나리오 기반 점검",
+           '아래 상황이 발생할 경우를 가정해 보십시오.',
+           "시나리오 대응 미흡"),
+}
+# 응답 위젯 기본 선택지 (Ⅱ ~ Ⅳ: 마지막 선택지, 시나리오: 첫 선택지)
+ANSWER_DEFAULT_INDEX = {"km": -1, "cr": -1, "aw": -1, "sc": 0}
+
+def diag_fragment(key: str) -> Callable:
+    """진단 섹션 fragment 데코레이터 (DIAG_FRAGMENTS 가 아니면 일반 함수 그대로)"""
+    def decorate(func: Callable) -> Callable:
+        return st.fragment(func, key=key) if DIAG_FRAGMENTS else func
+    return decorate
+
+def section_form(key: str):
+    """submit 모드: 섹션 폼 (반영 버튼을 누를 때 한 번에 전송), 그 외: 일반 컨테이너"""
+    return st.form(key=f"form_{key}", border=False) if DIAG_MODE == "submit" else st.container()
+
+def render_section_submit(prefix: str = None):
+    """submit 모드의 섹션 반영 버튼 (응답 섹션은 점수가 바뀌면 요약도 갱신)"""
+    if DIAG_MODE != "submit":
+        return
+    on_click = on_answers_changed if prefix and DIAG_FRAGMENTS else None
+    st.form_submit_button("✔  응답 반영", use_container_width=True, on_click=on_click,
+                          args=(prefix,) if on_click else None)
+
+def get_scorer() -> IncrementalScorer:
+    if "scorer" not in st.session_state:
+        st.session_state["scorer"] = IncrementalScorer()
+    return st.session_state["scorer"]
+
+def update_answer_hash():
+    """응답 해시 (응답 코드 + 기본 정보) 갱신 — view_result 캐시 키"""
+    st.session_state["answer_hash"] = hash((get_scorer().codes, tuple(st.session_state.get("info", {}).values())))
+
+def update_section_scores(prefix: str, answers: List[str]) -> bool:
+    """섹션 응답을 증분 반영 (점수 · 응답 해시 갱신), 점수 변화 여부 반환"""
+    scorer = get_scorer()
+    changed = scorer.update_section(prefix, answers) > 0 or "scores" not in st.session_state
+    if changed:
+        st.session_state["scores"] = scorer.scores()
+    update_answer_hash()
+    return changed
+
+def on_answers_changed(prefix: str):
+    """응답 위젯 콜백 — 점수가 바뀌면 해당 섹션과 요약 fragment 만 재실행"""
+    option_lists = dict(ANSWER_WIDGETS)[prefix]
+    answers = [st.session_state[f"{prefix}_{i}"] for i in range(len(option_lists))]
+    if update_section_scores(prefix, answers):
+        st.rerun([f"diag_{prefix}", "diag_summary"])
+
+@diag_fragment("diag_info")
+def render_info_section():
+    """Ⅰ. 기본 정보"""
+    with st.expander("⚙️  Ⅰ. 기본 정보 (Fact Check)", expanded=True), section_form("info"):
         c1, c2 = st.columns(2)
         company = c1.text_input("기업명", placeholder="예: WOORI(주)", key="inp_co")
         industry = c2.text_input("업종", placeholder="예: 제조업", key="inp_in")
         
         c3, c4 = st.columns(2)
         ceo = c3.text_input("대표자명", placeholder="예: 김흥해", key="inp_ceo")
-        est = c4.selectbox("법인 설립 연차", 
-                          ["─ 선택 ─", "5년 미만", "5~10년", "10~20년", "20년 이상"], 
-                          key="sel_est")
+        est = c4.selectbox("법인 설립 연차", EST_OPTIONS, key="sel_est")
         
         c5, c6 = st.columns(2)
-        employees = c5.selectbox("임직원 수", 
-                                ["─ 선택 ─", "10명 미만", "10~30명", "30~100명", "100명 이상"], 
-                                key="sel_emp")
-        revenue = c6.selectbox("연 매출 규모", 
-                              ["─ 선택 ─", "50억 미만", "50~100억", "100~300억", "300억 이상"], 
-                              key="sel_rev")
+        employees = c5.selectbox("임직원 수", EMPLOYEE_OPTIONS, key="sel_emp")
+        revenue = c6.selectbox("연 매출 규모", REVENUE_OPTIONS, key="sel_rev")
         
         c7, c8 = st.columns(2)
-        c7.selectbox("대표자 연령대", ["─ 선택 ─", "40대 이하", "50대", "60대 이상"], key="sel_age")
-        c8.selectbox("대표자 지분율", ["─ 선택 ─", "50% 미만", "50~80%", "80% 이상"], key="sel_shr")
+        ceo_age = c7.selectbox("대표자 연령대", CEO_AGE_OPTIONS, key="sel_age")
+        ceo_share = c8.selectbox("대표자 지분율", CEO_SHARE_OPTIONS, key="sel_shr")
+        
+        adviser = st.text_input("담당 컨설턴트", placeholder="예: 홍길동", key="inp_adv")
+        render_section_submit()
     
-    info = {
+    st.session_state["info"] = {
         "company": company,
         "industry": industry,
         "ceo": ceo,
-        "est": est if est != "─ 선택 ─" else "",
-        "employees": employees.replace("명", "").replace("─ 선택 ─", "") if employees != "─ 선택 ─" else "",
-        "revenue": revenue if revenue != "─ 선택 ─" else "",
+        "adviser": adviser,
+        "est": est if est != PLACEHOLDER else "",
+        "employees": employees.replace("명", "").replace(PLACEHOLDER, "") if employees != PLACEHOLDER else "",
+        "revenue": revenue if revenue != PLACEHOLDER else "",
+        "ceo_age": ceo_age if ceo_age != PLACEHOLDER else "",
+        "ceo_share": ceo_share if ceo_share != PLACEHOLDER else "",
     }
-    
-    # Ⅱ. Key-Man Risk
-    with st.expander("⚖️  Ⅱ. 대표자 리스크 진단 (Key-Man Risk)  ·  가중치 적용", expanded=True):
-        st.markdown(
-            '<p style="color:#64748b;font-size:10.5px;margin:0 0 10px">'
-            '아래 항목 중 현재 회사 상황에 가장 가까운 항목을 선택하세요. '
-            '<span style="color:#dc2626">숫자 배지 = 가중치</span></p>',
-            unsafe_allow_html=True
-        )
-        km_answers = [
-            render_question_with_weight(text, weight, i, "km")
-            for i, (text, weight) in enumerate(KEYMAN_QUESTIONS)
-        ]
-    
-    # Ⅲ. Corporate Risk
-    with st.expander("🏢  Ⅲ. 법인 경영 리스크 진단 (Corporate Risk)  ·  가중치 적용", expanded=True):
-        st.markdown(
-            '<p style="color:#64748b;font-size:10.5px;margin:0 0 10px">'
-            '아래 항목 중 현재 회사 상황에 가장 가까운 항목을 선택하세요. '
-            '<span style="color:#dc2626">숫자 배지 = 가중치</span></p>',
-            unsafe_allow_html=True
-        )
-        cr_answers = [
-            render_question_with_weight(text, weight, i, "cr")
-            for i, (text, weight) in enumerate(CORPORATE_QUESTIONS)
-        ]
-    
-    # Ⅳ. 인식 점검
-    with st.expander("🧠  Ⅳ. 리스크 대응 준비도 점검", expanded=True):
-        st.markdown(
-            '<p style="color:#64748b;font-size:10.5px;margin:0 0 10px">'
-            '우리 회사의 위기 대응 능력과 준비 수준을 점검합니다.</p>',
-            unsafe_allow_html=True
-        )
-        aw_answers = [
-            render_question_with_weight(text, weight, i, "aw", options)
-            for i, (text, options, _, weight) in enumerate(AWARENESS_QUESTIONS)
-        ]
-    
-    # Ⅴ. 시나리오
-    with st.expander("🎯  Ⅴ. 시나리오 기반 점검", expanded=True):
-        st.markdown(
-            '<p style="color:#64748b;font-size:10.5px;margin:0 0 10px">'
-            '아래 상황이 발생할 경우를 가정해 보십시오.</p>',
-            unsafe_allow_html=True
-        )
-        sc_answers = []
-        for i, (text, options, _, weight) in enumerate(SCENARIO_QUESTIONS):
-            color = WEIGHT_COLORS.get(weight, "#64748b")
-            st.markdown(
-                f'<div style="display:flex;align-items:center;gap:7px;margin-bottom:3px">'
-                f'<span style="background:{color};color:#fff;font-size:8px;font-weight:800;'
-                f'border-radius:3px;padding:1px 5px;flex-shrink:0">{weight}</span>'
-                f'<span style="font-size:12px;color:#cbd5e1">{i+1}. {text}</span></div>',
-                unsafe_allow_html=True
-            )
-            answer = st.radio("", options, index=0, key=f"sc_{i}", horizontal=True, 
-                            label_visibility="hidden")
-            sc_answers.append(answer)
-            st.markdown('<hr style="border:none;border-top:1px solid #1e3a5f;margin:6px 0">', 
-                       unsafe_allow_html=True)
-    
-    # 세션에 저장
-    st.session_state.update({
-        "info": info,
-        "km_answers": km_answers,
-        "cr_answers": cr_answers,
-        "aw_answers": aw_answers,
-        "sc_answers": sc_answers,
-        "scores": calculate_all_scores(km_answers, cr_answers, aw_answers, sc_answers)
-    })
-    
-    # Quick summary
+    update_answer_hash()
+
+def render_answer_section(prefix: str):
+    """Ⅱ ~ Ⅴ. 응답 섹션 (응답은 세션 {prefix}_answers 에 저장, 점수는 증분 반영)"""
+    title, note, _ = ANSWER_SECTIONS[prefix]
+    # 폼 안의 위젯에는 콜백을 둘 수 없으므로 submit 모드는 반영 버튼 콜백을 사용
+    on_change = on_answers_changed if DIAG_FRAGMENTS and DIAG_MODE == "fragment" else None
+    if prefix in ("km", "cr"):
+        questions = [(text, weight, None)
+                     for text, weight in (KEYMAN_QUESTIONS if prefix == "km" else CORPORATE_QUESTIONS)]
+    else:
+        questions = [(text, weight, options)
+                     for text, options, _, weight in (AWARENESS_QUESTIONS if prefix == "aw" else SCENARIO_QUESTIONS)]
+    with st.expander(title, expanded=True), section_form(prefix):
+        # 안내 문구 · 문항 사이 구분선은 다음 질문 머리글과 같은 요소로 출력 (문항당 markdown 1개 + 라디오)
+        before = f'<p style="color:#64748b;font-size:10.5px;margin:0 0 10px">{note}</p>'
+        answers = []
+        for i, (text, weight, options) in enumerate(questions):
+            answers.append(render_question_with_weight(
+                f"{i+1}. {text}" if prefix == "sc" else text, weight, i, prefix, options,
+                on_change=on_change, default_index=ANSWER_DEFAULT_INDEX[prefix], before=before,
+            ))
+            before = QUESTION_DIVIDER_HTML
+        st.markdown(QUESTION_DIVIDER_HTML, unsafe_allow_html=True)
+        render_section_submit(prefix)
+    
+    st.session_state[f"{prefix}_answers"] = answers
+    update_section_scores(prefix, answers)
+
+def _answer_section_fragment(prefix: str) -> Callable:
+    @diag_fragment(f"diag_{prefix}")
+    def render():
+        render_answer_section(prefix)
+    return render
+
+ANSWER_SECTION_RENDERERS = {prefix: _answer_section_fragment(prefix) for prefix in ANSWER_SECTIONS}
+
+@diag_fragment("diag_summary")
+def render_diagnosis_summary():
+    """종합 리스크율 요약 · 저장 (응답 섹션 점수가 바뀔 때 함께 재실행)"""
     scores = st.session_state["scores"]
     label, color = get_risk_level(scores["total_pct"])
     
-    st.markdown(f"""
+    render_summary_actions(f"""
     <div style="background:#111d2e;border:1px solid #1e3a5f;border-radius:8px;padding:12px 16px;
          display:flex;align-items:center;justify-content:center;gap:24px;margin-top:16px;flex-wrap:wrap">
       <div style="text-align:center">
@@ -1037,12 +696,63 @@ def render_diagnostic_tab():
         <span>시나리오 대응 미흡: <strong style="color:#cbd5e1">{scores['sc_pct']:.0f}%</strong></span>
       </div>
     </div>
-    """, unsafe_allow_html=True)
-    st.markdown(
-        '<p style="color:#60a5fa;font-size:10px;text-align:center;margin-top:6px">'
-        '→ 대시보드 탭에서 상세 분석 확인</p>',
-        unsafe_allow_html=True
-    )
+    """)
+
+def render_summary_actions(before: str = ""):
+    """대시보드 안내 · 진단 저장 버튼 (before: 안내 문구와 함께 출력할 요약 HTML)"""
+    with html_section() as html:
+        html.add(before).add(
+            '<p style="color:#60a5fa;font-size:10px;text-align:center;margin-top:6px">'
+            '→ 대시보드 탭에서 상세 분석 확인</p>'
+        )
+    render_save_button(st.session_state["info"],
+                       [st.session_state[f"{prefix}_answers"] for prefix in ANSWER_SECTIONS],
+                       st.session_state["scores"], get_scorer().priority_items())
+
+def session_answers(prefix: str) -> List[str]:
+    """세션의 섹션 응답 (응답 키가 없으면 위젯 기본 선택지)"""
+    option_lists = dict(ANSWER_WIDGETS)[prefix]
+    return [st.session_state.get(f"{prefix}_{i}", options[ANSWER_DEFAULT_INDEX[prefix]])
+            for i, options in enumerate(option_lists)]
+
+def answer_codes() -> List[int]:
+    """세션 응답 → 문항 순서 선택지 인덱스 (브라우저 컴포넌트 입력)"""
+    return [options.index(answer) if answer in options else -1
+            for prefix, option_lists in ANSWER_WIDGETS
+            for answer, options in zip(session_answers(prefix), option_lists)]
+
+def apply_answer_codes(codes: List[int]):
+    """브라우저에서 반영한 선택지 인덱스 → 세션 응답 키"""
+    option_lists = [(f"{prefix}_{i}", options) for prefix, lists in ANSWER_WIDGETS
+                    for i, options in enumerate(lists)]
+    for (key, options), code in zip(option_lists, codes):
+        if 0 <= code < len(options):
+            st.session_state[key] = options[code]
+
+@diag_fragment("diag_browser")
+def render_browser_sections():
+    """Ⅱ ~ Ⅴ. 브라우저 채점 (응답 클릭 · 요약은 브라우저에서 처리, 반영할 때만 이 부분이 재실행)"""
+    value = diagnosis_component(ANSWER_SECTIONS, answer_codes(), numbered=("sc",), key="browser_answers")
+    # 컴포넌트는 마지막 반영 값을 계속 돌려주므로 새 반영(id)일 때만 적용 (불러오기 결과를 덮어쓰지 않도록)
+    if value and value["id"] != st.session_state.get("browser_sync_id"):
+        st.session_state["browser_sync_id"] = value["id"]
+        apply_answer_codes(value["codes"])
+    for prefix in ANSWER_SECTIONS:
+        answers = session_answers(prefix)
+        st.session_state[f"{prefix}_answers"] = answers
+        update_section_scores(prefix, answers)
+    render_summary_actions()
+
+def render_diagnostic_tab():
+    """진단 탭 렌더링 (섹션 · 요약은 DIAG_FRAGMENTS 일 때 각각 독립적으로 재실행)"""
+    render_load_panel()
+    render_info_section()
+    if DIAG_MODE == "browser":
+        render_browser_sections()
+        return
+    for prefix in ANSWER_SECTIONS:
+        ANSWER_SECTION_RENDERERS[prefix]()
+    render_diagnosis_summary()
 
 def render_dashboard_tab():
     """대시보드 탭 렌더링"""
@@ -1058,36 +768,11 @@ def render_dashboard_tab():
     
     # KPI 카드
     total_pct = scores["total_pct"]
-    label, color = get_risk_level(total_pct)
     
-    st.markdown(f"""
-    <div class="gfc-kpi-row">
-      <div class="gfc-kpi">
-        <div class="val" style="color:{color}">{total_pct:.0f}%</div>
-        <div class="lbl">종합 리스크율</div>
-        <div style="font-size:10px;font-weight:700;color:{color};margin-top:2px">{label}</div>
-      </div>
-      <div class="gfc-kpi">
-        <div class="val" style="color:{get_risk_level(scores['km_pct'])[1]}">{scores['km_pct']:.0f}%</div>
-        <div class="lbl">대표자 리스크</div>
-      </div>
-      <div class="gfc-kpi">
-        <div class="val" style="color:{get_risk_level(scores['cr_pct'])[1]}">{scores['cr_pct']:.0f}%</div>
-        <div class="lbl">법인 경영 리스크</div>
-      </div>
-      <div class="gfc-kpi">
-        <div class="val" style="color:{get_risk_level(scores['aw_pct'])[1]}">{scores['aw_pct']:.0f}%</div>
-        <div class="lbl">리스크 인식 부족</div>
-      </div>
-      <div class="gfc-kpi">
-        <div class="val" style="color:{get_risk_level(scores['sc_pct'])[1]}">{scores['sc_pct']:.0f}%</div>
-        <div class="lbl">시나리오 대응 미흡</div>
-      </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("", unsafe_allow_html=True)
-    st.markdown("", unsafe_allow_html=True)
+    with html_section() as html:
+        html.add(kpi_row_html(scores))
+        # 차트 앞 여백 (요소 간격 2개분)
+        html.add('<div style="height:2rem"></div>')
     
     # 차트
     c1, c2 = st.columns([1, 1], gap="medium")
@@ -1097,8 +782,7 @@ def render_dashboard_tab():
             'font-weight:600;letter-spacing:.5px">종합 리스크 게이지</p>',
             unsafe_allow_html=True
         )
-        st.plotly_chart(create_gauge_chart(total_pct), use_container_width=True, 
-                       config={"displayModeBar": False})
+        render_gauge_chart(total_pct)
     
     with c2:
         st.markdown(
@@ -1106,11 +790,7 @@ def render_dashboard_tab():
             'font-weight:600;letter-spacing:.5px">카테고리별 리스크 레이더</p>',
             unsafe_allow_html=True
         )
-        st.plotly_chart(
-            create_radar_chart(scores['km_pct'], scores['cr_pct'], scores['aw_pct'], scores['sc_pct']),
-            use_container_width=True,
-            config={"displayModeBar": False}
-        )
+        render_radar_chart(scores['km_pct'], scores['cr_pct'], scores['aw_pct'], scores['sc_pct'])
         st.markdown(
             '<p style="color:#64748b;font-size:8.5px;text-align:center;margin-top:-8px">'
             '💡 모든 지표는 점수가 낮을수록 안전합니다</p>',
@@ -1122,67 +802,110 @@ def render_dashboard_tab():
         'letter-spacing:.5px">카테고리별 리스크율 비교</p>',
         unsafe_allow_html=True
     )
-    st.plotly_chart(
-        create_bar_chart(scores['km_pct'], scores['cr_pct'], scores['aw_pct'], scores['sc_pct']),
-        use_container_width=True,
-        config={"displayModeBar": False}
-    )
-    st.markdown(
-        '<div style="display:flex;gap:12px;justify-content:center;margin-top:-4px;font-size:8.5px;color:#64748b">'
-        '<span>🟢 0-20% 양호</span>'
-        '<span>🟡 21-45% 주의</span>'
-        '<span>🟠 46-70% 경계</span>'
-        '<span>🔴 71-100% 위험</span>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    # 우선 대응 항목
-    st.markdown(
-        '<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">'
-        '🔥 우선 대응 항목 <span style="color:#64748b;font-size:9px;font-weight:500">'
-        '(리스크율 > 0 인 항목 중 가중치 높은 5건)</span></p>',
-        unsafe_allow_html=True
-    )
-    
-    priority_items = get_priority_items(scores["all_items"])
-    
-    if not priority_items:
-        st.markdown('<div class="gfc-empty">모든 항목 양호 🎉</div>', unsafe_allow_html=True)
-    else:
-        for i, item in enumerate(priority_items, 1):
-            render_priority_item(item, i)
-    
-    # 추천 솔루션
-    st.markdown(
-        '<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">'
-        '💎 추천 솔루션 <span style="color:#64748b;font-size:9px;font-weight:500">'
-        '(리스크 유형별 대응 제품)</span></p>',
-        unsafe_allow_html=True
+    render_bar_chart(scores['km_pct'], scores['cr_pct'], scores['aw_pct'], scores['sc_pct'])
+    
+    priority_items, recommended_solutions = diagnosis_recommendations(scores)
+    
+    # 범례 · 우선 대응 항목 · 추천 솔루션 (목록 전체를 요소 하나로)
+    with html_section() as html:
+        html.add(
+            '<div style="display:flex;gap:12px;justify-content:center;margin-top:-4px;font-size:8.5px;color:#64748b">'
+            '<span>🟢 0-20% 양호</span>'
+            '<span>🟡 21-45% 주의</span>'
+            '<span>🟠 46-70% 경계</span>'
+            '<span>🔴 71-100% 위험</span>'
+            '</div>'
+        )
+        html.add(
+            '<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">'
+            '🔥 우선 대응 항목 <span style="color:#64748b;font-size:9px;font-weight:500">'
+            '(리스크율 > 0 인 항목 중 가중치 높은 5건)</span></p>'
+        )
+        html.add(priority_list_html(priority_items))
+        
+        html.add(
+            '<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">'
+            '💎 추천 솔루션 <span style="color:#64748b;font-size:9px;font-weight:500">'
+            '(리스크 유형별 대응 제품)</span></p>'
+        )
+        html.add(solution_list_html(recommended_solutions))
+
+def distribution_html(label: str, histogram: List[int], mean: float) -> str:
+    """리스크율 분포 HTML (10% 구간 막대)"""
+    peak = max(histogram) or 1
+    bars = "".join(
+        f'<div title="{i * 10}~{i * 10 + 10}% · {count:,}건" style="flex:1;height:{count / peak * 100:.0f}%;'
+        f'min-height:1px;background:{get_risk_level(i * 10 + 5)[1]};border-radius:2px 2px 0 0"></div>'
+        for i, count in enumerate(histogram)
     )
-    
-    recommended_solutions = get_recommended_solutions(scores["all_items"])
-    
-    if not recommended_solutions:
-        st.markdown(
-            '<div class="gfc-empty">현재 추천 솔루션 없음 — 모든 항목 양호 🎉</div>',
-            unsafe_allow_html=True
+    return f"""
+    <div style="background:#111d2e;border:1px solid #1e3a5f;border-radius:8px;padding:8px 12px;margin-bottom:8px">
+      <div style="display:flex;justify-content:space-between;font-size:10.5px;color:#cbd5e1;margin-bottom:4px">
+        <span style="font-weight:700">{label}</span>
+        <span style="color:{get_risk_level(mean)[1]}">평균 {mean:.1f}%</span>
+      </div>
+      <div style="display:flex;align-items:flex-end;gap:3px;height:48px">{bars}</div>
+      <div style="display:flex;justify-content:space-between;font-size:8px;color:#64748b;margin-top:2px">
+        <span>0%</span><span>50%</span><span>100%</span>
+      </div>
+    </div>
+    """
+
+def render_portfolio_tab():
+    """포트폴리오 탭 렌더링 (저장된 전체 진단 집계 큐브 조회)"""
+    store = get_store()
+    labels = {"all": "전체"}
+    labels.update({field: label for field, label, _ in PORTFOLIO_DIMENSIONS})
+    c1, c2 = st.columns(2)
+    dimension = c1.selectbox("구분 기준", list(labels), format_func=labels.get, key="pf_dim")
+    value = ""
+    if dimension != "all":
+        counts = store.portfolio_values(dimension)
+        options = next(options for field, _, options in PORTFOLIO_DIMENSIONS if field == dimension)
+        # 저장값 순서를 선택지 순서에 맞춤 (임직원 수는 '명' 을 제거해 저장됨)
+        values = [v for v in (_stored_value(option, dimension) for option in options[1:]) if v in counts]
+        values += sorted(v for v in counts if v not in values)
+        if not values:
+            st.markdown('<div class="gfc-empty">해당 구분으로 저장된 진단이 없습니다</div>', unsafe_allow_html=True)
+            return
+        value = c2.selectbox("구분 값", values, format_func=lambda v: f"{v} ({counts[v]:,}건)", key="pf_val")
+
+    portfolio = store.portfolio(dimension, value)
+    if not portfolio["count"]:
+        st.markdown('<div class="gfc-empty">저장된 진단이 없습니다 — 진단 탭에서 저장하세요</div>',
+                    unsafe_allow_html=True)
+        return
+
+    with html_section() as html:
+        html.add(
+            f'<p style="color:#fff;font-size:12px;font-weight:700;margin:8px 0 6px">'
+            f'📈 리스크율 분포 <span style="color:#64748b;font-size:9px;font-weight:500">'
+            f'({portfolio["count"]:,}건 기준)</span></p>'
         )
-    else:
-        for solution in recommended_solutions:
-            render_solution_card(solution)
-    
-    # 세션에 저장
-    st.session_state.update({
-        "priority": priority_items,
-        "sol_shown": recommended_solutions
-    })
+        for metric, label in PORTFOLIO_METRICS:
+            stats = portfolio["metrics"][metric]
+            html.add(distribution_html(label, stats["histogram"], stats["mean"]))
+
+        html.add(
+            '<p style="color:#fff;font-size:12px;font-weight:700;margin:16px 0 6px">'
+            '🔥 자주 나온 우선 대응 항목</p>'
+        )
+        if not portfolio["priority"]:
+            html.add('<div class="gfc-empty">우선 대응 항목 없음 🎉</div>')
+        for rank, (item, count) in enumerate(portfolio["priority"], 1):
+            share = count / portfolio["count"] * 100
+            html.add(f"""
+            <div class="gfc-pri">
+              <span class="rk" style="color:#60a5fa">#{rank}</span>
+              <div class="info"><div class="txt">{item}</div></div>
+              <span class="wtag" style="background:#475569">{count:,}건 · {share:.0f}%</span>
+            </div>
+            """)
 
 def render_consultant_tab():
-    """AI 컨설턴트 탭 렌더링"""
+    """AI 컨설턴트 탭 렌더링 (문구 · 카드는 gfc_core.report 와 공용)"""
     scores = st.session_state.get("scores", {})
     info = st.session_state.get("info", {})
-    priority_items = st.session_state.get("priority", [])
     
     if not scores:
         st.markdown(
@@ -1192,171 +915,18 @@ def render_consultant_tab():
         )
         return
     
-    total_pct = scores["total_pct"]
-    label, color = get_risk_level(total_pct)
-    company = info.get("company", "○○(주)") or "○○(주)"
-    industry = info.get("industry", "") or "미입력"
-    employees = info.get("employees", "") or "?"
-    revenue = info.get("revenue", "") or "미입력"
+    priority_items, _ = diagnosis_recommendations(scores)
     
     # 헤더
-    st.markdown('''
-    <div style="font-family: 'Noto Sans KR'; font-size: 26px; font-weight: 700; 
-         color: #00d4aa; margin-bottom: 8px;">
-        🤝 AI 컨설턴트 Ken의 종합 분석
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # 프로필
-    st.markdown(f'''
-    <div style="background: #111d2e; border: 1px solid #1e3a5f; border-radius: 10px; 
-         padding: 18px; margin-bottom: 16px;">
-        <div style="display: flex; align-items: center; gap: 16px;">
-            <div style="flex-shrink: 0;">
-                <div style="width: 80px; height: 80px; 
-                     background: linear-gradient(135deg, #00d4aa, #00b894); 
-                     border-radius: 50%; display: flex; align-items: center; 
-                     justify-content: center; font-size: 36px; color: #fff; 
-                     border: 3px solid #00d4aa; 
-                     box-shadow: 0 4px 12px rgba(0,212,170,0.3);">
-                    👨‍💼
-                </div>
-            </div>
-            <div style="flex: 1;">
-                <div style="font-family: 'Noto Sans KR'; font-size: 16px; font-weight: 700; 
-                     color: #00d4aa; margin-bottom: 8px;">
-                    👋 안녕하세요, GFC 컨설턴트 Ken입니다
-                </div>
-                <div style="font-size: 12px; color: #94a3b8; line-height: 1.7; margin-bottom: 10px;">
-                    20년간 한국-중남미 협력 프로젝트를 수행하며 <b>58개 사이트</b>의 
-                    디지털 전환(DX) 전략을 수립한 경험을 바탕으로, 귀사의 
-                    <b>종합 리스크 진단 결과</b>를 데이터 기반으로 상세히 분석해 드리겠습니다.
-                </div>
-                <div style="font-size:13px; color:#4a6a84;">
-                    📊 현재 분석 대상: <b style="color:#e0e6ed;">{company}</b> | 
-                    {industry} · 종업원 {employees}명 · 연매출 {revenue}
-                </div>
-            </div>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # 종합 진단
-    st.markdown(f'''
-    <div style="background: linear-gradient(135deg, #141e2b, #1a2736); padding: 18px; 
-         border-radius: 10px; border-left: 4px solid {color}; margin-bottom: 16px;">
-        <div style="font-size: 15px; font-weight: 700; color: {color}; margin-bottom: 10px;">
-            📋 종합 진단 결과
-        </div>
-        <div style="font-size: 13px; color: #cbd5e1; line-height: 1.8;">
-            귀사의 <b>종합 리스크율은 {total_pct:.0f}%</b>로 
-            <b style="color: {color};">{label}</b> 수준입니다.<br><br>
-            4가지 핵심 리스크 카테고리를 가중평균하여 산출한 결과이며,<br>
-            대표자 리스크({scores["km_pct"]:.0f}%), 법인 경영 리스크({scores["cr_pct"]:.0f}%), 
-            리스크 인식 부족({scores["aw_pct"]:.0f}%), 시나리오 대응 미흡({scores["sc_pct"]:.0f}%)을 반영했습니다.
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # 우선 대응 항목
-    st.markdown(
-        '<div style="font-size: 14px; font-weight: 700; color: #fff; margin: 16px 0 8px;">'
-        '🔥 우선 대응 항목</div>',
-        unsafe_allow_html=True
-    )
-    
-    if not priority_items:
-        st.markdown('<div class="gfc-empty">모든 항목 양호 🎉</div>', unsafe_allow_html=True)
-    else:
-        for i, item in enumerate(priority_items[:5], 1):
-            render_priority_item(item, i)
-    
-    # Ken의 제안
-    st.markdown(
-        '<div style="font-size: 14px; font-weight: 700; color: #fff; margin: 20px 0 8px;">'
-        '🎯 Ken의 종합 컨설팅 제안</div>',
-        unsafe_allow_html=True
-    )
+    st.markdown(CONSULTANT_HEADER_HTML, unsafe_allow_html=True)
     
-    # 단기/중기/장기 제안
-    proposals = [
-        ("⏱️ 1. 단기 (3개월 이내)", "#00d4aa", 
-         "• 키맨 보험 가입으로 대표자 유고 리스크 대비<br>"
-         "• 기업재해 보장 상품으로 종업원 안전망 구축<br>"
-         "• 퇴직연금 제도 점검 및 최적화"),
-        ("📅 2. 중기 (6~12개월)", "#f5a623",
-         "• 가업승계 시뮬레이션 (증여 vs 상속 세금 비교)<br>"
-         "• 법인세 절세 전략 수립 (삼성생명 세무사 협업)<br>"
-         "• 정기 재무 건강검진 체계 구축"),
-        ("🎯 3. 장기 (1~3년)", "#a29bfe",
-         "• 후계자 육성 프로그램 및 지분 이전 계획<br>"
-         "• 가족신탁, 재산분할 등 고급 절세 전략<br>"
-         "• 삼성패밀리오피스 연계한 자산관리 (10억 이상 자산가 대상)"),
-    ]
+    # 프로필 · 종합 진단 · 우선 대응 항목 · 제안 제목
+    with html_section() as html:
+        html.add(consultant_profile_html(info))
+        html.add(consultant_analysis_html(scores, priority_items))
     
-    bg_gradients = {
-        "#00d4aa": "linear-gradient(135deg, #0d2818, #1a3a2e)",
-        "#f5a623": "linear-gradient(135deg, #2a1f0d, #3a2f1d)",
-        "#a29bfe": "linear-gradient(135deg, #1a1a2e, #2a2a4e)",
-    }
-    
-    for title, color_code, content in proposals:
-        st.markdown(f'''
-        <div style="background: {bg_gradients[color_code]}; padding: 14px; border-radius: 8px; 
-             border-left: 4px solid {color_code}; margin-bottom: 10px;">
-            <div style="font-size: 13px; font-weight: 700; color: {color_code}; 
-                 margin-bottom: 8px;">{title}</div>
-            <div style="font-size: 12px; color: #c8d8e4; line-height: 1.7;">{content}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-    
-    # 차별화 포인트
-    st.markdown('''
-    <div style="background: rgba(0, 212, 170, 0.08); padding: 16px; border-radius: 8px; 
-         border: 2px solid #00d4aa; margin-top: 16px;">
-        <div style="font-size: 14px; font-weight: 700; color: #00d4aa; margin-bottom: 10px;">
-            💎 차별화 포인트
-        </div>
-        <div style="font-size: 13px; color: #cbd5e1; line-height: 1.8;">
-            제조 기업의 지속 가능한 성장과 가치 창출 프로세스를 이해하고, 그 가치의 근원을 데이터로 분석하며
-            <b style="color: #00d4aa;">경영 리스크를 최소화</b>하는 실전 컨설팅을 수행해 왔습니다.<br><br> 
-            기업이 땀 흘려 만든 가치가 세금과 리스크로 훼손되지 않도록, 삼성생명의 전문가 네트워크(세무사·회계사·법무사)와 협업하여    
-            귀사의 <b>영속적 경영과 안정적 가업승계</b>를 설계해 드리겠습니다.
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # 다음 단계
-    st.markdown('''
-    <div style="background: #141e2b; padding: 16px; border-radius: 8px; 
-         border: 1px solid #1e3a5f; margin-top: 16px;">
-        <div style="font-size: 14px; font-weight: 700; color: #f5a623; margin-bottom: 10px;">
-            📞 다음 단계 — 무료 심층 상담 신청
-        </div>
-        <div style="font-size: 12px; color: #c8d8e4; line-height: 1.7; margin-bottom: 12px;">
-            위 분석 결과를 바탕으로 <b style="color: #00d4aa;">귀사 맞춤형 절세 시뮬레이션</b>을 
-            준비해 드리겠습니다.
-        </div>
-        <div style="background: rgba(245, 166, 35, 0.05); padding: 12px; border-radius: 6px; 
-             border-left: 3px solid #f5a623; margin-bottom: 12px;">
-            <div style="font-size: 11px; font-weight: 700; color: #f5a623; margin-bottom: 6px;">
-                📋 상담 신청 시 제공되는 자료
-            </div>
-            <div style="font-size: 11px; color: #c8d8e4; line-height: 1.6;">
-                • 가업승계 시나리오별 세금 비교표 (증여 vs 상속)<br>
-                • 법인보험 가입 시 절세 효과 계산서<br>
-                • 퇴직연금 최적화 방안<br>
-                • ROI 예측 대시보드 (5년/10년 단위)
-            </div>
-        </div>
-        <div style="background: rgba(0, 212, 170, 0.08); padding: 10px; border-radius: 6px; 
-             border: 1px solid #00d4aa; text-align: center;">
-            <span style="font-size: 12px; color: #00d4aa; font-weight: 700;">
-                📧 io7hub@naver.com | ☎ 010-2610-5194
-            </span>
-        </div>
-    </div>
-    ''', unsafe_allow_html=True)
+    # 단기/중기/장기 제안 · 차별화 포인트 · 다음 단계
+    st.markdown(CONSULTANT_CLOSING_HTML, unsafe_allow_html=True)
     
     st.markdown(
         f'<div style="text-align: right; color: #64748b; font-size: 10px; margin-top: 16px;">'
@@ -1364,12 +934,19 @@ def render_consultant_tab():
         unsafe_allow_html=True
     )
 
+SCRIPT_TITLE_HTML = compact_html('''
+    <div style="display:flex;align-items:center;justify-content:space-between;margin-bottom:10px">
+      <div style="display:flex;align-items:center;gap:7px">
+        <span style="font-size:17px">📝</span>
+        <span style="font-size:15px;font-weight:700;color:#fff">GFC 상담 스크립트</span>
+      </div>
+    </div>
+    ''')
+
 def render_script_tab():
     """스크립트 탭 렌더링"""
     scores = st.session_state.get("scores", {})
     info = st.session_state.get("info", {})
-    priority_items = st.session_state.get("priority", [])
-    solutions = st.session_state.get("sol_shown", [])
     
     if not scores:
         st.markdown(
@@ -1379,128 +956,53 @@ def render_script_tab():
         )
         return
     
-    st.markdown('''
-    <div style="display:flex;align-items:center;justify-content:space-between;margin-bottom:10px">
-      <div style="display:flex;align-items:center;gap:7px">
-        <span style="font-size:17px">📝</span>
-        <span style="font-size:15px;font-weight:700;color:#fff">GFC 상담 스크립트</span>
-      </div>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # 스크립트 생성
-    script_text = generate_consultation_script(info, scores, priority_items, solutions)
-    total_pct = scores["total_pct"]
-    label, color = get_risk_level(total_pct)
-    
-    company = info.get("company", "○○(주)") or "○○(주)"
-    industry = info.get("industry", "") or "미입력"
-    employees = info.get("employees", "") or "?"
-    ceo = info.get("ceo", "대표자") or "대표자"
-    est = info.get("est", "") or "미입력"
-    
-    # 스크립트 헤더
-    st.markdown(f"""
-    <div class="gfc-script">
-      <div class="sc-hdr">
-        <h2>GFC 상담 스크립트</h2>
-        <p>삼성생명 기업재무컨설팅 · 진단 기반 자동생성</p>
-      </div>
-      <div class="sc-meta">
-        <span><strong>기업명:</strong> {company}</span>
-        <span><strong>업종:</strong> {industry}</span>
-        <span><strong>종업원 수:</strong> {employees}명</span>
-        <span><strong>대표자:</strong> {ceo}</span>
-        <span><strong>설립 연차:</strong> {est}</span>
-        <span><strong>진단 충족율:</strong> 
-          <span style="color:{color};font-weight:700">{total_pct:.0f}% ({label})</span>
-        </span>
-      </div>
-
-      <div class="sc-sec">1. 도입 인사</div>
-      <div class="sc-intro">
-        안녕하세요, {ceo} 대표님. 삼성생명 GFC 기업재무컨설팅 
-        <strong>{company.replace('(주)','').replace('(유)','').replace('㈜','')}</strong> 
-        담당 컨설턴트 Ken입니다.<br><br>
-        오늘 우리회사의 법인 리스크 사전 진단을 완료했는데, 종합 리스크율이 
-        <strong style="color:{color}">{total_pct:.0f}%({label})</strong> 수준으로 나왔습니다.<br>
-        특히 <strong>'{priority_items[0]['section'] if priority_items else '주요 영역'}'</strong> 
-        부분에서 즉각적인 대비가 필요한 사항들이 도출되었습니다.<br><br>
-        오늘 주요 내용을 안내드리고, 우리기업에 맞는 종합 컨설팅 제안까지 함께 검토하겠습니다.
-      </div>
-    """, unsafe_allow_html=True)
-    
-    # 리스크 블록
-    grouped = OrderedDict()
-    for item in priority_items:
-        grouped.setdefault(item["section"], []).append(item)
-    
-    if grouped:
-        st.markdown('<div class="sc-sec" style="margin-top:14px">2. 리스크별 상세 상담</div>', 
-                   unsafe_allow_html=True)
-        
-        for section, items in grouped.items():
-            st.markdown(
-                f'<div style="font-size:11px;font-weight:700;color:#fff;margin:10px 0 5px">'
-                f'▸ {section} '
-                f'<span style="background:#475569;color:#fff;font-size:8px;font-weight:700;'
-                f'border-radius:3px;padding:1px 5px">{len(items)}건</span></div>',
-                unsafe_allow_html=True
-            )
-            
-            for item in items:
-                item_color = WEIGHT_COLORS.get(item["w"], "#64748b")
-                response = "예" if item["score"] == 1.0 else "일부 해당"
-                
-                st.markdown(f"""
-                <div class="sc-block" style="border-color:{item_color}">
-                  <div class="bq">📌 진단 항목 (가중치 {item['w']}) — {item['section']}</div>
-                  <div class="bt">
-                    <strong>질문:</strong> {item['text']}<br>
-                    <strong>응답:</strong> {response}
-                  </div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    # 솔루션
-    if solutions:
-        st.markdown('<div class="sc-sec" style="margin-top:14px">3. 추천 솔루션 제안</div>', 
-                   unsafe_allow_html=True)
-        
-        for solution in solutions:
-            st.markdown(f"""
-            <div style="display:flex;gap:7px;align-items:flex-start;margin-bottom:5px">
-              <span style="background:{solution['color']};color:#fff;font-size:8px;
-                   font-weight:700;border-radius:3px;padding:2px 6px;white-space:nowrap;
-                   flex-shrink:0">{solution['icon']} {solution['name']}</span>
-              <span style="font-size:10.5px;color:#cbd5e1;line-height:1.6">
-                {solution['desc']}
-              </span>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # 마무리
-    st.markdown("""
-      <div class="sc-sec" style="margin-top:14px">4. 마무리 및 다음 단계</div>
-      <div class="sc-close">
-        오늘 진단 결과를 기반으로, 우리기업에 맞는 
-        <strong>종합 법인 재무 컨설팅 제안서</strong>를 별도로 작성하여 드리겠습니다.<br><br>
-        세무사, 회계사, 법무사 등 전문가와 협업하여 <strong>최적의 구조</strong>를 설계드리고,
-        삼성생명 GFC의 교육과 지원 체계와 함께 단계별 실행 계획까지 제안드리겠습니다.<br><br>
-        다음 단계로 <strong>상세 제안서 검토 일정</strong>을 잡아드리면 되겠습니다. 
-        언제 가능하신가요?
-      </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # 생성 시각은 화면마다 새로 찍고(분 단위), 시각과 무관한 상담 자료 본문만 응답 해시 기준으로 재사용
+    generated_at = datetime.now().replace(second=0, microsecond=0)
+    stamp = generated_at.strftime("%Y%m%d_%H%M")
+    priority_items, solutions = diagnosis_recommendations(scores)
+    report_body = view_result("report", lambda: report_body_html(info, scores, priority_items, solutions))
+    # 제목 + 스크립트 문서 (gfc_core.report.script_html — 상담 자료 HTML 과 같은 문서)
+    st.markdown(SCRIPT_TITLE_HTML + script_html(info, scores, priority_items, solutions), unsafe_allow_html=True)
     
     # 다운로드 버튼
     st.download_button(
         label="📥  스크립트 다운로드 (.txt)",
-        data=script_text.encode("utf-8"),
-        file_name=f"GFC_스크립트_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+        data=generate_consultation_script(info, scores, priority_items, solutions,
+                                          generated_at=generated_at).encode("utf-8"),
+        file_name=f"GFC_스크립트_{stamp}.txt",
         mime="text/plain",
         help="스크립트를 텍스트 파일로 다운로드합니다."
     )
+    st.download_button(
+        label="📥  상담 자료 다운로드 (.html)",
+        data=report_document(info, report_body, generated_at).encode("utf-8"),
+        file_name=f"GFC_상담자료_{stamp}.html",
+        mime="text/html",
+        help="대시보드 · AI 컨설턴트 분석 · 스크립트를 하나의 HTML 파일로 다운로드합니다."
+    )
+    
+    # 문서 내보내기 — 버튼을 눌렀을 때만 생성하고, 같은 응답 · 형식이면 만든 문서를 다시 내려받기로 제공
+    formats = [fmt for fmt in EXPORT_FORMATS if fmt != "pdf" or PDF_EXPORT_AVAILABLE]
+    c1, c2 = st.columns([1, 2])
+    fmt = c1.selectbox("문서 형식", formats, format_func=EXPORT_LABELS.get, key="export_fmt",
+                       label_visibility="collapsed")
+    document_key = (st.session_state.get("answer_hash"), fmt)
+    document = st.session_state.get("export_document")
+    slot = c2.empty()  # 만들기 버튼 → 다운로드 버튼을 같은 자리에서 교체
+    if document is None or document[0] != document_key:
+        document = None
+        if slot.button(f"📄  스크립트 문서 만들기 ({EXPORT_LABELS[fmt]})", key="export_build",
+                     use_container_width=True):
+            model = build_script_model(info, scores, priority_items, solutions, generated_at=generated_at)
+            document = st.session_state["export_document"] = (document_key, stamp, export_script(model, fmt))
+    if document is not None:
+        slot.download_button(
+            label=f"📄  스크립트 문서 다운로드 ({EXPORT_LABELS[fmt]})",
+            data=document[2],
+            file_name=f"GFC_스크립트_{document[1]}.{fmt}",
+            mime=MIME_TYPES[fmt],
+            use_container_width=True,
+        )
 
 # ═══════════════════════════════════════════════════════════
 # MAIN APPLICATION
@@ -1522,26 +1024,34 @@ def main():
     # 헤더
     render_header()
     
-    # 탭 생성
-    tab_diag, tab_dash, tab_consult, tab_script = st.tabs([
-        "📋  진단",
-        "📊  대시보드",
-        "🤝  AI 컨설턴트",
-        "📝  스크립트"
-    ])
-    
-    # 각 탭 렌더링
-    with tab_diag:
-        render_diagnostic_tab()
-    
-    with tab_dash:
-        render_dashboard_tab()
+    renderers = {
+        "diag": render_diagnostic_tab,
+        "dash": render_dashboard_tab,
+        "portfolio": render_portfolio_tab,
+        "consult": render_consultant_tab,
+        "script": render_script_tab,
+    }
+    labels = [label for _, label in VIEWS]
     
-    with tab_consult:
-        render_consultant_tab()
+    # 탭 모드: 모든 탭을 매 실행마다 렌더링
+    if NAV_MODE == "tabs":
+        for (view, _), tab in zip(VIEWS, st.tabs(labels)):
+            with tab:
+                renderers[view]()
+        return
     
-    with tab_script:
-        render_script_tab()
+    # 지연 모드: 선택된 화면만 실행, 나머지 화면 결과는 처음 볼 때 응답 해시 기준으로 계산
+    if LAZY_TABS_AVAILABLE:
+        tabs = st.tabs(labels, key="nav_view", on_change="rerun")
+        selected = next(i for i, tab in enumerate(tabs) if tab.open)
+        container = tabs[selected]
+    else:
+        label = st.radio("화면", labels, key="nav_view", horizontal=True, label_visibility="collapsed")
+        selected = labels.index(label)
+        container = st.container()
+    keep_widget_state([view for i, (view, _) in enumerate(VIEWS) if i != selected])
+    with container:
+        renderers[VIEWS[selected][0]]()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
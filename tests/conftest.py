@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 앱 모듈(ssgfc.py 등) 과 gfc_core 를 저장소 루트에서 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
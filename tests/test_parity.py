@@ -0,0 +1,252 @@
+"""
+앱별 점수 일치 검증 (parity check)
+
+gfc_core 도입 이전 각 앱에 있던 점수 계산 · 우선 대응 항목 · 솔루션 매칭 로직을 그대로 보존한
+참조 구현과, 현재 각 앱이 노출하는 함수의 결과를 비교합니다.
+
+실행 (저장소 루트에서): python -m pytest tests   (표본 수: GFC_PARITY_SAMPLES, 기본 20000)
+"""
+
+import importlib
+import json
+import os
+import random
+import shutil
+import subprocess
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+from gfc_core.browser import SCORING_JS, client_schema
+from gfc_core.incremental import IncrementalScorer
+from gfc_core.questions import (
+    AWARENESS_QUESTIONS,
+    CORPORATE_QUESTIONS,
+    KEYMAN_QUESTIONS,
+    LEGACY_AWARENESS_QUESTIONS,
+    RESPONSE_OPTIONS,
+    RESPONSE_SCORES,
+    SCENARIO_QUESTIONS,
+    SOLUTIONS,
+)
+from gfc_core.schema import LEGACY_POOLED_SCHEMA, SCHEMA
+from gfc_core.scoring import get_risk_level, score_codes
+
+SAMPLES = int(os.environ.get("GFC_PARITY_SAMPLES", "20000"))
+SEED = 0
+
+# ═══════════════════════════════════════════════════════════
+# REFERENCE IMPLEMENTATIONS (기존 앱 로직 원본)
+# ═══════════════════════════════════════════════════════════
+
+def _reference_section(questions: Sequence[Tuple], answers: List[str], section: str,
+                       custom: bool) -> Tuple[float, float, int, List[Dict]]:
+    wt, wd = 0, 0.0
+    items = []
+    for i, q in enumerate(questions):
+        if custom:
+            txt, _, smap, w = q
+        else:
+            (txt, w), smap = q, RESPONSE_SCORES
+        wt += w
+        score = smap.get(answers[i], 0.0)
+        wd += score * w
+        items.append({"text": txt, "w": w, "score": score, "section": section})
+    pct = (wd / wt * 100) if wt else 0
+    return pct, wd, wt, items
+
+def reference_scores(km_answers: List[str], cr_answers: List[str], aw_answers: List[str],
+                     sc_answers: List[str], awareness: Sequence[Tuple], pooled: bool) -> Dict:
+    """ssgfc.py / chart.py (섹션 가중평균) 및 GCFchart.py / gfc_diagnosis.py (합산) 원본 계산"""
+    km_pct, km_wd, km_wt, km_items = _reference_section(KEYMAN_QUESTIONS, km_answers, "대표자 리스크", False)
+    cr_pct, cr_wd, cr_wt, cr_items = _reference_section(CORPORATE_QUESTIONS, cr_answers, "법인 경영 리스크", False)
+    aw_pct, aw_wd, aw_wt, aw_items = _reference_section(awareness, aw_answers, "리스크 인식", True)
+    sc_pct, sc_wd, sc_wt, sc_items = _reference_section(SCENARIO_QUESTIONS, sc_answers, "시나리오", True)
+
+    total_wt = km_wt + cr_wt + aw_wt + sc_wt
+    if pooled:
+        total_wd = km_wd + cr_wd + aw_wd + sc_wd
+        total_pct = (total_wd / total_wt * 100) if total_wt else 0
+    else:
+        total_pct = (km_pct * km_wt + cr_pct * cr_wt + aw_pct * aw_wt + sc_pct * sc_wt) / total_wt if total_wt > 0 else 0
+
+    return {
+        "km_pct": km_pct, "cr_pct": cr_pct, "aw_pct": aw_pct, "sc_pct": sc_pct,
+        "total_pct": total_pct,
+        "km_wt": km_wt, "cr_wt": cr_wt, "aw_wt": aw_wt, "sc_wt": sc_wt,
+        "total_wt": total_wt,
+        "all_items": km_items + cr_items + aw_items + sc_items,
+    }
+
+def reference_priority(all_items: List[Dict]) -> List[Dict]:
+    return sorted([it for it in all_items if it["score"] > 0], key=lambda x: (-x["score"], -x["w"]))[:5]
+
+def reference_solutions(all_items: List[Dict]) -> List[Dict]:
+    has_km = any(it["score"] > 0 and it["section"] == "대표자 리스크" for it in all_items)
+    has_cr = any(it["score"] > 0 and it["section"] == "법인 경영 리스크" for it in all_items)
+    has_any = any(it["score"] > 0 for it in all_items)
+    sol_shown = []
+    for s in SOLUTIONS:
+        if s["trigger"] == "keyman" and has_km:
+            sol_shown.append(s)
+        elif s["trigger"] == "corp" and has_cr:
+            sol_shown.append(s)
+        elif s["trigger"] == "all" and has_any:
+            sol_shown.append(s)
+    return sol_shown
+
+def reference_fixed_weight_total(scores: Dict[str, float]) -> float:
+    """GFCchart.py 샘플 대시보드 원본 계산"""
+    weights = {"대표자 리스크": 0.35, "법인 경영 리스크": 0.30,
+               "리스크 인식": 0.20, "시나리오": 0.15}
+    total = sum(scores[k] * weights.get(k, 0.25) for k in scores)
+    return round(total, 1)
+
+# ═══════════════════════════════════════════════════════════
+# CASE GENERATION
+# ═══════════════════════════════════════════════════════════
+
+def _answer_cases(awareness: Sequence[Tuple], samples: int, seed: int):
+    """모든 섹션 동일 선택지 조합 + 무작위 응답 (미정의 응답 포함)"""
+    rng = random.Random(seed)
+    km_opts = RESPONSE_OPTIONS + ["미응답"]
+    for j in range(3):
+        yield ([RESPONSE_OPTIONS[j]] * len(KEYMAN_QUESTIONS),
+               [RESPONSE_OPTIONS[j]] * len(CORPORATE_QUESTIONS),
+               [q[1][min(j, len(q[1]) - 1)] for q in awareness],
+               [q[1][j] for q in SCENARIO_QUESTIONS])
+    for _ in range(samples):
+        yield ([rng.choice(km_opts) for _ in KEYMAN_QUESTIONS],
+               [rng.choice(km_opts) for _ in CORPORATE_QUESTIONS],
+               [rng.choice(q[1]) for q in awareness],
+               [rng.choice(q[1]) for q in SCENARIO_QUESTIONS])
+
+# ═══════════════════════════════════════════════════════════
+# CHECKS
+# ═══════════════════════════════════════════════════════════
+
+# 앱 모듈명 → (점수 함수명, 호출부에서 지정하는 스키마 이름, 인식 문항, 합산 여부)
+SCORING_APPS = {
+    "ssgfc": ("calculate_all_scores", None, AWARENESS_QUESTIONS, False),
+    "chart": ("calculate_all_scores", "LEGACY_SCHEMA", LEGACY_AWARENESS_QUESTIONS, False),
+    "GCFchart": ("calc_scores", None, LEGACY_AWARENESS_QUESTIONS, True),
+    "gfc_diagnosis": ("calc_scores", None, LEGACY_AWARENESS_QUESTIONS, True),
+}
+
+def _app_scorer(module, func_name: str, schema_name: str) -> Callable:
+    scorer = getattr(module, func_name)
+    if schema_name is None:
+        return scorer
+    schema = getattr(module, schema_name)
+    return lambda *answers: scorer(*answers, schema=schema)
+
+def check_scoring_app(module_name: str, samples: int, seed: int) -> int:
+    """앱 점수 · 우선 대응 항목 · 솔루션이 참조 구현과 일치하는지 확인, 불일치 건수 반환"""
+    func_name, schema_name, awareness, pooled = SCORING_APPS[module_name]
+    module = importlib.import_module(module_name)
+    scorer = _app_scorer(module, func_name, schema_name)
+
+    mismatches = 0
+    for answers in _answer_cases(awareness, samples, seed):
+        expected = reference_scores(*answers, awareness=awareness, pooled=pooled)
+        actual = scorer(*answers)
+        if actual != expected:
+            mismatches += 1
+            continue
+        if module.get_priority_items(actual["all_items"]) != reference_priority(expected["all_items"]):
+            mismatches += 1
+            continue
+        if module.get_recommended_solutions(actual["all_items"]) != reference_solutions(expected["all_items"]):
+            mismatches += 1
+    return mismatches
+
+def check_fixed_weight_app(samples: int, seed: int) -> int:
+    """GFCchart.py 고정 비율 종합 리스크율 확인"""
+    module = importlib.import_module("GFCchart")
+    rng = random.Random(seed)
+    cases = [module.SAMPLE_DATA["scores"]]
+    for _ in range(samples):
+        cases.append({name: rng.randint(0, 100) for name in module.SAMPLE_DATA["scores"]})
+    return sum(module.calc_total_risk(c) != reference_fixed_weight_total(c) for c in cases)
+
+def check_incremental(samples: int, seed: int) -> int:
+    """IncrementalScorer 가 응답 1개씩 바뀔 때마다 참조 구현과 일치하는지 확인"""
+    mismatches = 0
+    for schema, awareness, pooled in ((SCHEMA, AWARENESS_QUESTIONS, False),
+                                      (LEGACY_POOLED_SCHEMA, LEGACY_AWARENESS_QUESTIONS, True)):
+        rng = random.Random(seed)
+        scorer = IncrementalScorer(schema)
+        answers = [list(section) for section in next(_answer_cases(awareness, 0, seed))]
+        scorer.update(answers)
+        for _ in range(samples):
+            section = rng.randrange(len(answers))
+            position = rng.randrange(len(answers[section]))
+            index = schema.sections[section].start + position
+            answers[section][position] = rng.choice(schema.options[index] + ("미응답",))
+            scorer.set_answer(index, answers[section][position])
+
+            expected = reference_scores(*answers, awareness=awareness, pooled=pooled)
+            if (scorer.scores() != expected
+                    or scorer.priority_items() != reference_priority(expected["all_items"])
+                    or scorer.recommended_solutions() != reference_solutions(expected["all_items"])):
+                mismatches += 1
+    return mismatches
+
+# scoring.js 를 node 로 실행: stdin {schema, cases, percents} → stdout [[scores, 레벨명, 표기...], ...]
+_NODE_HARNESS = """
+const scoring = require(process.argv[1]);
+let input = "";
+process.stdin.on("data", chunk => { input += chunk; }).on("end", () => {
+  const { schema, cases, percents } = JSON.parse(input);
+  const results = cases.map(codes => {
+    const scores = scoring.scoreCodes(schema, codes);
+    const percentages = Object.keys(scores).sort().map(key => scoring.formatPercent(scores[key]));
+    return [scores, scoring.riskLevel(schema, scores.total_pct).name, percentages];
+  });
+  process.stdout.write(JSON.stringify({ results, percents: percents.map(scoring.formatPercent) }));
+});
+"""
+
+def check_browser(samples: int, seed: int) -> Optional[int]:
+    """브라우저 채점(frontend/scoring.js)이 score_codes · 리스크 레벨 · % 표기와 일치하는지 확인 (node 없으면 None)"""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    mismatches = 0
+    # 정확히 .5 인 값은 Python 형식 지정과 같이 짝수로 반올림되어야 함
+    percents = [n / 2 for n in range(201)] + [n / 3 for n in range(301)]
+    for schema in (SCHEMA, LEGACY_POOLED_SCHEMA):
+        rng = random.Random(seed)
+        cases = [[rng.randrange(-1, len(options)) for options in schema.options] for _ in range(samples)]
+        cases[:0] = [[code] * schema.question_count for code in (-1, 0, 1)]
+        output = subprocess.run([node, "-e", _NODE_HARNESS, SCORING_JS], check=True, capture_output=True,
+                                input=json.dumps({"schema": client_schema(schema), "cases": cases,
+                                                  "percents": percents}).encode("utf-8"))
+        browser = json.loads(output.stdout)
+        for codes, (scores, level, percentages) in zip(cases, browser["results"]):
+            expected = {key: value for key, value in score_codes(codes, schema).items() if key.endswith("_pct")}
+            if (scores != expected or level != get_risk_level(expected["total_pct"])[0]
+                    or percentages != [f"{expected[key]:.0f}" for key in sorted(expected)]):
+                mismatches += 1
+        mismatches += sum(text != f"{value:.0f}" for value, text in zip(percents, browser["percents"]))
+    return mismatches
+
+# ═══════════════════════════════════════════════════════════
+# TESTS
+# ═══════════════════════════════════════════════════════════
+
+@pytest.mark.parametrize("module_name", list(SCORING_APPS))
+def test_scoring_app(module_name):
+    assert check_scoring_app(module_name, SAMPLES, SEED) == 0
+
+def test_fixed_weight_app():
+    assert check_fixed_weight_app(SAMPLES, SEED) == 0
+
+def test_incremental():
+    assert check_incremental(SAMPLES, SEED) == 0
+
+def test_browser():
+    mismatches = check_browser(SAMPLES, SEED)
+    if mismatches is None:
+        pytest.skip("node not found")
+    assert mismatches == 0